@@ -0,0 +1,157 @@
+# aho_corasick.py
+# Búsqueda multi-patrón con un autómata de Aho–Corasick.
+# Una sola pasada sobre el texto encuentra TODOS los patrones y devuelve
+# las mismas listas de posiciones que find_with_kmp / find_with_z.
+
+from array import array
+from typing import Dict, Iterable, List
+import sys
+
+from kmp import (
+    BOOK_PATH, PATTERNS, WHOLE_WORDS_ONLY, CTX_RADIUS, MAX_CONTEXTS, MAX_POS_PRINT,
+    normalize_lower_ascii, load_normalized, filter_whole_word_matches, contexts, pretty_positions,
+)
+
+
+class AhoCorasick:
+    """
+    Autómata de Aho–Corasick con tabla goto/fail compacta.
+
+    - El alfabeto se reduce a los caracteres que aparecen en los patrones
+      (id 1..sigma-1); cualquier otro carácter del texto usa el id 0.
+    - La función goto ya incluye los enlaces de falla (es un DFA completo)
+      y se guarda en un único array('i') plano de tamaño estados * sigma.
+      Cada entrada guarda directamente el desplazamiento de la fila destino
+      (estado * sigma), así la búsqueda no multiplica en el ciclo interno.
+    - out[fila] = ids de patrones que terminan en ese estado (incluye los
+      heredados por la cadena de fallas).
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        seen: Dict[str, int] = {}
+        for p in patterns:
+            if p and p not in seen:       # igual que find_with_kmp: patrón vacío -> sin matches
+                seen[p] = len(self.patterns)
+                self.patterns.append(p)
+
+        alpha: Dict[str, int] = {}
+        for p in self.patterns:
+            for ch in p:
+                if ch not in alpha:
+                    alpha[ch] = len(alpha) + 1
+        sigma = len(alpha) + 1
+        self._alpha = alpha
+        self._sigma = sigma
+
+        # Trie: goto[s * sigma + c] = estado hijo, -1 si no existe
+        goto = array('i', [-1]) * sigma
+        terminal: List[List[int]] = [[]]
+        for pid, p in enumerate(self.patterns):
+            s = 0
+            for ch in p:
+                k = s * sigma + alpha[ch]
+                t = goto[k]
+                if t == -1:
+                    t = len(terminal)
+                    goto[k] = t
+                    goto.extend(array('i', [-1]) * sigma)
+                    terminal.append([])
+                s = t
+            terminal[s].append(pid)
+
+        # BFS: calcula fail y completa las transiciones faltantes
+        n_states = len(terminal)
+        fail = array('i', [0]) * n_states
+        out: List[tuple] = [()] * n_states
+        out[0] = tuple(terminal[0])
+        queue = []
+        for c in range(sigma):
+            t = goto[c]
+            if t == -1:
+                goto[c] = 0
+            else:
+                fail[t] = 0
+                queue.append(t)
+        head = 0
+        while head < len(queue):
+            s = queue[head]
+            head += 1
+            out[s] = tuple(terminal[s]) + out[fail[s]]
+            row = s * sigma
+            frow = fail[s] * sigma
+            for c in range(sigma):
+                t = goto[row + c]
+                if t == -1:
+                    goto[row + c] = goto[frow + c]
+                else:
+                    fail[t] = goto[frow + c]
+                    queue.append(t)
+
+        # Guarda desplazamientos de fila en lugar de ids de estado
+        for k in range(len(goto)):
+            goto[k] *= sigma
+        self._goto = goto
+        self._out: Dict[int, tuple] = {s * sigma: o for s, o in enumerate(out) if o}
+        self.n_states = n_states
+
+    def find_all(self, text: str) -> Dict[str, List[int]]:
+        """
+        Recorre el texto una sola vez.
+        Retorna {patrón: [posiciones de inicio]} en orden creciente,
+        incluyendo coincidencias traslapadas (igual que KMP / Z).
+        """
+        goto = self._goto
+        get = self._alpha.get
+        out_get = self._out.get
+        lens = [len(p) for p in self.patterns]
+        res: List[List[int]] = [[] for _ in self.patterns]
+
+        s = 0
+        for i, ch in enumerate(text):
+            s = goto[s + get(ch, 0)]
+            hits = out_get(s)
+            if hits:
+                for pid in hits:
+                    res[pid].append(i - lens[pid] + 1)
+
+        return dict(zip(self.patterns, res))
+
+
+# Main
+def run() -> None:
+    try:
+        text = load_normalized(BOOK_PATH)
+    except FileNotFoundError:
+        print(f"Error: no se encontró el archivo: {BOOK_PATH}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error leyendo {BOOK_PATH}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    norm = [normalize_lower_ascii(pat) for pat in PATTERNS]
+
+    print("=== Búsqueda con Aho–Corasick (una pasada) ===")
+    print(f"Archivo: {BOOK_PATH}")
+    print(f"Patrones ({len(PATTERNS)}): {PATTERNS}")
+    print(f"Modo: {'palabras completas' if WHOLE_WORDS_ONLY else 'subcadenas'}\n")
+
+    ac = AhoCorasick(norm)
+    found = ac.find_all(text)
+
+    for pat, p in zip(PATTERNS, norm):
+        pos = found.get(p, [])
+        if WHOLE_WORDS_ONLY:
+            pos = filter_whole_word_matches(text, len(p), pos)
+
+        print(f"Patrón: '{pat}'  |  largo={len(p)}")
+        print(f"Total de ocurrencias: {len(pos)}")
+        print(f"Primeras posiciones: {pretty_positions(pos, MAX_POS_PRINT)}")
+
+        for p0, frag in contexts(text, pos, len(p), radius=CTX_RADIUS, max_ctx=MAX_CONTEXTS):
+            print(f"  - pos={p0}: …{frag}…")
+        print("-" * 72)
+
+
+if __name__ == "__main__":
+    run()
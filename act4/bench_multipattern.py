@@ -0,0 +1,83 @@
+# bench_multipattern.py
+# Compara Aho–Corasick (una pasada) contra los ciclos por patrón de
+# kmp.py y funcZ.py sobre todos los .txt en ./books,
+# con 10, 100, 1,000 y 10,000 patrones.
+#
+# Los ciclos KMP / Z son O(n) por patrón en Python puro; arriba de
+# BASELINE_MAX_PATTERNS se miden sólo esos primeros patrones y se
+# extrapola linealmente (se marca con '~').
+
+import random
+import time
+from pathlib import Path
+from typing import List
+
+from kmp import load_normalized, find_with_kmp
+from funcZ import find_with_z
+from aho_corasick import AhoCorasick
+
+BOOKS_DIR = Path(__file__).parent / "books"
+PATTERN_COUNTS = [10, 100, 1_000, 10_000]
+BASELINE_MAX_PATTERNS = 20
+SEED = 42
+
+
+def build_vocabulary(texts: List[str], min_len: int = 3) -> List[str]:
+    # Palabras distintas de todo el corpus, en orden estable
+    vocab = set()
+    for t in texts:
+        for w in "".join(ch if ch.isalnum() else " " for ch in t).split():
+            if len(w) >= min_len:
+                vocab.add(w)
+    return sorted(vocab)
+
+
+def time_loop(finder, patterns: List[str], text: str):
+    t0 = time.perf_counter()
+    res = {p: finder(p, text) for p in patterns}
+    return time.perf_counter() - t0, res
+
+
+def main():
+    txts = sorted(BOOKS_DIR.glob("*.txt"))
+    if not txts:
+        print("No se encontraron .txt en ./books")
+        return
+
+    texts = {p.name: load_normalized(p, errors="ignore") for p in txts}
+    vocab = build_vocabulary(list(texts.values()))
+    rng = random.Random(SEED)
+    rng.shuffle(vocab)
+    print(f"Vocabulario total: {len(vocab):,} palabras distintas\n")
+
+    print(f"{'Libro':<24} {'#pat':>6} {'estados':>8} {'AC (s)':>9} "
+          f"{'KMP (s)':>10} {'Z (s)':>10} {'KMP/AC':>8} {'Z/AC':>8}")
+    print("-" * 92)
+
+    for name, text in texts.items():
+        for count in PATTERN_COUNTS:
+            patterns = vocab[:count]
+
+            t0 = time.perf_counter()
+            ac = AhoCorasick(patterns)
+            found = ac.find_all(text)
+            t_ac = time.perf_counter() - t0
+
+            sample = patterns[:BASELINE_MAX_PATTERNS]
+            t_kmp, res_kmp = time_loop(find_with_kmp, sample, text)
+            t_z, res_z = time_loop(find_with_z, sample, text)
+            for p in sample:
+                assert found[p] == res_kmp[p] == res_z[p], f"Diferencia en '{p}' ({name})"
+
+            approx = "~" if count > len(sample) else " "
+            scale = count / len(sample)
+            t_kmp *= scale
+            t_z *= scale
+            print(f"{name:<24} {count:>6,} {ac.n_states:>8,} {t_ac:>9.3f} "
+                  f"{approx}{t_kmp:>9.3f} {approx}{t_z:>9.3f} "
+                  f"{t_kmp / t_ac:>7.1f}x {t_z / t_ac:>7.1f}x")
+        print("-" * 92)
+
+
+if __name__ == "__main__":
+    main()
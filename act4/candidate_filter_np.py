@@ -0,0 +1,114 @@
+# candidate_filter_np.py
+# Búsqueda exacta vectorizada con NumPy; mismas posiciones que find_with_z de
+# funcZ.py (que sigue siendo la referencia), pero SIN función Z:
+# - El texto normalizado se codifica UNA vez a un arreglo uint32 (code points).
+# - La máscara "es carácter de palabra" se calcula para todo el texto en un
+#   solo paso vectorizado (tabla por code point distinto + indexado).
+# - find_candidates_np parte de las posiciones donde está el primer carácter
+#   del patrón y las filtra carácter por carácter con indexado booleano; el
+#   conjunto de candidatos se reduce en cada paso. Peor caso O(n·m) (texto
+#   periódico, p. ej. "aaaa…" con "aaa…a"); con texto natural los candidatos
+#   caen casi a cero en pocos pasos.
+# - filter_whole_word_matches_np usa la máscara para descartar matches sin
+#   recorrerlos uno por uno en Python.
+
+import time
+from typing import List
+
+import numpy as np
+
+from funcZ import (
+    BOOK_PATH, PATTERNS, normalize_lower_ascii, load_normalized, is_word_char,
+    find_with_z, filter_whole_word_matches,
+)
+
+
+def encode_text(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+def word_char_mask(codes: np.ndarray) -> np.ndarray:
+    # is_word_char evaluado una vez por code point distinto
+    uniq, inv = np.unique(codes, return_inverse=True)
+    table = np.fromiter((is_word_char(chr(c)) for c in uniq.tolist()),
+                        dtype=bool, count=len(uniq))
+    return table[inv.ravel()]
+
+
+def find_candidates_np(pattern: str, codes: np.ndarray) -> np.ndarray:
+    """Mismas posiciones que find_with_z(pattern, text), como arreglo int64 (filtrado de candidatos)."""
+    m, n = len(pattern), len(codes)
+    if m == 0 or m > n:
+        return np.zeros(0, dtype=np.int64)
+    pc = encode_text(pattern)
+    cand = np.flatnonzero(codes[:n - m + 1] == pc[0])
+    for k in range(1, m):
+        if cand.size == 0:
+            break
+        cand = cand[codes[cand + k] == pc[k]]
+    return cand
+
+
+def filter_whole_word_matches_np(is_word: np.ndarray, m: int, matches: np.ndarray) -> np.ndarray:
+    """Equivalente a filter_whole_word_matches, usando la máscara precalculada."""
+    n = len(is_word)
+    if matches.size == 0:
+        return matches
+    left = matches - 1
+    right = matches + m
+    left_ok = (matches == 0) | ~is_word[np.maximum(left, 0)]
+    right_ok = (right == n) | ~is_word[np.minimum(right, n - 1)]
+    return matches[left_ok & right_ok]
+
+
+class CandidateSearchNP:
+    """Texto codificado + máscara de palabra, preparados una sola vez."""
+
+    def __init__(self, text: str):
+        self.codes = encode_text(text)
+        self.is_word = word_char_mask(self.codes)
+
+    def find(self, pattern: str, whole_words: bool = True) -> List[int]:
+        pos = find_candidates_np(pattern, self.codes)
+        if whole_words:
+            pos = filter_whole_word_matches_np(self.is_word, len(pattern), pos)
+        return pos.tolist()
+
+
+# Benchmark
+def benchmark() -> None:
+    text = load_normalized(BOOK_PATH)
+    patterns = [normalize_lower_ascii(p) for p in PATTERNS]
+
+    print("=== Búsqueda exacta: función Z (Python) vs filtrado de candidatos (NumPy) ===")
+    print(f"Archivo: {BOOK_PATH}  |  {len(text):,} caracteres\n")
+
+    t0 = time.perf_counter()
+    cs = CandidateSearchNP(text)
+    t_prep = time.perf_counter() - t0
+
+    print(f"{'Patrón':<12} {'matches':>8} {'Python (s)':>11} {'NumPy (s)':>10} {'speedup':>9}")
+    print("-" * 54)
+    tot_py = tot_np = 0.0
+    for p in patterns:
+        t0 = time.perf_counter()
+        ref = filter_whole_word_matches(text, len(p), find_with_z(p, text))
+        t_py = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        got = cs.find(p)
+        t_np = time.perf_counter() - t0
+
+        assert got == ref, f"Diferencia en '{p}'"
+        tot_py += t_py
+        tot_np += t_np
+        print(f"{p:<12} {len(got):>8} {t_py:>11.3f} {t_np:>10.4f} {t_py / t_np:>8.1f}x")
+
+    print("-" * 54)
+    print(f"Preparación NumPy (codificar + máscara): {t_prep:.3f} s")
+    print(f"Total Python: {tot_py:.3f} s  |  Total NumPy: {tot_np:.4f} s  "
+          f"(+prep {tot_np + t_prep:.3f} s)  ->  {tot_py / (tot_np + t_prep):.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
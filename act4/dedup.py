@@ -0,0 +1,251 @@
+# dedup.py
+# Deduplicador de archivos por contenido, usando el SHA-1 incremental de sha1.py.
+# - Recorre el árbol y agrupa por tamaño: sólo se hashean archivos que
+#   comparten tamaño con otro.
+# - Dentro de un grupo, primero se compara el SHA-1 de los primeros HEAD_BYTES
+#   (barato); sólo los que coinciden se hashean completos.
+# - Los archivos se leen con mmap y se pasan a SHA1.update() en bloques de
+#   BLOCK_BYTES como memoryview (sin copias).
+# - Índice en disco (JSON): ruta -> (tamaño, mtime_ns, digest del encabezado,
+#   digest completo). Un archivo con el mismo tamaño y mtime no se vuelve a hashear.
+#
+# Uso: python dedup.py DIR [--index RUTA]   |   python dedup.py --bench [--files 200] [--max-kb 32]
+
+import argparse
+import json
+import mmap
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sha1 import SHA1
+
+BLOCK_BYTES = 1 << 20
+HEAD_BYTES = 4096
+INDEX_NAME = ".dedup_index.json"
+INDEX_VERSION = 1
+
+
+def hash_file(path: str, size: int, limit: Optional[int] = None) -> str:
+    """SHA-1 (hex) de los primeros `limit` bytes del archivo (todo si limit es None)."""
+    h = SHA1()
+    end = size if limit is None else min(size, limit)
+    if end == 0:
+        return h.hexdigest()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        mv = memoryview(mm)
+        try:
+            for off in range(0, end, BLOCK_BYTES):
+                h.update(mv[off:min(end, off + BLOCK_BYTES)])
+        finally:
+            mv.release()
+    return h.hexdigest()
+
+
+class DigestIndex:
+    """
+    Caché ruta -> [tamaño, mtime_ns, sha1 del encabezado, sha1 completo | None]
+    persistida como JSON. El digest completo sólo se guarda si hizo falta.
+    """
+
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self.entries: Dict[str, List] = {}
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if data.get("version") == INDEX_VERSION:
+                    self.entries = data["entries"]
+            except (OSError, ValueError, KeyError):
+                self.entries = {}   # índice dañado: se reconstruye
+
+    def get(self, path: str, size: int, mtime_ns: int) -> Tuple[Optional[str], Optional[str]]:
+        """(head, full) vigentes para el archivo; (None, None) si cambió o no está."""
+        e = self.entries.get(path)
+        if e is not None and e[0] == size and e[1] == mtime_ns:
+            return e[2], e[3]
+        return None, None
+
+    def put(self, path: str, size: int, mtime_ns: int, head: str, full: Optional[str]) -> None:
+        self.entries[path] = [size, mtime_ns, head, full]
+
+    def prune(self, root: str, seen: set) -> None:
+        # Quita entradas bajo root que ya no existen; respeta las de otros árboles
+        prefix = root.rstrip(os.sep) + os.sep
+        self.entries = {p: e for p, e in self.entries.items()
+                        if p in seen or not p.startswith(prefix)}
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "entries": self.entries}),
+                       encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def scan_tree(root: str, skip: Tuple[str, ...] = ()) -> Dict[int, List[Tuple[str, int]]]:
+    """Tamaño -> [(ruta, mtime_ns)] de todos los archivos regulares bajo root."""
+    by_size: Dict[int, List[Tuple[str, int]]] = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            p = os.path.join(dirpath, name)
+            if p in skip:
+                continue
+            try:
+                st = os.stat(p, follow_symlinks=False)
+            except OSError:
+                continue
+            if not os.path.isfile(p) or os.path.islink(p):
+                continue
+            by_size.setdefault(st.st_size, []).append((p, st.st_mtime_ns))
+    return by_size
+
+
+def find_duplicates(root: str, index: DigestIndex) -> Tuple[List[Tuple[str, int, List[str]]], Dict]:
+    """
+    Retorna ([(digest, tamaño, [rutas])], estadísticas). Sólo grupos con 2+ archivos.
+    """
+    root = os.path.abspath(root)
+    skip = ()
+    if index.path is not None:
+        # scan_tree devuelve rutas absolutas: el índice también debe serlo para excluirlo
+        p = os.path.abspath(index.path)
+        skip = (p, p + ".tmp")
+    by_size = scan_tree(root, skip)
+    stats = {"files": 0, "bytes": 0, "hashed": 0, "hashed_bytes": 0,
+             "head_only": 0, "cache_hits": 0}
+    seen = set()
+    by_digest: Dict[Tuple[str, int], List[str]] = {}
+
+    for size, files in by_size.items():
+        stats["files"] += len(files)
+        stats["bytes"] += size * len(files)
+        seen.update(p for p, _ in files)
+        if len(files) < 2:
+            continue
+
+        # 1) SHA-1 del encabezado (en archivos chicos es el digest completo)
+        heads: Dict[str, List[Tuple[str, int, Optional[str]]]] = {}
+        for p, mt in files:
+            head, full = index.get(p, size, mt)
+            if head is None:
+                head = hash_file(p, size, HEAD_BYTES)
+                stats["hashed_bytes"] += min(size, HEAD_BYTES)
+                if size <= HEAD_BYTES:
+                    full = head
+                    stats["hashed"] += 1
+                else:
+                    full = None
+                index.put(p, size, mt, head, full)
+            else:
+                stats["cache_hits"] += 1
+            heads.setdefault(head, []).append((p, mt, full))
+
+        # 2) SHA-1 completo sólo entre los que comparten encabezado
+        for head, grp in heads.items():
+            if len(grp) == 1:
+                stats["head_only"] += 1
+                continue
+            for p, mt, full in grp:
+                if full is None:
+                    full = hash_file(p, size)
+                    stats["hashed"] += 1
+                    stats["hashed_bytes"] += size
+                    index.put(p, size, mt, head, full)
+                by_digest.setdefault((full, size), []).append(p)
+
+    index.prune(root, seen)
+    index.save()
+    groups = [(d, size, sorted(paths)) for (d, size), paths in by_digest.items() if len(paths) > 1]
+    groups.sort(key=lambda g: (-g[1] * (len(g[2]) - 1), g[2][0]))
+    return groups, stats
+
+
+# Benchmark con árbol sintético
+def make_synthetic_tree(root: Path, files: int, max_kb: int, dup_ratio: float = 0.3,
+                        seed: int = 42) -> None:
+    rng = random.Random(seed)
+    originals: List[Path] = []
+    for i in range(files):
+        sub = root / f"d{i % 10}" / f"s{i % 3}"
+        sub.mkdir(parents=True, exist_ok=True)
+        p = sub / f"f{i:05d}.bin"
+        if originals and rng.random() < dup_ratio:
+            shutil.copyfile(rng.choice(originals), p)
+        else:
+            # Tamaños repetidos a propósito (múltiplos de 1 KB) para ejercitar los grupos
+            size = rng.randint(1, max_kb) * 1024
+            data = bytearray(rng.randbytes(size))
+            if originals and rng.random() < 0.2:
+                # Mismo encabezado que otro archivo, distinto al final
+                other = rng.choice(originals).read_bytes()[:HEAD_BYTES]
+                data[:len(other)] = other
+            p.write_bytes(bytes(data))
+            originals.append(p)
+
+
+def benchmark(files: int, max_kb: int) -> None:
+    with tempfile.TemporaryDirectory(prefix="dedup_bench_") as tmp:
+        root = Path(tmp) / "tree"
+        make_synthetic_tree(root, files, max_kb)
+        index_path = Path(tmp) / "index.json"
+        print(f"=== Deduplicación: árbol sintético ({files} archivos, hasta {max_kb} KB) ===")
+        print(f"{'corrida':<8} {'archivos/s':>11} {'MB/s':>9} {'hasheados':>10} "
+              f"{'sólo encabezado':>16} {'en caché':>9} {'grupos':>7} {'tiempo (s)':>11}")
+        print("-" * 90)
+        ref = None
+        for run in ("fría", "tibia"):
+            index = DigestIndex(index_path)
+            t0 = time.perf_counter()
+            groups, st = find_duplicates(str(root), index)
+            elapsed = time.perf_counter() - t0
+            if ref is None:
+                ref = groups
+            assert groups == ref, "La corrida con caché dio grupos distintos"
+            print(f"{run:<8} {st['files'] / elapsed:>11,.0f} {st['bytes'] / 1e6 / elapsed:>9.2f} "
+                  f"{st['hashed']:>10} {st['head_only']:>16} {st['cache_hits']:>9} "
+                  f"{len(groups):>7} {elapsed:>11.3f}")
+        wasted = sum(size * (len(paths) - 1) for _, size, paths in ref)
+        print(f"\nEspacio recuperable: {wasted / 1e6:.2f} MB en {len(ref)} grupos")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Deduplicador de archivos por SHA-1.")
+    ap.add_argument("root", nargs="?", help="directorio a revisar")
+    ap.add_argument("--index", help=f"índice en disco (por omisión DIR/{INDEX_NAME})")
+    ap.add_argument("--bench", action="store_true", help="corridas fría/tibia en un árbol sintético")
+    ap.add_argument("--files", type=int, default=200)
+    ap.add_argument("--max-kb", type=int, default=32)
+    args = ap.parse_args()
+
+    if args.bench:
+        benchmark(args.files, args.max_kb)
+        return
+    if not args.root or not os.path.isdir(args.root):
+        print(f"Error: no es un directorio: {args.root}", file=sys.stderr)
+        sys.exit(1)
+
+    index = DigestIndex(Path(args.index) if args.index else Path(args.root) / INDEX_NAME)
+    t0 = time.perf_counter()
+    groups, st = find_duplicates(args.root, index)
+    elapsed = time.perf_counter() - t0
+
+    for d, size, paths in groups:
+        print(f"{d}  {size:,} bytes  x{len(paths)}")
+        for p in paths:
+            print(f"  {p}")
+    wasted = sum(size * (len(paths) - 1) for _, size, paths in groups)
+    print("-" * 72)
+    print(f"Archivos: {st['files']:,}  |  hasheados: {st['hashed']:,}  |  en caché: {st['cache_hits']:,}  "
+          f"|  {elapsed:.3f} s ({st['files'] / max(elapsed, 1e-9):,.0f} archivos/s)")
+    print(f"Grupos duplicados: {len(groups)}  |  espacio recuperable: {wasted / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@ from typing import List
 import unicodedata
 import sys
 
+from kmp import load_normalized
+
 # Config
 BOOK_PATH = Path(__file__).parent / "books" / "mobyDick.txt"
 PATTERNS = [
@@ -93,7 +95,7 @@ def find_with_z(pattern: str, text: str) -> List[int]:
 # Main
 def run() -> None:
     try:
-        raw = BOOK_PATH.read_text(encoding="utf-8")
+        text = load_normalized(BOOK_PATH)
     except FileNotFoundError:
         print(f"Error: no se encontró el archivo: {BOOK_PATH}", file=sys.stderr)
         sys.exit(1)
@@ -101,8 +103,6 @@ def run() -> None:
         print(f"Error leyendo {BOOK_PATH}: {e}", file=sys.stderr)
         sys.exit(1)
 
-    text = normalize_lower_ascii(raw)
-
     print("=== Búsqueda con Función Z ===")
     print(f"Archivo: {BOOK_PATH}")
     print(f"Patrones ({len(PATTERNS)}): {PATTERNS}")
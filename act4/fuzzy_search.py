@@ -0,0 +1,291 @@
+# fuzzy_search.py
+# Búsqueda aproximada para los libros de act4 (nombres mal escritos, texto con OCR dañado).
+# - Hamming (k desajustes): se cuentan los desajustes de TODAS las alineaciones
+#   a la vez, un paso vectorizado por carácter del patrón.
+# - Levenshtein (k ediciones): algoritmo bit-paralelo de Myers.
+#     m <= 64: palabras uint64 de NumPy; el texto se parte en LANES carriles
+#              (con traslape de m + k caracteres) que avanzan en lockstep,
+#              así cada paso de Myers procesa miles de posiciones a la vez.
+#     m > 64:  mismo algoritmo con enteros de Python (un solo carril).
+#   Cada racha de finales consecutivos con distancia <= k se reduce a su mejor
+#   final, y el inicio se recupera con una DP pequeña sobre esa ventana.
+# Salida: (posición, largo, distancia), con el mismo reporte que run() de kmp.py.
+#
+# Uso: python fuzzy_search.py [patrón ...] [--k 1] [--metric levenshtein|hamming] [--bench]
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from kmp import (
+    BOOK_PATH, PATTERNS, WHOLE_WORDS_ONLY, CTX_RADIUS, MAX_CONTEXTS, MAX_POS_PRINT,
+    normalize_lower_ascii, load_normalized, is_word_char, pretty_positions,
+)
+
+LANES = 4096          # carriles para Myers vectorizado
+MIN_LANE_CHARS = 256  # no partir el texto en carriles más cortos que esto
+
+Hit = Tuple[int, int, int]   # (posición, largo, distancia)
+
+
+def edit_distance(a: str, b: str) -> int:
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+        prev = cur
+    return prev[-1]
+
+
+class FuzzySearcher:
+    """Texto normalizado codificado una vez; se reutiliza para cualquier patrón."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        uniq, inv = np.unique(self.codes, return_inverse=True)
+        # id 0 se reserva para "fuera del texto"; los caracteres van de 1..sigma
+        self._ids = (inv.ravel() + 1).astype(np.int32)
+        self._id_of = {chr(c): i + 1 for i, c in enumerate(uniq.tolist())}
+        self._sigma = len(uniq) + 1
+
+    # Hamming
+    def hamming(self, pattern: str, k: int) -> List[Hit]:
+        m, n = len(pattern), len(self.codes)
+        if m == 0 or m > n:
+            return []
+        codes = self.codes
+        pc = np.frombuffer(pattern.encode("utf-32-le"), dtype=np.uint32)
+        span = n - m + 1
+        mism = np.zeros(span, dtype=np.int32)
+        for j in range(m):
+            mism += codes[j:j + span] != pc[j]
+        pos = np.flatnonzero(mism <= k)
+        return [(p, m, d) for p, d in zip(pos.tolist(), mism[pos].tolist())]
+
+    # Levenshtein: finales con distancia <= k
+    def _myers_ends_np(self, pattern: str, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        m, n = len(pattern), len(self.codes)
+        peq = np.zeros(self._sigma, dtype=np.uint64)
+        for j, ch in enumerate(pattern):
+            c = self._id_of.get(ch)
+            if c is not None:
+                peq[c] |= np.uint64(1 << j)
+
+        lanes = max(1, min(LANES, n // MIN_LANE_CHARS))
+        seg = -(-n // lanes)
+        warm = m + k
+        width = warm + seg
+        # ids[t, lane]: carácter t del carril (0 fuera del texto)
+        idx = (np.arange(lanes, dtype=np.int64) * seg - warm)[None, :] + \
+            np.arange(width, dtype=np.int64)[:, None]
+        valid = (idx >= 0) & (idx < n)
+        ids = np.where(valid, self._ids[np.clip(idx, 0, n - 1)], 0)
+        eq_all = peq[ids]
+
+        pv = np.full(lanes, (1 << m) - 1, dtype=np.uint64)
+        mv = np.zeros(lanes, dtype=np.uint64)
+        score = np.full(lanes, m, dtype=np.int32)
+        hb = np.uint64(1 << (m - 1))
+        one = np.uint64(1)
+        scores = np.empty((width, lanes), dtype=np.int32)
+        for t in range(width):
+            eq = eq_all[t]
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | ~(xh | pv)
+            mh = pv & xh
+            score += (ph & hb) != 0
+            score -= (mh & hb) != 0
+            ph <<= one
+            mh <<= one
+            pv = mh | ~(xv | ph)
+            mv = ph & xv
+            scores[t] = score
+
+        # Sólo cuentan los finales fuera de la zona de calentamiento y dentro del texto
+        hit = scores[warm:] <= k
+        hit &= idx[warm:] < n
+        e = idx[warm:][hit]
+        d = scores[warm:][hit]
+        order = np.argsort(e, kind="stable")
+        return e[order], d[order]
+
+    def _myers_ends_bigint(self, pattern: str, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        m = len(pattern)
+        mask = (1 << m) - 1
+        hb = 1 << (m - 1)
+        peq = {}
+        for j, ch in enumerate(pattern):
+            peq[ch] = peq.get(ch, 0) | (1 << j)
+        get = peq.get
+        pv, mv, score = mask, 0, m
+        ends, dists = [], []
+        for i, ch in enumerate(self.text):
+            eq = get(ch, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (mask ^ (xh | pv))
+            mh = pv & xh
+            if ph & hb:
+                score += 1
+            elif mh & hb:
+                score -= 1
+            ph = (ph << 1) & mask
+            mh = (mh << 1) & mask
+            pv = mh | (mask ^ (xv | ph))
+            mv = ph & xv
+            if score <= k:
+                ends.append(i)
+                dists.append(score)
+        return np.array(ends, dtype=np.int64), np.array(dists, dtype=np.int32)
+
+    def levenshtein(self, pattern: str, k: int) -> List[Hit]:
+        m, n = len(pattern), len(self.codes)
+        if m == 0 or n == 0:
+            return []
+        if k >= m:
+            raise ValueError("k debe ser menor que el largo del patrón")
+        if m <= 64:
+            ends, dists = self._myers_ends_np(pattern, k)
+        else:
+            ends, dists = self._myers_ends_bigint(pattern, k)
+
+        if ends.size == 0:
+            return []
+        # En una racha de finales consecutivos, cada mínimo local de la distancia es
+        # una ocurrencia (el primer final de una meseta); los finales exactos (d = 0)
+        # se conservan todos, así las ocurrencias vecinas o traslapadas no se pierden.
+        cont = np.concatenate(([False], np.diff(ends) == 1))
+        new_plateau = ~cont | np.concatenate(([True], dists[1:] != dists[:-1]))
+        first = np.flatnonzero(new_plateau)
+        last = np.concatenate((first[1:], [len(ends)])) - 1
+        big = np.iinfo(np.int32).max
+        left = np.where(cont[first], dists[first - 1], big)
+        nxt = np.minimum(last + 1, len(ends) - 1)
+        right = np.where((last + 1 < len(ends)) & cont[nxt], dists[nxt], big)
+        keep = dists == 0
+        keep[first[(left > dists[first]) & (right > dists[first])]] = True
+        return [self._best_start(pattern, e, d)
+                for e, d in zip(ends[keep].tolist(), dists[keep].tolist())]
+
+    def _best_start(self, pattern: str, end: int, d: int) -> Hit:
+        # Inicio cuyo alineamiento alcanza la distancia d; preferir largo cercano a m
+        m = len(pattern)
+        if d == 0:
+            return end + 1 - m, m, 0
+        best = None
+        for length in sorted(range(max(1, m - d), m + d + 1), key=lambda L: (abs(L - m), -L)):
+            s = end + 1 - length
+            if s < 0:
+                continue
+            if edit_distance(pattern, self.text[s:end + 1]) == d:
+                best = (s, length, d)
+                break
+        return best if best is not None else (end + 1 - m, m, d)
+
+    def search(self, pattern: str, k: int, metric: str = "levenshtein",
+               whole_words: bool = False) -> List[Hit]:
+        hits = self.hamming(pattern, k) if metric == "hamming" else self.levenshtein(pattern, k)
+        if whole_words:
+            hits = [h for h in hits if self._is_whole(h[0], h[1])]
+        return hits
+
+    def _is_whole(self, p: int, length: int) -> bool:
+        text = self.text
+        left_ok = (p == 0) or (not is_word_char(text[p - 1]))
+        right_ok = (p + length == len(text)) or (not is_word_char(text[p + length]))
+        return left_ok and right_ok
+
+
+def hit_contexts(text: str, hits: List[Hit], radius: int = 30,
+                 max_ctx: int = 5) -> List[Tuple[int, int, str]]:
+    out = []
+    for p, length, d in hits[:max_ctx]:
+        a = max(0, p - radius)
+        b = min(len(text), p + length + radius)
+        out.append((p, d, text[a:b].replace("\n", " ")))
+    return out
+
+
+# Benchmark
+def benchmark(k: int) -> None:
+    books = sorted(BOOK_PATH.parent.glob("*.txt"))
+    patterns = [normalize_lower_ascii(p) for p in PATTERNS]
+    print(f"=== Throughput de búsqueda aproximada (k={k}, {len(patterns)} patrones) ===")
+    print(f"{'Libro':<24} {'MB':>6} {'Hamming MB/s':>13} {'Levenshtein MB/s':>17}")
+    print("-" * 64)
+    for path in books:
+        text = load_normalized(path)
+        fs = FuzzySearcher(text)
+        mb = len(text.encode("utf-8")) / 1e6
+        rates = []
+        for metric in ("hamming", "levenshtein"):
+            t0 = time.perf_counter()
+            for p in patterns:
+                fs.search(p, k, metric)
+            rates.append(mb * len(patterns) / (time.perf_counter() - t0))
+        print(f"{path.name:<24} {mb:>6.2f} {rates[0]:>13.1f} {rates[1]:>17.1f}")
+
+
+# Main
+def run() -> None:
+    ap = argparse.ArgumentParser(description="Búsqueda aproximada (Hamming / Levenshtein).")
+    ap.add_argument("patterns", nargs="*", default=PATTERNS)
+    ap.add_argument("--k", type=int, default=1, help="distancia máxima")
+    ap.add_argument("--metric", choices=["levenshtein", "hamming"], default="levenshtein")
+    ap.add_argument("--book", default=str(BOOK_PATH))
+    ap.add_argument("--bench", action="store_true", help="medir MB/s en todos los libros")
+    args = ap.parse_args()
+
+    # Levenshtein exige k < largo del patrón (también en --bench, que corre ambas métricas)
+    metric_lev = args.bench or args.metric == "levenshtein"
+    patterns = PATTERNS if args.bench else args.patterns
+    too_long = [p for p in patterns if metric_lev and args.k >= len(normalize_lower_ascii(p))]
+    if args.k < 0 or too_long:
+        print(f"Error: --k debe ser >= 0 y menor que el largo del patrón ({', '.join(too_long)})",
+              file=sys.stderr)
+        sys.exit(1)
+
+    if args.bench:
+        benchmark(args.k)
+        return
+
+    book = Path(args.book)
+    try:
+        text = load_normalized(book)
+    except FileNotFoundError:
+        print(f"Error: no se encontró el archivo: {book}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"=== Búsqueda aproximada ({args.metric}, k={args.k}) ===")
+    print(f"Archivo: {book}")
+    print(f"Patrones ({len(args.patterns)}): {args.patterns}")
+    print(f"Modo: {'palabras completas' if WHOLE_WORDS_ONLY else 'subcadenas'}\n")
+
+    fs = FuzzySearcher(text)
+    for pat in args.patterns:
+        p = normalize_lower_ascii(pat)
+        t0 = time.perf_counter()
+        hits = fs.search(p, args.k, args.metric, WHOLE_WORDS_ONLY)
+        elapsed = time.perf_counter() - t0
+
+        by_dist = {}
+        for _, _, d in hits:
+            by_dist[d] = by_dist.get(d, 0) + 1
+        print(f"Patrón: '{pat}'  |  largo={len(p)}  |  {elapsed * 1000:.1f} ms")
+        print(f"Total de ocurrencias: {len(hits)}  (por distancia: {dict(sorted(by_dist.items()))})")
+        print(f"Primeras posiciones: {pretty_positions([h[0] for h in hits], MAX_POS_PRINT)}")
+
+        for p0, d, frag in hit_contexts(text, hits, radius=CTX_RADIUS, max_ctx=MAX_CONTEXTS):
+            print(f"  - pos={p0} d={d}: …{frag}…")
+        print("-" * 72)
+
+
+if __name__ == "__main__":
+    run()
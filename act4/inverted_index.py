@@ -0,0 +1,197 @@
+# inverted_index.py
+# Índice invertido de palabras completas para los libros de act4.
+# - Tokeniza el texto normalizado en una sola pasada (sin regex): los tokens son
+#   las rachas máximas de caracteres de palabra (is_word_char), igual que el
+#   criterio de filter_whole_word_matches.
+# - Cada token apunta a sus offsets de carácter, guardados como deltas en
+#   array('I') (postings compactos).
+# - Consulta de palabra: búsqueda en el diccionario + decodificar deltas.
+# - Consulta de frase ("white whale"): intersección de postings desplazados y
+#   verificación de los separadores contra el texto.
+# El resultado es idéntico a find_with_kmp + filter_whole_word_matches.
+#
+# Uso: python inverted_index.py [consulta ...]   |   python inverted_index.py --bench
+
+import sys
+import time
+import tracemalloc
+from array import array
+from itertools import accumulate
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from kmp import (
+    BOOK_PATH, PATTERNS, CTX_RADIUS, MAX_CONTEXTS, MAX_POS_PRINT,
+    normalize_lower_ascii, load_normalized, is_word_char,
+    find_with_kmp, filter_whole_word_matches, contexts, pretty_positions,
+)
+from candidate_filter_np import encode_text, word_char_mask
+
+PHRASES = ["white whale", "captain ahab", "moby dick"]
+
+
+def split_query(query: str) -> Tuple[List[str], List[str]]:
+    # "white  whale" -> tokens ["white", "whale"], separadores ["  "]
+    tokens, seps = [], []
+    cur, is_word = "", None
+    for ch in query:
+        w = is_word_char(ch)
+        if is_word is not None and w != is_word:
+            (tokens if is_word else seps).append(cur)
+            cur = ""
+        cur += ch
+        is_word = w
+    if cur:
+        (tokens if is_word else seps).append(cur)
+    return tokens, seps
+
+
+class InvertedIndex:
+
+    def __init__(self, text: str):
+        self.text = text
+        self.postings: Dict[str, array] = {}
+        self._build()
+
+    def _build(self) -> None:
+        # Bordes de token a partir de la máscara de caracteres de palabra
+        mask = word_char_mask(encode_text(self.text)).astype(np.int8)
+        edges = np.diff(np.concatenate(([0], mask, [0])))
+        starts = np.flatnonzero(edges == 1).tolist()
+        ends = np.flatnonzero(edges == -1).tolist()
+
+        text = self.text
+        last: Dict[str, int] = {}
+        postings: Dict[str, array] = {}
+        for a, b in zip(starts, ends):
+            tok = text[a:b]
+            prev = last.get(tok)
+            if prev is None:
+                postings[tok] = array('I', (a,))
+            else:
+                postings[tok].append(a - prev)
+            last[tok] = a
+        self.postings = postings
+        self.n_tokens = len(starts)
+
+    def lookup(self, word: str) -> List[int]:
+        deltas = self.postings.get(word)
+        return list(accumulate(deltas)) if deltas is not None else []
+
+    def query(self, query: str) -> List[int]:
+        """Palabra o frase; la consulta debe empezar y terminar con carácter de palabra."""
+        tokens, seps = split_query(query)
+        if not tokens:
+            return []
+        if not is_word_char(query[0]) or not is_word_char(query[-1]):
+            raise ValueError("La consulta debe empezar y terminar con un carácter de palabra")
+        if len(tokens) == 1:
+            return self.lookup(tokens[0])
+
+        # Offset de cada token relativo al inicio de la frase
+        offsets, off = [], 0
+        for i, tok in enumerate(tokens):
+            offsets.append(off)
+            off += len(tok) + (len(seps[i]) if i < len(seps) else 0)
+
+        # Intersección empezando por el token más raro
+        order = sorted(range(len(tokens)), key=lambda i: len(self.postings.get(tokens[i], ())))
+        cand = None
+        for i in order:
+            shifted = {p - offsets[i] for p in self.lookup(tokens[i])}
+            cand = shifted if cand is None else cand & shifted
+            if not cand:
+                return []
+
+        # Los separadores deben coincidir exactamente (p. ej. "white-whale" no es "white whale")
+        text = self.text
+        out = []
+        for p in sorted(cand):
+            if all(text[p + offsets[i] + len(tokens[i]):p + offsets[i + 1]] == seps[i]
+                   for i in range(len(seps))):
+                out.append(p)
+        return out
+
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in self.postings.values())
+
+
+# Benchmark
+def benchmark() -> None:
+    books = sorted(BOOK_PATH.parent.glob("*.txt"))
+    queries = [normalize_lower_ascii(q) for q in PATTERNS + PHRASES]
+    print("=== Índice invertido: construcción, memoria y latencia ===")
+    print(f"Consultas ({len(queries)}): {queries}\n")
+    print(f"{'Libro':<24} {'tokens':>8} {'únicos':>7} {'build (s)':>10} {'postings':>10} "
+          f"{'pico build':>11} {'consulta (ms)':>14} {'KMP+filtro (ms)':>16}")
+    print("-" * 108)
+    for path in books:
+        text = load_normalized(path)
+
+        t0 = time.perf_counter()
+        idx = InvertedIndex(text)
+        t_build = time.perf_counter() - t0
+
+        # Segunda construcción sólo para medir memoria (tracemalloc distorsiona el tiempo)
+        tracemalloc.start()
+        InvertedIndex(text)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        t_q = t_scan = 0.0
+        for q in queries:
+            t0 = time.perf_counter()
+            got = idx.query(q)
+            t_q += time.perf_counter() - t0
+            t0 = time.perf_counter()
+            ref = filter_whole_word_matches(text, len(q), find_with_kmp(q, text))
+            t_scan += time.perf_counter() - t0
+            assert got == ref, f"Diferencia en '{q}' ({path.name})"
+
+        print(f"{path.name:<24} {idx.n_tokens:>8,} {len(idx.postings):>7,} {t_build:>10.3f} "
+              f"{idx.nbytes() / 1e6:>8.2f}MB {peak / 1e6:>9.1f}MB "
+              f"{t_q / len(queries) * 1000:>14.3f} {t_scan / len(queries) * 1000:>16.1f}")
+
+
+# Main
+def run() -> None:
+    if sys.argv[1:] == ["--bench"]:
+        benchmark()
+        return
+    queries = sys.argv[1:] or PATTERNS + PHRASES
+    text = load_normalized(BOOK_PATH)
+
+    t0 = time.perf_counter()
+    idx = InvertedIndex(text)
+    t_build = time.perf_counter() - t0
+
+    print("=== Búsqueda con índice invertido (palabras completas) ===")
+    print(f"Archivo: {BOOK_PATH}")
+    print(f"Índice: {idx.n_tokens:,} tokens, {len(idx.postings):,} distintos  |  "
+          f"construcción: {t_build:.3f} s")
+    print(f"Consultas ({len(queries)}): {queries}\n")
+
+    for q in queries:
+        p = normalize_lower_ascii(q)
+        t0 = time.perf_counter()
+        try:
+            pos = idx.query(p)
+        except ValueError as e:
+            # Consulta inválida (p. ej. "whale!"): se reporta y se sigue con las demás
+            print(f"Patrón: '{q}'  |  Error: {e}", file=sys.stderr)
+            print("-" * 72)
+            continue
+        t_q = time.perf_counter() - t0
+
+        print(f"Patrón: '{q}'  |  largo={len(p)}  |  consulta: {t_q * 1000:.3f} ms")
+        print(f"Total de ocurrencias: {len(pos)}")
+        print(f"Primeras posiciones: {pretty_positions(pos, MAX_POS_PRINT)}")
+
+        for p0, frag in contexts(text, pos, len(p), radius=CTX_RADIUS, max_ctx=MAX_CONTEXTS):
+            print(f"  - pos={p0}: …{frag}…")
+        print("-" * 72)
+
+
+if __name__ == "__main__":
+    run()
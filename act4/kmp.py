@@ -3,6 +3,8 @@ from typing import List, Tuple
 import unicodedata
 import sys
 
+from text_cache import cached_text
+
 # Config
 BOOK_PATH = Path(__file__).parent / "books" / "mobyDick.txt"
 PATTERNS = [
@@ -23,6 +25,18 @@ def normalize_lower_ascii(s: str) -> str:
     return "".join(ch for ch in s if unicodedata.category(ch) != "Mn")
 
 
+NORMALIZE_VERSION = 1     # subir al cambiar normalize_lower_ascii: invalida la caché
+
+
+def load_normalized(path: Path, errors: str = "strict") -> str:
+    #Texto normalizado desde la caché (se normaliza sólo si el archivo cambió).
+    #errors se pasa a read_text; cada valor tiene su propia entrada en la caché
+    mode = "lower_ascii" if errors == "strict" else f"lower_ascii_{errors}"
+    return cached_text(path, mode,
+                       lambda: (normalize_lower_ascii(path.read_text(encoding="utf-8", errors=errors)), None, {}),
+                       version=NORMALIZE_VERSION).text
+
+
 def is_word_char(ch: str) -> bool:
     return ch.isalnum() or ch == "_"
 
@@ -112,7 +126,7 @@ def find_with_kmp(pattern: str, text: str) -> List[int]:
 # Main
 def run() -> None:
     try:
-        raw = BOOK_PATH.read_text(encoding="utf-8")
+        text = load_normalized(BOOK_PATH)
     except FileNotFoundError:
         print(f"Error: no se encontró el archivo: {BOOK_PATH}", file=sys.stderr)
         sys.exit(1)
@@ -120,8 +134,6 @@ def run() -> None:
         print(f"Error leyendo {BOOK_PATH}: {e}", file=sys.stderr)
         sys.exit(1)
 
-    text = normalize_lower_ascii(raw)
-
     print("=== Búsqueda con KMP ===")
     print(f"Archivo: {BOOK_PATH}")
     print(f"Patrones ({len(PATTERNS)}): {PATTERNS}")
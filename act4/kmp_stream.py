@@ -0,0 +1,191 @@
+# kmp_stream.py
+# KMP en streaming para textos que no caben en memoria.
+# - Lee el archivo en bloques de bytes de tamaño fijo (o vía mmap).
+# - Decodifica y normaliza cada bloque de forma incremental.
+# - Conserva el estado j de KMP y una pequeña ventana de traslape
+#   (m + 1 caracteres) entre bloques, para el filtro de palabras completas.
+# - Genera offsets GLOBALES (los mismos que find_with_kmp sobre el texto
+#   completo normalizado). La memoria queda acotada por el tamaño de bloque.
+#
+# Uso: python kmp_stream.py ARCHIVO [patrón ...] [--chunk BYTES] [--mmap]
+
+import argparse
+import codecs
+import io
+import mmap
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List
+
+from kmp import (
+    BOOK_PATH, PATTERNS, WHOLE_WORDS_ONLY, MAX_POS_PRINT,
+    normalize_lower_ascii, is_word_char, kmp_lps, pretty_positions,
+)
+
+CHUNK_SIZE = 1 << 20   # 1 MiB por bloque
+
+
+# Lectura por bloques
+def iter_byte_chunks(path: Path, chunk_size: int = CHUNK_SIZE,
+                     use_mmap: bool = False) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        if use_mmap:
+            if f.seek(0, io.SEEK_END) == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for off in range(0, len(mm), chunk_size):
+                    yield mm[off:off + chunk_size]
+        else:
+            while True:
+                b = f.read(chunk_size)
+                if not b:
+                    return
+                yield b
+
+
+def iter_normalized_chunks(path: Path, chunk_size: int = CHUNK_SIZE,
+                           use_mmap: bool = False) -> Iterator[str]:
+    """
+    Decodifica UTF-8 de forma incremental (un carácter multibyte puede quedar
+    partido entre bloques) y traduce saltos de línea igual que read_text.
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(), translate=True)
+    for b in iter_byte_chunks(path, chunk_size, use_mmap):
+        s = decoder.decode(b)
+        if s:
+            yield normalize_lower_ascii(s)
+    s = decoder.decode(b"", final=True)
+    if s:
+        yield normalize_lower_ascii(s)
+
+
+# Escáner KMP con estado
+class KMPStreamScanner:
+    """
+    Estado de KMP que sobrevive entre bloques.
+    feed(chunk) -> posiciones confirmadas; close() -> las pendientes del final.
+    Con whole_words=True, un match que toca el final del bloque queda
+    pendiente hasta conocer el carácter siguiente.
+    """
+
+    def __init__(self, pattern: str, whole_words: bool = False):
+        self.pattern = pattern
+        self.m = len(pattern)
+        self.lps = kmp_lps(pattern) if pattern else []
+        self.whole_words = whole_words
+        self.j = 0          # estado KMP (longitud del prefijo casado)
+        self.base = 0       # offset global del inicio del siguiente bloque
+        self.tail = ""      # ventana de traslape: últimos m + 1 caracteres
+        self.pending: List[int] = []
+
+    def _is_whole(self, window: str, wbase: int, p: int, at_end: bool = False) -> bool:
+        k = p - wbase
+        left_ok = (p == 0) or (not is_word_char(window[k - 1]))
+        right_ok = at_end or (not is_word_char(window[k + self.m]))
+        return left_ok and right_ok
+
+    def feed(self, chunk: str) -> List[int]:
+        if not self.pattern or not chunk:
+            return []
+        pattern, lps, m = self.pattern, self.lps, self.m
+        base = self.base
+        window = self.tail + chunk
+        wbase = base - len(self.tail)
+        out: List[int] = []
+
+        if self.pending:
+            for p in self.pending:
+                if self._is_whole(window, wbase, p):
+                    out.append(p)
+            self.pending = []
+
+        end = base + len(chunk)
+        j = self.j
+        for i, ch in enumerate(chunk):
+            while j > 0 and ch != pattern[j]:
+                j = lps[j - 1]
+            if ch == pattern[j]:
+                j += 1
+                if j == m:
+                    p = base + i - m + 1
+                    j = lps[j - 1]
+                    if not self.whole_words:
+                        out.append(p)
+                    elif p + m < end:
+                        if self._is_whole(window, wbase, p):
+                            out.append(p)
+                    else:
+                        self.pending.append(p)
+        self.j = j
+        self.base = end
+        self.tail = window[-(m + 1):]
+        return out
+
+    def close(self) -> List[int]:
+        window, wbase = self.tail, self.base - len(self.tail)
+        out = [p for p in self.pending if self._is_whole(window, wbase, p, at_end=True)]
+        self.pending = []
+        return out
+
+
+def find_in_stream(pattern: str, chunks: Iterable[str],
+                   whole_words: bool = False) -> Iterator[int]:
+    """Generador de offsets globales de 'pattern' sobre una secuencia de bloques."""
+    scanner = KMPStreamScanner(pattern, whole_words)
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.close()
+
+
+def find_in_file(pattern: str, path: Path, whole_words: bool = False,
+                 chunk_size: int = CHUNK_SIZE, use_mmap: bool = False) -> Iterator[int]:
+    return find_in_stream(pattern, iter_normalized_chunks(path, chunk_size, use_mmap),
+                          whole_words)
+
+
+# Main
+def run() -> None:
+    ap = argparse.ArgumentParser(description="KMP en streaming por bloques.")
+    ap.add_argument("path", nargs="?", default=str(BOOK_PATH))
+    ap.add_argument("patterns", nargs="*", default=PATTERNS)
+    ap.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="tamaño de bloque en bytes")
+    ap.add_argument("--mmap", action="store_true", help="leer el archivo vía mmap")
+    args = ap.parse_args()
+
+    path = Path(args.path)
+    if not path.is_file():
+        print(f"Error: no se encontró el archivo: {path}", file=sys.stderr)
+        sys.exit(1)
+
+    size = path.stat().st_size
+    print("=== Búsqueda con KMP en streaming ===")
+    print(f"Archivo: {path}  ({size:,} bytes)")
+    print(f"Bloque: {args.chunk:,} bytes  |  lectura: {'mmap' if args.mmap else 'read()'}")
+    print(f"Patrones ({len(args.patterns)}): {args.patterns}")
+    print(f"Modo: {'palabras completas' if WHOLE_WORDS_ONLY else 'subcadenas'}\n")
+
+    # Una sola lectura del archivo alimenta a todos los escáneres
+    scanners = [KMPStreamScanner(normalize_lower_ascii(p), WHOLE_WORDS_ONLY)
+                for p in args.patterns]
+    found: List[List[int]] = [[] for _ in scanners]
+    t0 = time.perf_counter()
+    for chunk in iter_normalized_chunks(path, args.chunk, args.mmap):
+        for sc, acc in zip(scanners, found):
+            acc.extend(sc.feed(chunk))
+    for sc, acc in zip(scanners, found):
+        acc.extend(sc.close())
+    elapsed = time.perf_counter() - t0
+
+    for pat, sc, pos in zip(args.patterns, scanners, found):
+        print(f"Patrón: '{pat}'  |  largo={sc.m}")
+        print(f"Total de ocurrencias: {len(pos)}")
+        print(f"Primeras posiciones: {pretty_positions(pos, MAX_POS_PRINT)}")
+        print("-" * 72)
+
+    print(f"Tiempo total: {elapsed:.3f} s  |  {size / elapsed / 1e6:.2f} MB/s")
+
+
+if __name__ == "__main__":
+    run()
@@ -2,18 +2,23 @@
 # Implementación fiel a las láminas del algoritmo de Manacher.
 # Retorna el palíndromo más largo y metadatos útiles.
 
-from typing import Tuple
+import heapq
+from array import array
+from typing import Dict, List, Tuple
 
 def _build_T(S: str) -> str:
     # Agrega '^' al inicio, '$' al final y '|' entre caracteres
     # Nota: No insertamos '|' al inicio para mantener índices como en las láminas
     return "^" + "|".join(S) + "|$"
 
-def manacher_longest_palindrome(S: str) -> Tuple[str, int, int]:
+def manacher_longest_palindrome(S: str, mode: str = "slides") -> Tuple[str, int, int]:
     """
     Entrada:  S (string)
     Salida:   (palindromo_mas_largo, start_en_S, length)
 
+    mode="slides" (default): versión de las láminas, descrita abajo.
+    mode="dual": ver _manacher_dual; no construye T y usa la mitad de memoria.
+
     Implementación basada en las diapositivas:
       - Construye T con '^', '|', '$'
       - Arreglo L (radios)
@@ -26,10 +31,27 @@ def manacher_longest_palindrome(S: str) -> Tuple[str, int, int]:
     """
     if not S:
         return "", 0, 0
+    if mode == "dual":
+        start, lmax = _manacher_dual(S)
+        return S[start:start + lmax], start, lmax
+    if mode != "slides":
+        raise ValueError(f"modo desconocido: {mode!r}")
 
     T = _build_T(S)
     N = len(T)
-    L = [0] * N
+    L = _radii(T)
+
+    # Encuentra máximo
+    imax = max(range(1, N - 1), key=lambda k: L[k])
+    lmax = L[imax]
+    start = (imax - lmax) // 2  # división entera, como en las láminas
+
+    return S[start:start + lmax], start, lmax
+
+def _radii(T: str) -> array:
+    # Ciclo de Manacher sobre T; L[i] = radio del palíndromo centrado en T[i]
+    N = len(T)
+    L = array('i', [0]) * N
 
     c = 0   # centro del palíndromo más a la derecha
     r = 0   # límite derecho
@@ -53,9 +75,122 @@ def manacher_longest_palindrome(S: str) -> Tuple[str, int, int]:
             c = i
             r = i + L[i]
 
-    # Encuentra máximo
-    imax = max(range(1, N - 1), key=lambda k: L[k])
-    lmax = L[imax]
-    start = (imax - lmax) // 2  # división entera, como en las láminas
+    return L
 
-    return S[start:start + lmax], start, lmax
+def _manacher_dual(S) -> Tuple[int, int]:
+    """
+    Manacher con dos arreglos directamente sobre S (str o bytes), sin T:
+      d1[i] = k  -> palíndromo impar más largo centrado en i mide 2k - 1
+      d2[i] = k  -> palíndromo par más largo centrado entre i-1 e i mide 2k
+    Los radios van en array('i') y se calculan uno después del otro, así el
+    pico de memoria es S + 4n bytes (las láminas guardan T de 2n+2 caracteres
+    y L de 2n+2 radios).
+    Un empate sólo puede darse entre centros de la misma paridad, y se
+    resuelve con el primero, igual que las láminas. Diferencia: un
+    palíndromo que empieza en S[0] se mide completo (las láminas lo
+    cuentan con un carácter de menos).
+    Retorna (start, length).
+    """
+    n = len(S)
+
+    d = array('i', [0]) * n
+    l, r = 0, -1
+    best_start, best_len = 0, 0
+    for i in range(n):
+        k = 1 if i > r else min(d[l + r - i], r - i + 1)
+        while i - k >= 0 and i + k < n and S[i - k] == S[i + k]:
+            k += 1
+        d[i] = k
+        if 2 * k - 1 > best_len:
+            best_start, best_len = i - k + 1, 2 * k - 1
+        if i + k - 1 > r:
+            l, r = i - k + 1, i + k - 1
+    del d
+
+    d = array('i', [0]) * n
+    l, r = 0, -1
+    even_start, even_len = 0, 0
+    for i in range(n):
+        k = 0 if i > r else min(d[l + r - i + 1], r - i + 1)
+        while i - k - 1 >= 0 and i + k < n and S[i - k - 1] == S[i + k]:
+            k += 1
+        d[i] = k
+        if 2 * k > even_len:
+            even_start, even_len = i - k, 2 * k
+        if i + k - 1 > r:
+            l, r = i - k, i + k - 1
+
+    if even_len > best_len:
+        return even_start, even_len
+    return best_start, best_len
+
+# ----------------- Enumeración de palíndromos -----------------
+
+def palindrome_radii(S: str) -> array:
+    """
+    Arreglo de radios de Manacher como array('i') (compatible con
+    np.frombuffer(..., dtype=np.int32)), indexado sobre T = _build_T(S).
+
+    L[i] = largo en S del palíndromo MAXIMAL centrado en T[i]; empieza en
+    S[(i - L[i]) // 2]. Posiciones impares = centro en un carácter,
+    pares = centro entre dos caracteres.
+
+    Como T no lleva '|' al inicio, un palíndromo que toca el inicio de S
+    se detiene contra '^' con un carácter de menos; aquí se corrige.
+    """
+    if not S:
+        return array('i')
+    T = _build_T(S)
+    L = _radii(T)
+    for i in range(1, len(T) - 1):
+        if i - L[i] == 1:       # la expansión chocó con '^'
+            L[i] += 1
+    return L
+
+def palindrome_profile(S: str, min_len: int = 7, top_k: int = 10) -> Dict:
+    """
+    Perfil completo de palíndromos de S en O(n): un Manacher y un solo
+    recorrido del arreglo de radios.
+      - total:    número de subcadenas palindrómicas (contando repeticiones)
+      - longest:  (start, length) del más largo (primero en empate)
+      - maximal:  [(start, length)] palíndromos maximales con length >= min_len
+      - top:      [(length, start, palíndromo)] los top_k maximales distintos más largos
+      - radii:    el mismo arreglo que devuelve palindrome_radii
+    """
+    if not S:
+        return {"total": 0, "longest": (0, 0), "maximal": [], "top": [], "radii": array('i')}
+    L = _radii(_build_T(S))
+    total = 0
+    best_i, best_len = 0, 0
+    maximal: List[Tuple[int, int]] = []
+    heap: List[Tuple[int, int, str]] = []     # (largo, -start, texto), mínimo arriba
+    in_heap = set()
+
+    for i in range(1, len(L) - 1):
+        li = L[i]
+        if i - li == 1:         # misma corrección que palindrome_radii
+            li += 1
+            L[i] = li
+        # centro en carácter: largos 1, 3, .., li ; entre caracteres: 2, 4, .., li
+        total += (li + 1) >> 1
+        if li > best_len:
+            best_i, best_len = i, li
+        if li >= min_len:
+            start = (i - li) >> 1
+            maximal.append((start, li))
+            if len(heap) < top_k or (li, -start) > heap[0][:2]:
+                pal = S[start:start + li]
+                if pal not in in_heap:
+                    in_heap.add(pal)
+                    heapq.heappush(heap, (li, -start, pal))
+                    if len(heap) > top_k:
+                        in_heap.discard(heapq.heappop(heap)[2])
+
+    top = [(li, -neg, pal) for li, neg, pal in sorted(heap, reverse=True)]
+    return {
+        "total": total,
+        "longest": ((best_i - best_len) >> 1, best_len),
+        "maximal": maximal,
+        "top": top,
+        "radii": L,
+    }
@@ -0,0 +1,53 @@
+# manacher_mem_bench.py
+# Compara los modos de manacher_longest_palindrome sobre todos los .txt en ./books:
+#   slides: T = "^" + "|".join(S) + "|$" y un radio por posición de T
+#   dual:   arreglos d1 / d2 (array('i')) directamente sobre S
+# Reporta pico de memoria (tracemalloc) y tiempo. El tiempo se mide en una
+# corrida aparte porque tracemalloc vuelve más lenta cada asignación.
+
+import time
+import tracemalloc
+
+from manacher import manacher_longest_palindrome
+from run_manacher_books import BOOKS_DIR, load_base, load_filtered
+
+MODES = ["slides", "dual"]
+
+
+def measure(clean: str, mode: str):
+    t0 = time.perf_counter()
+    result = manacher_longest_palindrome(clean, mode=mode)
+    elapsed = time.perf_counter() - t0
+
+    tracemalloc.start()
+    manacher_longest_palindrome(clean, mode=mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    txts = sorted(BOOKS_DIR.glob("*.txt"))
+    if not txts:
+        print("No se encontraron .txt en ./books")
+        return
+
+    print(f"{'Book':<24} {'clean chars':>12} {'mode':>7} {'peak MB':>9} {'bytes/char':>11} "
+          f"{'time (s)':>9} {'longest':>8}")
+    print("-" * 88)
+    for path in txts:
+        clean, _ = load_filtered(path, load_base(path))
+        n = len(clean)
+        results = {}
+        for mode in MODES:
+            (pal, start, length), elapsed, peak = measure(clean, mode)
+            results[mode] = (start, length)
+            print(f"{path.name:<24} {n:>12,} {mode:>7} {peak / 1e6:>9.2f} {peak / n:>11.1f} "
+                  f"{elapsed:>9.3f} {length:>8}")
+        if results["slides"] != results["dual"]:
+            print(f"  nota: resultados distintos {results} (palíndromo al inicio del texto)")
+        print("-" * 88)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# parallel_search.py
+# Modo "corpus": busca PATTERNS en todos los .txt de un directorio,
+# repartiendo el trabajo en un ProcessPoolExecutor.
+# - Cada libro se parte en shards traslapados (m_max - 1 caracteres), así
+#   un solo libro grande también usa todos los núcleos.
+# - Cada shard sólo reporta los matches que EMPIEZAN en su rango propio,
+#   por lo que no hay duplicados al unir.
+# - Resultado: {libro: {patrón: [posiciones]}}, igual al ciclo serial.
+#
+# Uso: python parallel_search.py [DIR] [--algo kmp|z] [--workers 1 2 4 8]
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from kmp import (
+    PATTERNS, WHOLE_WORDS_ONLY, normalize_lower_ascii, load_normalized,
+    filter_whole_word_matches, find_with_kmp,
+)
+from funcZ import find_with_z
+
+BOOKS_DIR = Path(__file__).parent / "books"
+SHARD_CHARS = 200_000     # tamaño del rango propio de cada shard
+FINDERS = {"kmp": find_with_kmp, "z": find_with_z}
+
+Results = Dict[str, Dict[str, List[int]]]
+
+
+def make_shards(n: int, shard_chars: int = SHARD_CHARS) -> List[Tuple[int, int]]:
+    # Rangos propios [start, end) que cubren el texto completo
+    return [(a, min(n, a + shard_chars)) for a in range(0, n, shard_chars)] or [(0, 0)]
+
+
+def _search_shard(task) -> Tuple[str, int, Dict[str, List[int]]]:
+    # Corre en el proceso hijo: busca todos los patrones en un shard
+    algo, book, start, end, shard, patterns = task
+    finder = FINDERS[algo]
+    out = {}
+    for p in patterns:
+        out[p] = [start + q for q in finder(p, shard) if start + q < end]
+    return book, start, out
+
+
+def load_corpus(directory: Path) -> Dict[str, str]:
+    return {p.name: load_normalized(p, errors="ignore") for p in sorted(directory.glob("*.txt"))}
+
+
+def search_serial(texts: Dict[str, str], patterns: List[str], algo: str = "kmp") -> Results:
+    finder = FINDERS[algo]
+    return {book: {p: finder(p, text) for p in patterns} for book, text in texts.items()}
+
+
+def search_parallel(texts: Dict[str, str], patterns: List[str], algo: str = "kmp",
+                    workers: int = os.cpu_count() or 1,
+                    shard_chars: int = SHARD_CHARS) -> Results:
+    overlap = max((len(p) for p in patterns), default=1) - 1
+    tasks = []
+    for book, text in texts.items():
+        for a, b in make_shards(len(text), shard_chars):
+            tasks.append((algo, book, a, b, text[a:b + overlap], patterns))
+
+    parts: Dict[str, List[Tuple[int, Dict[str, List[int]]]]] = {book: [] for book in texts}
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for book, start, out in ex.map(_search_shard, tasks):
+            parts[book].append((start, out))
+
+    # Unir shards en orden -> listas de posiciones ya ordenadas
+    results: Results = {}
+    for book, shard_list in parts.items():
+        shard_list.sort(key=lambda t: t[0])
+        results[book] = {p: [q for _, out in shard_list for q in out[p]] for p in patterns}
+    return results
+
+
+def apply_whole_words(texts: Dict[str, str], results: Results) -> Results:
+    return {book: {p: filter_whole_word_matches(texts[book], len(p), pos)
+                   for p, pos in per_pat.items()}
+            for book, per_pat in results.items()}
+
+
+# Main
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Búsqueda KMP / Z en paralelo sobre un corpus.")
+    ap.add_argument("directory", nargs="?", default=str(BOOKS_DIR))
+    ap.add_argument("--algo", choices=sorted(FINDERS), default="kmp")
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = ap.parse_args()
+
+    directory = Path(args.directory)
+    texts = load_corpus(directory)
+    if not texts:
+        print(f"No se encontraron .txt en {directory}", file=sys.stderr)
+        sys.exit(1)
+
+    patterns = [normalize_lower_ascii(p) for p in PATTERNS]
+    total_chars = sum(len(t) for t in texts.values())
+
+    print(f"=== Búsqueda en corpus ({args.algo.upper()}) ===")
+    print(f"Directorio: {directory}  |  {len(texts)} libros, {total_chars:,} caracteres")
+    print(f"Patrones ({len(patterns)}): {patterns}")
+    print(f"Núcleos disponibles: {os.cpu_count()}\n")
+
+    t0 = time.perf_counter()
+    serial = search_serial(texts, patterns, args.algo)
+    t_serial = time.perf_counter() - t0
+
+    final = apply_whole_words(texts, serial) if WHOLE_WORDS_ONLY else serial
+    for book, per_pat in final.items():
+        counts = "  ".join(f"{p}={len(pos)}" for p, pos in per_pat.items())
+        print(f"{book:<24} {counts}")
+
+    print(f"\n{'workers':>8} {'tiempo (s)':>12} {'speedup':>9}")
+    print("-" * 32)
+    print(f"{'serial':>8} {t_serial:>12.3f} {1.0:>8.2f}x")
+    for w in args.workers:
+        t0 = time.perf_counter()
+        res = search_parallel(texts, patterns, args.algo, workers=w)
+        t_par = time.perf_counter() - t0
+        assert res == serial, f"Resultados distintos con {w} workers"
+        print(f"{w:>8} {t_par:>12.3f} {t_serial / t_par:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
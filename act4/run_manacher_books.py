@@ -2,15 +2,18 @@
 # Ejecuta Manacher sobre todos los .txt en ./books,
 # limpia encabezados/pies de Gutenberg, filtra para palíndromos “reales”,
 # mide tiempo y muestra resultados con palíndromo y contexto.
+# La limpieza (base y texto filtrado + map_idx) se guarda en la caché de text_cache.py.
 
 import re
 import time
 import unicodedata
 from pathlib import Path
 from typing import Tuple, List
-from manacher import manacher_longest_palindrome
+from manacher import palindrome_profile
+from text_cache import cached_text
 
 BOOKS_DIR = Path(__file__).parent / "books"
+TOP_K = 5
 
 HEADER_RE = re.compile(r"\*\*\*\s*START OF.*?\*\*\*", re.IGNORECASE | re.DOTALL)
 FOOTER_RE = re.compile(r"\*\*\*\s*END OF.*", re.IGNORECASE | re.DOTALL)
@@ -50,21 +53,37 @@ def build_filtered(text: str) -> Tuple[str, List[int]]:
     return "".join(clean_chars), map_idx
 
 
-def analyze_book(path: Path, min_len: int = 7):
-    raw = path.read_text(encoding="utf-8", errors="ignore")
-    base = strip_gutenberg_boilerplate(raw)
-    base = normalize_basic(base)
+CLEAN_VERSION = 1     # subir al cambiar la limpieza (base o filtrado): invalida la caché
+
+
+def load_base(path: Path) -> str:
+    def build():
+        raw = path.read_text(encoding="utf-8", errors="ignore")
+        return normalize_basic(strip_gutenberg_boilerplate(raw)), None, {}
+    return cached_text(path, "manacher_base", build, version=CLEAN_VERSION).text
+
 
-    clean, map_idx = build_filtered(base)
+def load_filtered(path: Path, base: str) -> Tuple[str, List[int]]:
+    entry = cached_text(path, "manacher_clean", lambda: (*build_filtered(base), {}),
+                        version=CLEAN_VERSION)
+    return entry.text, entry.map_idx
+
+
+def analyze_book(path: Path, min_len: int = 7):
+    base = load_base(path)
+    clean, map_idx = load_filtered(path, base)
 
+    # Un solo Manacher da el más largo y el perfil completo
     t0 = time.perf_counter()
-    pal_clean, start_clean, length = manacher_longest_palindrome(clean)
+    prof = palindrome_profile(clean, min_len=min_len, top_k=TOP_K)
     t1 = time.perf_counter()
+    start_clean, length = prof["longest"]
 
     if length < min_len:
         print("=" * 80)
         print(f"Book: {path.name}")
         print(f"No se encontró palíndromo (limpio) con longitud >= {min_len}")
+        print(f"Palindromic substrings (clean): {prof['total']:,}")
         print(f"Tiempo: {(t1 - t0)*1000:.2f} ms\n")
         return
 
@@ -86,6 +105,11 @@ def analyze_book(path: Path, min_len: int = 7):
     print(palindrome)
     print("Context  (≈120 chars and palindrome inside []):")
     print(context)
+    print(f"Palindromic substrings (clean): {prof['total']:,}")
+    print(f"Maximal palindromes with length >= {min_len}: {len(prof['maximal']):,}")
+    print(f"Top {len(prof['top'])} distinct maximal palindromes (clean):")
+    for li, st, pal in prof["top"]:
+        print(f"  {li:>4}  @ {st:,}: {pal}")
     print()
 
 
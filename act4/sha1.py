@@ -1,70 +1,238 @@
 # sha1_from_scratch_demo.py
 # Implementación pura de SHA-1 (FIPS 180-4) + demo visual en consola
 # No usa hashlib.
+# API: sha1_bytes(msg) (un solo mensaje), SHA1() incremental (update/digest
+# sobre memoryview, sin copiar bloques) y sha1_many(mensajes) por lotes:
+# los mensajes del mismo largo se hashean juntos con sha1_many_np (NumPy,
+# un carril por mensaje).
+# La verificación contra hashlib y el throughput están en sha1_check.py.
 
-from typing import Iterable
+import struct
+from typing import Iterable, List
+
+import numpy as np
 
 # ----------------- SHA-1 puro -----------------
 
-def _rol(x: int, n: int) -> int:
-    return ((x << n) | (x >> (32 - n))) & 0xFFFFFFFF
+_H0 = (0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0)
+_W16 = struct.Struct(">16I")
 
-def sha1_bytes(msg: bytes) -> bytes:
-    # Constantes iniciales (h0..h4)
-    h0 = 0x67452301
-    h1 = 0xEFCDAB89
-    h2 = 0x98BADCFE
-    h3 = 0x10325476
-    h4 = 0xC3D2E1F0
-
-    # Preprocesamiento: padding
-    ml = len(msg) * 8  # longitud en bits
-    msg += b"\x80"
-    # Relleno con ceros hasta que len ≡ 56 (mod 64)
-    while (len(msg) % 64) != 56:
-        msg += b"\x00"
-    # Añadir longitud original (64 bits big-endian)
-    msg += ml.to_bytes(8, "big")
+def _compress(h: tuple, buf, off: int = 0) -> tuple:
+    """
+    Procesa UN bloque de 64 bytes que empieza en buf[off] (bytes, bytearray
+    o memoryview: struct lee directo del buffer, sin rebanar ni copiar).
+    Retorna el nuevo estado (h0..h4).
+    """
+    w = list(_W16.unpack_from(buf, off))
+    # Extender a 80 palabras
+    for t in range(16, 80):
+        x = w[t-3] ^ w[t-8] ^ w[t-14] ^ w[t-16]
+        w.append(((x << 1) | (x >> 31)) & 0xFFFFFFFF)
+
+    a, b, c, d, e = h
+    # Las 4 rondas de 20 pasos, sin ramas ni búsquedas globales dentro del ciclo
+    for wt in w[0:20]:
+        a, b, c, d, e = ((((a << 5) | (a >> 27)) + ((b & c) | ((~b) & d)) + e + 0x5A827999 + wt) & 0xFFFFFFFF,
+                         a, ((b << 30) | (b >> 2)) & 0xFFFFFFFF, c, d)
+    for wt in w[20:40]:
+        a, b, c, d, e = ((((a << 5) | (a >> 27)) + (b ^ c ^ d) + e + 0x6ED9EBA1 + wt) & 0xFFFFFFFF,
+                         a, ((b << 30) | (b >> 2)) & 0xFFFFFFFF, c, d)
+    for wt in w[40:60]:
+        a, b, c, d, e = ((((a << 5) | (a >> 27)) + ((b & c) | (d & (b | c))) + e + 0x8F1BBCDC + wt) & 0xFFFFFFFF,
+                         a, ((b << 30) | (b >> 2)) & 0xFFFFFFFF, c, d)
+    for wt in w[60:80]:
+        a, b, c, d, e = ((((a << 5) | (a >> 27)) + (b ^ c ^ d) + e + 0xCA62C1D6 + wt) & 0xFFFFFFFF,
+                         a, ((b << 30) | (b >> 2)) & 0xFFFFFFFF, c, d)
+
+    return ((h[0] + a) & 0xFFFFFFFF, (h[1] + b) & 0xFFFFFFFF, (h[2] + c) & 0xFFFFFFFF,
+            (h[3] + d) & 0xFFFFFFFF, (h[4] + e) & 0xFFFFFFFF)
+
+def _padding(length: int) -> bytes:
+    # 0x80, ceros hasta len ≡ 56 (mod 64) y la longitud en bits (64 bits big-endian)
+    return b"\x80" + b"\x00" * ((55 - length) % 64) + (length * 8).to_bytes(8, "big")
+
+def _digest(h: tuple) -> bytes:
+    return struct.pack(">5I", *h)
+
+class SHA1:
+    """
+    Hasher incremental, con la misma interfaz básica que hashlib:
+    update(datos) / digest() / hexdigest() / copy().
+
+    update() acepta cualquier objeto con buffer protocol (bytes, bytearray,
+    memoryview, mmap, ...). Los bloques completos se procesan directo desde
+    el memoryview; sólo se copia el resto (< 64 bytes) al buffer interno.
+    """
+    name = "sha1"
+    digest_size = 20
+    block_size = 64
+
+    def __init__(self, data=b""):
+        self._h = _H0
+        self._buf = bytearray()
+        self._len = 0
+        if data:
+            self.update(data)
+
+    def update(self, data) -> None:
+        mv = memoryview(data).cast("B")
+        n = len(mv)
+        self._len += n
+        off = 0
+        h = self._h
+        if self._buf:
+            take = min(64 - len(self._buf), n)
+            self._buf += mv[:take]
+            off = take
+            if len(self._buf) < 64:
+                return
+            h = _compress(h, self._buf)
+            self._buf.clear()
+        last = n - 64
+        while off <= last:
+            h = _compress(h, mv, off)
+            off += 64
+        self._h = h
+        if off < n:
+            self._buf += mv[off:]
+
+    def digest(self) -> bytes:
+        # No modifica el estado: se puede seguir llamando update() después
+        tail = bytes(self._buf) + _padding(self._len)
+        h = self._h
+        for off in range(0, len(tail), 64):
+            h = _compress(h, tail, off)
+        return _digest(h)
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
 
+    def copy(self) -> "SHA1":
+        other = SHA1.__new__(SHA1)
+        other._h = self._h
+        other._buf = bytearray(self._buf)
+        other._len = self._len
+        return other
+
+def sha1_bytes(msg: bytes) -> bytes:
+    # Preprocesamiento: padding en una sola concatenación
+    msg = bytes(msg) + _padding(len(msg))
     # Procesar en bloques de 512 bits (64 bytes)
-    for chunk_start in range(0, len(msg), 64):
-        chunk = msg[chunk_start:chunk_start + 64]
-        # Romper en 16 palabras de 32 bits big-endian
-        w = [int.from_bytes(chunk[i:i+4], "big") for i in range(0, 64, 4)]
-        # Extender a 80 palabras
+    h = _H0
+    for off in range(0, len(msg), 64):
+        h = _compress(h, msg, off)
+    return _digest(h)
+
+# ----------------- SHA-1 vectorizado (NumPy) -----------------
+
+_H0_NP = np.array([0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0], dtype=np.uint32)
+_ROUNDS_NP = [
+    (0, 20, np.uint32(0x5A827999)),
+    (20, 40, np.uint32(0x6ED9EBA1)),
+    (40, 60, np.uint32(0x8F1BBCDC)),
+    (60, 80, np.uint32(0xCA62C1D6)),
+]
+LANES_NP = 1 << 16  # carriles por tanda (acota la memoria del schedule: 80 x LANES x 4 B)
+MIN_LANES_NP = 32   # con menos mensajes del mismo largo gana el lazo escalar
+
+def _rol_np(x: np.ndarray, n: int) -> np.ndarray:
+    return (x << np.uint32(n)) | (x >> np.uint32(32 - n))
+
+def sha1_blocks_np(words: np.ndarray) -> np.ndarray:
+    """
+    words: (lanes, 16 * nbloques) uint32, mensajes YA con padding (big-endian
+    decodificado). Retorna el estado final (lanes, 5) uint32.
+    """
+    lanes = words.shape[0]
+    h = np.tile(_H0_NP[:, None], (1, lanes))          # (5, lanes)
+    w = np.empty((80, lanes), dtype=np.uint32)
+    for off in range(0, words.shape[1], 16):
+        w[:16] = words[:, off:off + 16].T
         for t in range(16, 80):
-            w.append(_rol(w[t-3] ^ w[t-8] ^ w[t-14] ^ w[t-16], 1))
-
-        a, b, c, d, e = h0, h1, h2, h3, h4
-
-        for t in range(80):
-            if 0 <= t <= 19:
-                f = (b & c) | ((~b) & d)
-                k = 0x5A827999
-            elif 20 <= t <= 39:
-                f = b ^ c ^ d
-                k = 0x6ED9EBA1
-            elif 40 <= t <= 59:
-                f = (b & c) | (b & d) | (c & d)
-                k = 0x8F1BBCDC
-            else:  # 60..79
-                f = b ^ c ^ d
-                k = 0xCA62C1D6
-
-            temp = (_rol(a, 5) + f + e + k + w[t]) & 0xFFFFFFFF
-            e = d
-            d = c
-            c = _rol(b, 30)
-            b = a
-            a = temp
-
-        h0 = (h0 + a) & 0xFFFFFFFF
-        h1 = (h1 + b) & 0xFFFFFFFF
-        h2 = (h2 + c) & 0xFFFFFFFF
-        h3 = (h3 + d) & 0xFFFFFFFF
-        h4 = (h4 + e) & 0xFFFFFFFF
-
-    return b"".join(h.to_bytes(4, "big") for h in (h0, h1, h2, h3, h4))
+            w[t] = _rol_np(w[t-3] ^ w[t-8] ^ w[t-14] ^ w[t-16], 1)
+
+        a, b, c, d, e = h.copy()
+        for lo, hi, k in _ROUNDS_NP:
+            for t in range(lo, hi):
+                if lo == 0:
+                    f = (b & c) | (~b & d)
+                elif lo == 40:
+                    f = (b & c) | (d & (b | c))
+                else:
+                    f = b ^ c ^ d
+                temp = _rol_np(a, 5) + f + e + k + w[t]
+                e, d, c, b, a = d, c, _rol_np(b, 30), a, temp
+        h += np.stack((a, b, c, d, e))
+    return h.T
+
+def _pad_same_length(data: np.ndarray, L: int) -> np.ndarray:
+    # data: (n, >= L) uint8, todos los mensajes miden L bytes.
+    # Padding vectorizado -> (n, 16 * nbloques) uint32
+    n = data.shape[0]
+    total = L + 1 + ((55 - L) % 64) + 8
+    buf = np.zeros((n, total), dtype=np.uint8)
+    buf[:, :L] = data[:, :L]
+    buf[:, L] = 0x80
+    buf[:, -8:] = np.frombuffer((L * 8).to_bytes(8, "big"), dtype=np.uint8)
+    return buf.view(">u4").astype(np.uint32)
+
+def sha1_many_np(msgs) -> np.ndarray:
+    """
+    SHA-1 de muchos mensajes (lista de bytes o arreglo NumPy "S<k>", como el
+    de generate_unique_strings_np en sha1_bench.py). Se agrupan por largo (mismo largo => mismo
+    número de bloques y mismo padding) y cada grupo se hashea por tandas de
+    LANES_NP carriles. Retorna (n, 20) uint8 en el orden de entrada.
+    """
+    fixed = isinstance(msgs, np.ndarray)
+    if fixed:
+        # Ancho fijo: el largo real es hasta el primer byte nulo final
+        lengths = np.char.str_len(msgs).astype(np.int64)
+        mat = msgs.view(np.uint8).reshape(len(msgs), msgs.dtype.itemsize)
+    else:
+        lengths = np.fromiter(map(len, msgs), dtype=np.int64, count=len(msgs))
+    out = np.empty((len(msgs), 5), dtype=np.uint32)
+    for L in np.unique(lengths).tolist():
+        idx = np.flatnonzero(lengths == L)
+        for s in range(0, idx.size, LANES_NP):
+            part = idx[s:s + LANES_NP]
+            if fixed:
+                data = mat[part]
+            else:
+                data = np.frombuffer(b"".join([msgs[i] for i in part.tolist()]),
+                                     dtype=np.uint8).reshape(part.size, L)
+            out[part] = sha1_blocks_np(_pad_same_length(data, L))
+    return out.astype(">u4").view(np.uint8).reshape(-1, 20)
+
+
+def sha1_many(messages: Iterable[bytes]) -> List[bytes]:
+    """
+    Hashea muchos mensajes en un solo llamado (mismo resultado que sha1_bytes en ciclo).
+    Los largos con al menos MIN_LANES_NP mensajes van por sha1_many_np: las 80
+    rondas corren una vez para todo el grupo en lugar de una vez por mensaje.
+    El resto (largos sueltos) usa _compress escalar.
+    """
+    msgs = [bytes(m) for m in messages]
+    out: List[bytes] = [b""] * len(msgs)
+    groups = {}
+    for i, m in enumerate(msgs):
+        groups.setdefault(len(m), []).append(i)
+    lanes = [i for idx in groups.values() if len(idx) >= MIN_LANES_NP for i in idx]
+    if lanes:
+        raw = sha1_many_np([msgs[i] for i in lanes]).tobytes()
+        for k, i in enumerate(lanes):
+            out[i] = raw[20 * k:20 * k + 20]
+
+    compress, pack, h0 = _compress, struct.Struct(">5I").pack, _H0
+    for idx in groups.values():
+        if len(idx) >= MIN_LANES_NP:
+            continue
+        for i in idx:
+            buf = msgs[i] + _padding(len(msgs[i]))
+            h = h0
+            for off in range(0, len(buf), 64):
+                h = compress(h, buf, off)
+            out[i] = pack(*h)
+    return out
 
 def sha1_hex(s: str) -> str:
     return sha1_bytes(s.encode("utf-8")).hex()
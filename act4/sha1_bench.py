@@ -2,10 +2,42 @@
 # Benchmark de SHA-1 "from scratch" con 200,000 strings aleatorios (4-8, a-z,0-9)
 # - Tiempo total de hashing
 # - Número de colisiones (hash iguales con strings distintos)
+# Modos (--mode):
+#   scalar:  sha1_bytes, un string a la vez (implementación original)
+#   numpy:   SHA-1 vectorizado (sha1_many_np de sha1.py); mensajes con el
+#            mismo número de bloques se empacan en arreglos uint32 y las 80
+#            rondas corren sobre todos los carriles a la vez (la aritmética
+#            uint32 de NumPy ya es módulo 2^32)
+#   compare: ambos, con speedup y verificación bit a bit contra sha1_bytes
+# --workers N: shards disjuntos generados y hasheados en un ProcessPoolExecutor.
+#   Cada shard es dueño de una parte del espacio de claves (los pares de
+#   caracteres iniciales con índice % shards == shard), así ningún string se
+#   repite entre shards.
+#   Cada worker guarda (digest de 20 bytes, string) en un arreglo estructurado
+#   ordenado por digest (.npy temporal); las colisiones se cuentan con un merge
+#   k-way de los shards leídos por trozos con mmap. La memoria por worker queda
+#   acotada por --shard-size, no por N.
+# --gen python|numpy: generador de strings únicos. Por defecto python (el
+#   original, random.choice + set con random.seed(42)): mismos strings que el
+#   benchmark de siempre, así colisiones y tiempos siguen siendo comparables.
+#   numpy (vectorizado por lotes) es opcional y genera OTRO conjunto de
+#   strings, también reproducible con --seed.
+#
+# Uso: python sha1_bench.py [--mode scalar|numpy|compare] [--n 200000] [--check 10000]
+#                           [--workers N] [--shard-size 1000000] [--gen python|numpy] [--seed 42]
 
+import argparse
+import heapq
 import random
+import tempfile
 import time
-from typing import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from sha1 import sha1_many_np
 
 # ----------------- SHA-1 (implementación propia, sin hashlib) -----------------
 
@@ -57,15 +89,15 @@ def sha1_bytes(msg: bytes) -> bytes:
 def sha1_hex(s: str) -> str:
     return sha1_bytes(s.encode("utf-8")).hex()
 
-# ----------------- Generación de strings aleatorios únicos -----------------
 
-def generate_unique_strings(n: int, characters: str = "abcdefghijklmnopqrstuvwxyz0123456789") -> list[str]:
+def generate_unique_strings(n: int, characters: str = "abcdefghijklmnopqrstuvwxyz0123456789",
+                            seed: int = 42) -> list[str]:
     """
     Genera n cadenas únicas de longitud entre 4 y 8, usando 'characters'.
     """
     seen = set()
     out = []
-    random.seed(42)
+    random.seed(seed)
     while len(out) < n:
         length = random.randint(4, 8)
         s = "".join(random.choice(characters) for _ in range(length))
@@ -74,6 +106,75 @@ def generate_unique_strings(n: int, characters: str = "abcdefghijklmnopqrstuvwxy
             out.append(s)
     return out
 
+# Versión vectorizada: se sortean matrices de bytes con numpy.random.Generator,
+# se mapean al alfabeto y los repetidos se quitan con np.unique sobre arreglos
+# "S8" de ancho fijo (los bytes después del largo quedan en 0). Para ordenar y
+# comparar, cada string de 8 bytes se ve como un uint64 big-endian (mismo
+# orden que los bytes). Los strings ya emitidos se guardan en corridas
+# ordenadas (np.searchsorted para consultar; se fusionan cuando una corrida
+# alcanza a la anterior): 8 bytes por string en lugar de un set de objetos str.
+
+GEN_BATCH = 1 << 18
+
+def iter_unique_batches(n: int, characters: str = "abcdefghijklmnopqrstuvwxyz0123456789",
+                        seed: int = 42, batch: int = GEN_BATCH,
+                        part: Optional[Tuple[int, int]] = None) -> Iterator[np.ndarray]:
+    """
+    Modo streaming: produce lotes "S8" de strings únicos (también entre lotes)
+    de longitud 4-8 hasta completar n. El resultado depende sólo de (seed, batch, part).
+    part=(i, partes): sólo strings cuyo par de caracteres iniciales tiene índice
+    (c0 * A + c1) % partes == i; particiones distintas nunca comparten strings.
+    """
+    alphabet = np.frombuffer(characters.encode("ascii"), dtype=np.uint8)
+    A = len(alphabet)
+    owned = None
+    if part is not None:
+        owned = np.arange(part[0], A * A, part[1])
+        if owned.size == 0:
+            raise ValueError(f"No se puede partir el espacio de claves en {part[1]} partes (máx. {A * A})")
+    pairs = A * A if owned is None else owned.size
+    if n > pairs * sum(A ** (L - 2) for L in range(4, 9)):
+        raise ValueError(f"No existen {n} strings distintos de largo 4-8 con {characters!r}")
+    rng = np.random.default_rng(seed if part is None else [seed, part[0]])
+    cols = np.arange(8)
+    runs: List[np.ndarray] = []
+    done = 0
+    while done < n:
+        size = min(batch, n - done)
+        lengths = rng.integers(4, 9, size=size, dtype=np.uint8)
+        mat = alphabet[rng.integers(0, len(alphabet), size=(size, 8), dtype=np.uint8)]
+        if owned is not None:
+            pair = owned[rng.integers(0, owned.size, size=size)]
+            mat[:, 0] = alphabet[pair // A]
+            mat[:, 1] = alphabet[pair % A]
+        mat[cols[None, :] >= lengths[:, None]] = 0
+        keys = mat.view(">u8").ravel().astype(np.uint64)
+
+        # Únicos dentro del lote; se consultan las corridas con los únicos ya
+        # ordenados (searchsorted con agujas ordenadas es mucho más rápido)
+        uniq, first = np.unique(keys, return_index=True)
+        fresh = np.ones(uniq.size, dtype=bool)
+        for run in runs:
+            pos = np.searchsorted(run, uniq)
+            fresh &= run[np.minimum(pos, len(run) - 1)] != uniq
+        # Quitar los ya emitidos en lotes anteriores, conservando el orden de sorteo
+        keys = keys[np.sort(first[fresh])][:n - done]
+        if keys.size == 0:
+            continue
+
+        runs.append(np.sort(keys))
+        while len(runs) > 1 and len(runs[-1]) >= len(runs[-2]):
+            top = runs.pop()
+            runs[-1] = np.sort(np.concatenate((runs[-1], top)))
+        done += keys.size
+        yield keys.astype(">u8").view("S8")
+
+def generate_unique_strings_np(n: int, characters: str = "abcdefghijklmnopqrstuvwxyz0123456789",
+                               seed: int = 42, batch: int = GEN_BATCH) -> np.ndarray:
+    """Como generate_unique_strings, vectorizado; retorna un arreglo "S8"."""
+    parts = list(iter_unique_batches(n, characters, seed, batch))
+    return np.concatenate(parts) if parts else np.zeros(0, dtype="S8")
+
 # ----------------- Benchmark -----------------
 
 def benchmark_sha1(strings: Iterable[str]):
@@ -98,19 +199,161 @@ def benchmark_sha1(strings: Iterable[str]):
     distinct = len(seen_hash_to_str)
     return elapsed, collisions, distinct, total
 
-# ----------------- Main -----------------
+def benchmark_sha1_np(strings: List[str]):
+    """Igual que benchmark_sha1, con el hashing hecho por sha1_many_np."""
+    start = time.perf_counter()
+    digests = sha1_many_np([s.encode("utf-8") for s in strings])
+    t_hash = time.perf_counter() - start
 
-if __name__ == "__main__":
-    N = 200_000
-    print(f"Generando {N} strings aleatorios únicos (a-z0-9, long 4-8)...")
-    st = generate_unique_strings(N)
+    seen_hash_to_str: dict[bytes, str] = {}
+    collisions = 0
+    for s, h in zip(strings, digests.view("S20").ravel().tolist()):
+        prev = seen_hash_to_str.setdefault(h, s)
+        if prev != s:
+            collisions += 1
+
+    elapsed = time.perf_counter() - start
+    return elapsed, collisions, len(seen_hash_to_str), len(strings), t_hash, digests
+
+def check_agreement(strings: List[str], digests: np.ndarray, sample: int) -> int:
+    """Compara sha1_many_np contra sha1_bytes (todos si sample <= 0). Retorna cuántos se revisaron."""
+    idx = range(len(strings))
+    if 0 < sample < len(strings):
+        idx = sorted(random.Random(0).sample(idx, sample))
+    for i in idx:
+        ref = sha1_bytes(strings[i].encode("utf-8"))
+        assert digests[i].tobytes() == ref, f"Diferencia en {strings[i]!r}"
+    return len(idx)
+
+# ----------------- Benchmark multiproceso por shards -----------------
 
-    print("Ejecutando benchmark SHA-1 (implementación propia)...")
-    t, col, distinct, total = benchmark_sha1(st)
+SHARD_SIZE = 1_000_000
+MERGE_CHUNK = 1 << 16  # filas leídas por shard en cada paso del merge
+DIGEST_DTYPE = np.dtype([("digest", "S20"), ("s", "S8")])
 
-    print("\n===== Resultados =====")
+def _hash_shard(task: Tuple[int, int, int, int, str]) -> Tuple[str, int, float]:
+    """Genera y hashea un shard; guarda (digest, string) ordenado por digest en un .npy."""
+    shard, shards, size, seed, out_dir = task
+    t0 = time.perf_counter()
+    rec = np.empty(size, dtype=DIGEST_DTYPE)
+    done = 0
+    for strings in iter_unique_batches(size, seed=seed, part=(shard, shards)):
+        k = len(strings)
+        rec["digest"][done:done + k] = sha1_many_np(strings).view("S20").ravel()
+        rec["s"][done:done + k] = strings
+        done += k
+    rec = rec[np.argsort(rec["digest"], kind="stable")]
+    path = str(Path(out_dir) / f"shard_{shard:05d}.npy")
+    np.save(path, rec)
+    return path, len(rec), time.perf_counter() - t0
+
+def _iter_shard(path: str) -> Iterator[Tuple[bytes, bytes]]:
+    rec = np.load(path, mmap_mode="r")
+    for i in range(0, len(rec), MERGE_CHUNK):
+        part = rec[i:i + MERGE_CHUNK]
+        yield from zip(part["digest"].tolist(), part["s"].tolist())
+
+def merge_collisions(paths: List[str]) -> Tuple[int, int]:
+    """
+    Merge k-way de shards ordenados por digest. Con la misma semántica que el
+    dict de benchmark_sha1: cada aparición de un digest ya visto con un string
+    distinto al primero es una colisión (los shards son disjuntos, así que
+    dos filas con el mismo digest siempre tienen strings distintos).
+    Retorna (colisiones, digests distintos).
+    """
+    collisions = distinct = 0
+    prev_d, first_s = None, None
+    for d, s in heapq.merge(*(_iter_shard(p) for p in paths)):
+        if d != prev_d:
+            prev_d, first_s = d, s
+            distinct += 1
+            continue
+        if s != first_s:
+            collisions += 1
+    return collisions, distinct
+
+def benchmark_sharded(n: int, workers: int, shard_size: int = SHARD_SIZE, seed: int = 42):
+    shards = max(workers, -(-n // shard_size))
+    if shards > 36 * 36:
+        raise ValueError(f"Demasiados shards ({shards}); usa un --shard-size mayor")
+    base, extra = divmod(n, shards)
+    sizes = [base + (i < extra) for i in range(shards)]
+
+    with tempfile.TemporaryDirectory(prefix="sha1_shards_") as tmp:
+        tasks = [(i, shards, size, seed, tmp) for i, size in enumerate(sizes) if size]
+        t0 = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            done = list(ex.map(_hash_shard, tasks))
+        t_hash = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        collisions, distinct = merge_collisions([p for p, _, _ in done])
+        t_merge = time.perf_counter() - t0
+    return t_hash, t_merge, collisions, distinct, sum(c for _, c, _ in done), len(tasks)
+
+def print_results(title: str, t: float, col: int, distinct: int, total: int):
+    print(f"\n===== Resultados ({title}) =====")
     print(f"Total de strings:        {total:,}")
     print(f"Strings distintos:       {distinct:,}")
     print(f"Colisiones SHA-1:        {col:,}")
     print(f"Tiempo total hashing:    {t:.3f} s")
     print(f"Throughput aproximado:   {total / t:,.0f} hashes/seg")
+
+# ----------------- Main -----------------
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark de SHA-1 propio con strings aleatorios únicos")
+    ap.add_argument("--mode", choices=["scalar", "numpy", "compare"], default="scalar")
+    ap.add_argument("--n", type=int, default=200_000, help="número de strings")
+    ap.add_argument("--check", type=int, default=10_000,
+                    help="strings a verificar contra sha1_bytes en modo numpy/compare (0 = todos)")
+    ap.add_argument("--workers", type=int, default=0,
+                    help="procesos para el benchmark por shards (0 = desactivado)")
+    ap.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="strings por shard")
+    ap.add_argument("--gen", choices=["python", "numpy"], default="python",
+                    help="generador de strings para --mode (python = random.choice + set, el original)")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    N = args.n
+    if args.workers > 0:
+        print(f"Benchmark por shards: {N:,} strings, {args.workers} workers, "
+              f"shards de hasta {args.shard_size:,}...")
+        t_hash, t_merge, col, distinct, total, shards = benchmark_sharded(
+            N, args.workers, args.shard_size, args.seed)
+        t = t_hash + t_merge
+        print(f"\n===== Resultados (shards, {args.workers} workers) =====")
+        print(f"Total de strings:        {total:,}  ({shards} shards)")
+        print(f"Digests distintos:       {distinct:,}")
+        print(f"Colisiones SHA-1:        {col:,}")
+        print(f"Generar + hashear:       {t_hash:.3f} s")
+        print(f"Merge k-way:             {t_merge:.3f} s")
+        print(f"Throughput aproximado:   {total / t:,.0f} strings/seg")
+        return
+
+    print(f"Generando {N} strings aleatorios únicos (a-z0-9, long 4-8, generador {args.gen})...")
+    t0 = time.perf_counter()
+    if args.gen == "numpy":
+        st = [b.decode("ascii") for b in generate_unique_strings_np(N, seed=args.seed).tolist()]
+    else:
+        st = generate_unique_strings(N, seed=args.seed)
+    print(f"Generación: {time.perf_counter() - t0:.3f} s")
+
+    t_scalar = None
+    if args.mode in ("scalar", "compare"):
+        print("Ejecutando benchmark SHA-1 (implementación propia)...")
+        t_scalar, col, distinct, total = benchmark_sha1(st)
+        print_results("escalar", t_scalar, col, distinct, total)
+
+    if args.mode in ("numpy", "compare"):
+        print("\nEjecutando benchmark SHA-1 (NumPy, carriles en paralelo)...")
+        t, col, distinct, total, t_hash, digests = benchmark_sha1_np(st)
+        print_results("NumPy", t, col, distinct, total)
+        print(f"Sólo hashing vectorizado: {t_hash:.3f} s")
+        checked = check_agreement(st, digests, args.check)
+        print(f"Verificación bit a bit:  {checked:,} digests idénticos a sha1_bytes")
+        if t_scalar is not None:
+            print(f"Speedup NumPy vs escalar: {t_scalar / t:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# sha1_check.py
+# Verifica sha1.py contra hashlib.sha1 y mide su throughput.
+# - Mensajes aleatorios (incluye los largos frontera 55/56/63/64/65 del padding).
+# - SHA1.update() con trozos de tamaño aleatorio pasados como memoryview.
+# - sha1_many() contra hashlib mensaje por mensaje, con largos sueltos (lazo
+#   escalar) y con lotes del mismo largo (carriles de sha1_many_np).
+# Throughput: MB/s con un mensaje grande (update por trozos) y hashes/s con
+# muchos mensajes cortos (sha1_bytes en ciclo vs sha1_many; hashlib como referencia).
+#
+# Uso: python sha1_check.py [--cases 2000] [--mb 4] [--n 100000]
+
+import argparse
+import hashlib
+import random
+import time
+
+from sha1 import MIN_LANES_NP, SHA1, sha1_bytes, sha1_many
+
+SEED = 42
+CHUNK = 64 * 1024
+BOUNDARY_LENGTHS = [0, 1, 55, 56, 57, 63, 64, 65, 119, 120, 127, 128, 129, 1000]
+
+
+def check(cases: int) -> None:
+    rng = random.Random(SEED)
+    lengths = BOUNDARY_LENGTHS + [rng.randint(0, 4096) for _ in range(cases)]
+    msgs = [rng.randbytes(L) for L in lengths]
+
+    for m in msgs:
+        ref = hashlib.sha1(m).digest()
+        assert sha1_bytes(m) == ref, f"sha1_bytes difiere (largo {len(m)})"
+
+        h = SHA1()
+        mv, i = memoryview(m), 0
+        while i < len(m):
+            step = rng.randint(0, 200)
+            h.update(mv[i:i + step])
+            i += step
+        assert h.digest() == ref, f"SHA1.update difiere (largo {len(m)})"
+        # digest() no altera el estado
+        assert h.hexdigest() == ref.hex()
+
+    assert sha1_many(msgs) == [hashlib.sha1(m).digest() for m in msgs], "sha1_many difiere"
+    # Lotes del mismo largo, mezclados con los sueltos: van por los carriles NumPy
+    lanes = [rng.randbytes(L) for L in BOUNDARY_LENGTHS for _ in range(MIN_LANES_NP)]
+    mixed = lanes + msgs
+    rng.shuffle(mixed)
+    assert sha1_many(mixed) == [hashlib.sha1(m).digest() for m in mixed], "sha1_many (NumPy) difiere"
+    print(f"OK: {len(msgs):,} mensajes aleatorios coinciden con hashlib.sha1 "
+          f"(sha1_bytes, SHA1.update por trozos, sha1_many)")
+    print(f"OK: sha1_many con {len(lanes):,} mensajes más en lotes del mismo largo (carriles NumPy)")
+
+
+def throughput(mb: int, n: int) -> None:
+    rng = random.Random(SEED)
+    big = rng.randbytes(mb * 1_000_000)
+
+    print(f"\n=== Throughput, mensaje de {mb} MB (update por trozos de {CHUNK // 1024} KB) ===")
+    t0 = time.perf_counter()
+    h = SHA1()
+    mv = memoryview(big)
+    for i in range(0, len(big), CHUNK):
+        h.update(mv[i:i + CHUNK])
+    d = h.digest()
+    t_own = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    ref = hashlib.sha1(big).digest()
+    t_lib = time.perf_counter() - t0
+    assert d == ref
+    print(f"{'SHA1.update':<16} {mb / t_own:>10.2f} MB/s")
+    print(f"{'hashlib.sha1':<16} {mb / t_lib:>10.2f} MB/s")
+
+    msgs = [rng.randbytes(rng.randint(4, 40)) for _ in range(n)]
+    print(f"\n=== Throughput, {n:,} mensajes cortos (4..40 bytes) ===")
+    t0 = time.perf_counter()
+    loop = [sha1_bytes(m) for m in msgs]
+    t_loop = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    batch = sha1_many(msgs)
+    t_batch = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    ref = [hashlib.sha1(m).digest() for m in msgs]
+    t_lib = time.perf_counter() - t0
+    assert loop == batch == ref
+    print(f"{'sha1_bytes (ciclo)':<20} {n / t_loop:>12,.0f} hashes/s")
+    print(f"{'sha1_many':<20} {n / t_batch:>12,.0f} hashes/s  ({t_loop / t_batch:.2f}x)")
+    print(f"{'hashlib.sha1':<20} {n / t_lib:>12,.0f} hashes/s")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Verificación y throughput de sha1.py")
+    ap.add_argument("--cases", type=int, default=2000, help="mensajes aleatorios a verificar")
+    ap.add_argument("--mb", type=int, default=4, help="MB del mensaje grande")
+    ap.add_argument("--n", type=int, default=100_000, help="mensajes cortos")
+    args = ap.parse_args()
+    check(args.cases)
+    throughput(args.mb, args.n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# suffix_array.py
+# Índice persistente de arreglo de sufijos (SA) + LCP para los libros de ./books.
+# - SA por duplicación de prefijos (prefix doubling) sobre un arreglo NumPy.
+# - LCP con el algoritmo de Kasai.
+# - Se guarda junto al libro (<libro>.txt.sa.npy, .lcp.npy) y se abre
+#   con memory-map, así cada consulta es una búsqueda binaria O(m log n).
+#   El texto normalizado sale de la caché compartida (text_cache.py).
+#
+# Uso: python suffix_array.py [patrón ...]
+
+import sys
+import time
+from pathlib import Path
+from typing import List, Sequence
+
+import numpy as np
+
+from kmp import (
+    BOOK_PATH, PATTERNS, WHOLE_WORDS_ONLY, CTX_RADIUS, MAX_CONTEXTS, MAX_POS_PRINT,
+    normalize_lower_ascii, load_normalized, filter_whole_word_matches, contexts, pretty_positions,
+)
+
+
+# Construcción
+def build_suffix_array(codes: np.ndarray) -> np.ndarray:
+    """
+    Prefix doubling: en la ronda k cada sufijo se ordena por el par
+    (rank[i], rank[i + k]); termina cuando todos los rangos son distintos.
+    O(n log^2 n) con argsort de NumPy. Retorna SA como int32.
+    """
+    n = len(codes)
+    if n == 0:
+        return np.zeros(0, dtype=np.int32)
+    rank = np.unique(codes, return_inverse=True)[1].astype(np.int64).ravel()
+    sa = np.argsort(rank, kind="stable")
+    k = 1
+    while True:
+        second = np.zeros(n, dtype=np.int64)
+        second[:n - k] = rank[k:] + 1          # 0 = "fin del texto"
+        key = rank * (n + 1) + second
+        sa = np.argsort(key, kind="stable")
+        sk = key[sa]
+        new_rank = np.empty(n, dtype=np.int64)
+        new_rank[sa] = np.concatenate(([0], np.cumsum(sk[1:] != sk[:-1])))
+        rank = new_rank
+        if rank[sa[-1]] == n - 1 or k >= n:
+            break
+        k *= 2
+    return sa.astype(np.int32)
+
+
+def build_lcp(codes: Sequence, sa: np.ndarray) -> np.ndarray:
+    """
+    Kasai: lcp[r] = LCP(sufijo sa[r-1], sufijo sa[r]), lcp[0] = 0. O(n).
+    codes: el texto (str) o cualquier secuencia indexable de códigos (p. ej. la
+    lista de enteros del corpus de act5/corpus_substrings.py).
+    """
+    n = len(codes)
+    sa_list = sa.tolist()
+    rank = [0] * n
+    for r, s in enumerate(sa_list):
+        rank[s] = r
+    lcp = [0] * n
+    h = 0
+    for i in range(n):
+        r = rank[i]
+        if r == 0:
+            h = 0
+            continue
+        j = sa_list[r - 1]
+        while i + h < n and j + h < n and codes[i + h] == codes[j + h]:
+            h += 1
+        lcp[r] = h
+        if h > 0:
+            h -= 1
+    return np.array(lcp, dtype=np.int32)
+
+
+# Índice en disco
+class SuffixIndex:
+    """SA + LCP de un libro normalizado, abiertos con memory-map."""
+
+    def __init__(self, text: str, sa: np.ndarray, lcp: np.ndarray):
+        self.text = text
+        self.sa = sa
+        self.lcp = lcp
+
+    @staticmethod
+    def paths(book: Path):
+        return (book.with_name(book.name + ".sa.npy"),
+                book.with_name(book.name + ".lcp.npy"))
+
+    @classmethod
+    def build(cls, book: Path) -> "SuffixIndex":
+        sa_path, lcp_path = cls.paths(book)
+        text = load_normalized(book)
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        sa = build_suffix_array(codes)
+        lcp = build_lcp(text, sa)
+        np.save(sa_path, sa)
+        np.save(lcp_path, lcp)
+        return cls.load(book)
+
+    @classmethod
+    def load(cls, book: Path) -> "SuffixIndex":
+        sa_path, lcp_path = cls.paths(book)
+        text = load_normalized(book)
+        return cls(text,
+                   np.load(sa_path, mmap_mode="r"),
+                   np.load(lcp_path, mmap_mode="r"))
+
+    @classmethod
+    def open(cls, book: Path) -> "SuffixIndex":
+        """Carga el índice; lo (re)construye si no existe o el libro es más nuevo."""
+        mtime = book.stat().st_mtime
+        if all(p.exists() and p.stat().st_mtime >= mtime for p in cls.paths(book)):
+            return cls.load(book)
+        return cls.build(book)
+
+    # Búsqueda O(m log n)
+    def _bounds(self, pattern: str):
+        text, sa, m = self.text, self.sa, len(pattern)
+        lo, hi = 0, len(sa)
+        while lo < hi:                       # primer sufijo >= patrón
+            mid = (lo + hi) // 2
+            s = int(sa[mid])
+            if text[s:s + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+        hi = len(sa)
+        while lo < hi:                       # primer sufijo que ya no empieza con el patrón
+            mid = (lo + hi) // 2
+            s = int(sa[mid])
+            if text[s:s + m] == pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def find(self, pattern: str) -> List[int]:
+        """Mismas posiciones (ordenadas) que find_with_kmp sobre el texto normalizado."""
+        if not pattern:
+            return []
+        a, b = self._bounds(pattern)
+        return sorted(np.asarray(self.sa[a:b]).tolist())
+
+    def count(self, pattern: str) -> int:
+        if not pattern:
+            return 0
+        a, b = self._bounds(pattern)
+        return b - a
+
+    def longest_repeated(self) -> str:
+        """Subcadena repetida más larga (máximo del arreglo LCP)."""
+        if len(self.lcp) == 0:
+            return ""
+        r = int(np.argmax(self.lcp))
+        s = int(self.sa[r])
+        return self.text[s:s + int(self.lcp[r])]
+
+
+# Main
+def run() -> None:
+    patterns = sys.argv[1:] or PATTERNS
+    try:
+        t0 = time.perf_counter()
+        index = SuffixIndex.open(BOOK_PATH)
+        t_open = time.perf_counter() - t0
+    except FileNotFoundError:
+        print(f"Error: no se encontró el archivo: {BOOK_PATH}", file=sys.stderr)
+        sys.exit(1)
+
+    text = index.text
+
+    print("=== Búsqueda con arreglo de sufijos ===")
+    print(f"Archivo: {BOOK_PATH}")
+    print(f"Índice: {len(index.sa):,} sufijos  |  apertura: {t_open * 1000:.2f} ms")
+    print(f"Patrones ({len(patterns)}): {patterns}")
+    print(f"Modo: {'palabras completas' if WHOLE_WORDS_ONLY else 'subcadenas'}\n")
+
+    for pat in patterns:
+        p = normalize_lower_ascii(pat)
+        t0 = time.perf_counter()
+        pos = index.find(p)
+        t_q = time.perf_counter() - t0
+        if WHOLE_WORDS_ONLY:
+            pos = filter_whole_word_matches(text, len(p), pos)
+
+        print(f"Patrón: '{pat}'  |  largo={len(p)}  |  consulta: {t_q * 1000:.3f} ms")
+        print(f"Total de ocurrencias: {len(pos)}")
+        print(f"Primeras posiciones: {pretty_positions(pos, MAX_POS_PRINT)}")
+
+        for p0, frag in contexts(text, pos, len(p), radius=CTX_RADIUS, max_ctx=MAX_CONTEXTS):
+            print(f"  - pos={p0}: …{frag}…")
+        print("-" * 72)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,112 @@
+# text_cache.py
+# Caché de preprocesamiento de textos (normalización, limpieza de Gutenberg, ...).
+# - Llave: ruta del archivo + mtime + tamaño + modo + versión de la función
+#   que construye la entrada (al cambiar la normalización se sube la versión
+#   y las entradas viejas dejan de valer).
+# - Se guarda junto al libro como <libro>.txt.<modo>.cache, en binario:
+#     MAGIC | len(header) | header JSON | texto UTF-8 | padding | mapa int32
+# - Se abre con mmap: el texto se decodifica directo del mapa y el mapa de
+#   índices (map_idx) es un memoryview int32 sin copia.
+# Si el archivo fuente cambia, la entrada se reconstruye sola.
+# Es la única copia: los scripts de act5 la importan agregando act4 a sys.path.
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Tuple
+
+MAGIC = b"TXC1"
+_HDR = struct.Struct("<4sI")
+
+BuildResult = Tuple[str, Optional[Sequence[int]], dict]
+
+
+class CachedText:
+    """Resultado de la caché: texto normalizado, mapa de índices opcional y metadatos."""
+
+    def __init__(self, text: str, map_idx: Optional[Sequence[int]], meta: dict, hit: bool,
+                 mm: Optional[mmap.mmap] = None):
+        self.text = text
+        self.map_idx = map_idx
+        self.meta = meta
+        self.hit = hit          # True si se leyó de disco sin normalizar
+        self._mm = mm           # mantiene vivo el mmap detrás de map_idx
+
+
+def cache_path(path: Path, mode: str) -> Path:
+    return path.with_name(f"{path.name}.{mode}.cache")
+
+
+def _source_key(path: Path, mode: str, version: int) -> dict:
+    st = path.stat()
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "mode": mode, "version": version}
+
+
+def _write(dest: Path, key: dict, text: str, map_idx: Optional[Sequence[int]], meta: dict) -> None:
+    data = text.encode("utf-8")
+    idx = array("i", map_idx) if map_idx is not None else array("i")
+    header = dict(key, text_bytes=len(data), map_len=len(idx),
+                  has_map=map_idx is not None, meta=meta)
+    hbytes = json.dumps(header).encode("utf-8")
+    pad = -(_HDR.size + len(hbytes) + len(data)) % 4
+    tmp = dest.with_name(dest.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HDR.pack(MAGIC, len(hbytes)))
+        f.write(hbytes)
+        f.write(data)
+        f.write(b"\x00" * pad)
+        f.write(idx.tobytes())
+    os.replace(tmp, dest)
+
+
+def _read(src: Path, key: dict) -> Optional[CachedText]:
+    try:
+        with open(src, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, hlen = _HDR.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise ValueError("magic")
+        header = json.loads(mm[_HDR.size:_HDR.size + hlen].decode("utf-8"))
+        if any(header.get(k) != v for k, v in key.items()):
+            raise ValueError("stale")
+        a = _HDR.size + hlen
+        b = a + header["text_bytes"]
+        c = b + (-b % 4)
+        if len(mm) < c + 4 * header["map_len"]:
+            raise ValueError("truncated")   # archivo cortado: se reconstruye
+        text = mm[a:b].decode("utf-8")
+        map_idx = None
+        if header["has_map"]:
+            map_idx = memoryview(mm)[c:c + 4 * header["map_len"]].cast("i")
+    except (ValueError, KeyError, struct.error):
+        mm.close()
+        return None
+    return CachedText(text, map_idx, header["meta"], hit=True, mm=mm)
+
+
+def cached_text(path: Path, mode: str, build: Callable[[], BuildResult],
+                version: int = 0) -> CachedText:
+    """
+    Devuelve el preprocesamiento de 'path' para 'mode'.
+    build() sólo se llama si no hay entrada válida; debe regresar
+    (texto, map_idx o None, meta: dict serializable a JSON).
+    version: subirla cada vez que cambie lo que hace build().
+    """
+    path = Path(path)
+    key = _source_key(path, mode, version)
+    dest = cache_path(path, mode)
+    hit = _read(dest, key)
+    if hit is not None:
+        return hit
+    text, map_idx, meta = build()
+    try:
+        _write(dest, key, text, map_idx, meta)
+    except OSError:
+        pass    # directorio de sólo lectura: se trabaja sin caché
+    return CachedText(text, map_idx, meta, hit=False)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Top-K substrings comunes maximales para CADA par de libros de un directorio.
+- Cuerpos sin boilerplate (load_body de lcs_seq_body.py, vía caché).
+- Un solo arreglo de sufijos generalizado sobre todo el corpus:
+  cuerpo_0 # cuerpo_1 # ... con un separador distinto por libro (ningún
+  prefijo común cruza un separador). SA por duplicación de prefijos + LCP de Kasai
+  (build_suffix_array / build_lcp de act4/suffix_array.py).
+- En cada racha de rangos con LCP >= --min-len se recorre el SA una vez
+  guardando, por libro y por carácter previo, el último sufijo visto y el LCP
+  mínimo desde entonces: cada sufijo se empareja con el más cercano de cada
+  otro libro cuyo carácter previo sea distinto (maximal a la izquierda).
+- Reporte JSON o CSV con offsets sobre los cuerpos.
+
+Uso: python corpus_substrings.py [DIR] [--min-len 20] [--top-k 10] [--out reporte.json|reporte.csv]
+"""
+
+import argparse
+import csv
+import heapq
+import itertools
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from lcs_seq_body import load_body
+
+# SA y LCP: los de act4/suffix_array.py (una sola implementación)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "act4"))
+from suffix_array import build_lcp, build_suffix_array
+
+class CorpusIndex:
+    """SA + LCP generalizados sobre los cuerpos de varios libros."""
+
+    def __init__(self, names: list[str], bodies: list[str]):
+        self.names = names
+        self.bodies = bodies
+        k = len(bodies)
+        parts, starts, pos = [], [], 0
+        for d, body in enumerate(bodies):
+            starts.append(pos)
+            parts.append(np.frombuffer(body.encode("utf-32-le"), dtype=np.uint32).astype(np.int64) + k)
+            parts.append(np.array([d], dtype=np.int64))    # separador único del libro d
+            pos += len(body) + 1
+        self.codes = np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+        self.starts = np.array(starts, dtype=np.int64)
+        self.sa = build_suffix_array(self.codes)
+        self.lcp = build_lcp(self.codes.tolist(), self.sa)
+        self.doc_of = (np.searchsorted(self.starts, self.sa, side="right") - 1).astype(np.int32)
+
+    def pair_matches(self, min_len: int):
+        """
+        Genera (libro_a, libro_b, largo, pos_a, pos_b) con a < b, largo >= min_len,
+        maximales a derecha (LCP) y a izquierda (carácter previo distinto).
+        """
+        lcp, sa, doc_of, codes = self.lcp, self.sa, self.doc_of, self.codes
+        k = len(self.bodies)
+        high = lcp >= min_len
+        if not high.any():
+            return
+        # Rachas [s, e] de rangos con lcp >= min_len; cubren las entradas s-1..e del SA
+        edges = np.diff(np.concatenate(([0], high.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1) - 1
+        inf = 1 << 62
+        for s, e in zip(run_starts.tolist(), run_ends.tolist()):
+            # seen[d][c] = [posición, LCP mínimo desde entonces] del último sufijo
+            # del libro d cuyo carácter previo es c (-1 = inicio del corpus)
+            seen = [{} for _ in range(k)]
+            for r in range(s - 1, e + 1):
+                if r >= s:
+                    h = int(lcp[r])
+                    for by_left in seen:
+                        for v in by_left.values():
+                            if v[1] > h:
+                                v[1] = h
+                dr = int(doc_of[r])
+                pr = int(sa[r])
+                left = int(codes[pr - 1]) if pr > 0 else -1
+                for d in range(k):
+                    if d == dr:
+                        continue
+                    for c, (pq, length) in seen[d].items():
+                        if c == left:
+                            continue     # se extiende a la izquierda: no es maximal
+                        if d < dr:
+                            yield d, dr, length, pq, pr
+                        else:
+                            yield dr, d, length, pr, pq
+                seen[dr][left] = [pr, inf]
+
+    def top_k(self, min_len: int, k: int) -> dict:
+        """{(a, b): [(largo, offset_a, offset_b, texto)]} ordenado por largo desc."""
+        best: dict = {}
+        for a, b, length, pa, pb in self.pair_matches(min_len):
+            oa = pa - int(self.starts[a])
+            ob = pb - int(self.starts[b])
+            text = self.bodies[a][oa:oa + length]
+            seen = best.setdefault((a, b), {})
+            prev = seen.get(text)
+            if prev is None or (oa, ob) < prev:
+                seen[text] = (oa, ob)
+        out = {}
+        for a, b in itertools.combinations(range(len(self.bodies)), 2):
+            cands = ((len(t), oa, ob, t) for t, (oa, ob) in best.get((a, b), {}).items())
+            out[(a, b)] = heapq.nsmallest(k, cands, key=lambda c: (-c[0], c[1], c[2]))
+        return out
+
+def write_report(path: str, index: CorpusIndex, results: dict, min_len: int, k: int) -> None:
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow(["book_a", "book_b", "rank", "length", "offset_a", "offset_b", "text"])
+            for (a, b), matches in results.items():
+                for rank, (length, oa, ob, text) in enumerate(matches, 1):
+                    w.writerow([index.names[a], index.names[b], rank, length, oa, ob, text])
+        return
+    report = {
+        "min_len": min_len,
+        "top_k": k,
+        "offsets": "sobre el cuerpo sin boilerplate (strip_gutenberg_boilerplate)",
+        "books": [{"name": n, "body_len": len(b)} for n, b in zip(index.names, index.bodies)],
+        "pairs": [
+            {"book_a": index.names[a], "book_b": index.names[b],
+             "matches": [{"length": length, "offset_a": oa, "offset_b": ob, "text": text}
+                         for length, oa, ob, text in matches]}
+            for (a, b), matches in results.items()
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+def main():
+    ap = argparse.ArgumentParser(description="Top-K substrings comunes entre todos los pares de libros")
+    ap.add_argument("books_dir", nargs="?", default=os.path.join(os.getcwd(), "books"))
+    ap.add_argument("--min-len", type=int, default=20, help="largo mínimo de un substring común")
+    ap.add_argument("--top-k", type=int, default=10, help="substrings por par de libros")
+    ap.add_argument("--limit", type=int, default=0, help="caracteres por archivo antes del strip (0 = todo)")
+    ap.add_argument("--out", default="corpus_substrings.json", help="reporte .json o .csv")
+    args = ap.parse_args()
+
+    if not os.path.isdir(args.books_dir):
+        print(f"No existe la carpeta {args.books_dir}", file=sys.stderr)
+        sys.exit(1)
+    txt = sorted(os.path.join(args.books_dir, f) for f in os.listdir(args.books_dir)
+                 if f.lower().endswith(".txt"))
+    if len(txt) < 2:
+        print("Debes tener al menos dos archivos .txt en el directorio.")
+        return
+
+    print("=== Substrings comunes en el corpus (SA generalizado) ===")
+    t0 = time.time()
+    names = [os.path.basename(p) for p in txt]
+    bodies = [load_body(p, args.limit)[0] for p in txt]
+    load_t = time.time() - t0
+
+    t1 = time.time()
+    index = CorpusIndex(names, bodies)
+    build_t = time.time() - t1
+
+    t2 = time.time()
+    results = index.top_k(args.min_len, args.top_k)
+    query_t = time.time() - t2
+
+    write_report(args.out, index, results, args.min_len, args.top_k)
+
+    print(f"Libros: {len(names)}  |  corpus: {len(index.codes):,} símbolos  |  "
+          f"pares: {len(results)}  |  min-len={args.min_len}  top-k={args.top_k}\n")
+    print(f"{'Libro A':<24} {'Libro B':<24} {'#':>3} {'más largo':>10}  vista")
+    print("-" * 100)
+    for (a, b), matches in results.items():
+        longest = matches[0][0] if matches else 0
+        view = matches[0][3][:30].replace("\n", "⏎") if matches else ""
+        print(f"{names[a]:<24} {names[b]:<24} {len(matches):>3} {longest:>10}  {view!r}")
+    print("-" * 100)
+    print(f"Reporte: {args.out}")
+    print(f"Tiempos: carga/strip {load_t:.3f} s  |  SA+LCP {build_t:.3f} s  |  top-k {query_t:.3f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Diff (alineamiento) entre dos textos con el algoritmo O(ND) de Myers.
+- Versión en espacio lineal: se busca la "serpiente del medio" avanzando desde
+  el inicio y desde el final a la vez, y se divide el problema en dos
+  (como Hirschberg, pero con costo O((n + m) · D), D = número de ediciones).
+  Para documentos casi iguales es prácticamente lineal.
+- Antes de cada subproblema se recortan el prefijo y el sufijo comunes
+  (comparación de slices, en C).
+- Funciona con str o con cualquier secuencia indexable (p. ej. listas de ids).
+- diff_opcodes() es un generador de (tag, i1, i2, j1, j2) con tag en
+  'equal' / 'delete' / 'insert', en orden y con rachas contiguas ya fusionadas:
+  nunca construye el alineamiento completo en memoria.
+- unified_hunks() agrupa esas rachas en hunks con --context elementos de contexto,
+  también como generador. Las 'equal' suman la LCS.
+
+- --max-d: si los textos difieren en más de D ediciones (con textos sin relación
+  D ~ n y Myers se vuelve cuadrático, minutos en Python) se alinea con Hirschberg
+  sobre lcs_last_row bit-paralelo de lcs_seq: O(n·m / w) y memoria O(n + m).
+
+Uso: python lcs_diff.py [--limit 50000] [--context 40] [--max-hunks 10] [--max-d 2000] [--check]
+     python lcs_diff.py --bench   (libro contra una copia con ediciones aleatorias)
+"""
+
+import argparse
+import os
+import random
+import time
+
+import numpy as np
+
+from lcs_seq import (HIRSCHBERG_BASE_CELLS, load_text, visualize_one_line, lcs_full_dp,
+                     lcs_last_row, lcs_length_bits)
+
+BENCH_SIZES = [50_000, 100_000, 200_000, 400_000]
+BENCH_EDIT_RATE = 0.001
+MAX_D = 2_000           # ~1 s de Myers en Python; más allá conviene Hirschberg
+
+class TooManyEdits(Exception):
+    """El diff necesita más de max_d ediciones."""
+
+def _common_prefix(a, alo: int, ahi: int, b, blo: int, bhi: int) -> int:
+    """Largo del prefijo común de a[alo:ahi] y b[blo:bhi] (búsqueda galopante sobre slices)."""
+    n = min(ahi - alo, bhi - blo)
+    lo, step = 0, 16
+    # Galope: bloques cada vez más grandes mientras coincidan
+    while lo < n:
+        hi = min(n, lo + step)
+        if a[alo + lo:alo + hi] != b[blo + lo:blo + hi]:
+            break
+        lo = hi
+        step *= 2
+    else:
+        return n
+    # Búsqueda binaria dentro del bloque que falló (a[..hi] nunca coincide)
+    hi = min(n, lo + step)
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if a[alo + lo:alo + mid] == b[blo + lo:blo + mid]:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+def _common_suffix(a, alo: int, ahi: int, b, blo: int, bhi: int) -> int:
+    n = min(ahi - alo, bhi - blo)
+    lo, step = 0, 16
+    while lo < n:
+        hi = min(n, lo + step)
+        if a[ahi - hi:ahi - lo] != b[bhi - hi:bhi - lo]:
+            break
+        lo = hi
+        step *= 2
+    else:
+        return n
+    hi = min(n, lo + step)
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if a[ahi - mid:ahi - lo] == b[bhi - mid:bhi - lo]:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+def _middle_snake(a, alo: int, ahi: int, b, blo: int, bhi: int, max_d: int = 0):
+    """
+    Serpiente del medio de Myers para a[alo:ahi] vs b[blo:bhi] (sin prefijo/sufijo común).
+    Retorna (d, x, y, u, v) en coordenadas locales: la diagonal (x, y) -> (u, v)
+    pertenece a un camino óptimo con d ediciones.
+    Con max_d > 0 lanza TooManyEdits en cuanto se sabe que d > max_d.
+    """
+    n, m = ahi - alo, bhi - blo
+    delta = n - m
+    odd = delta & 1
+    maxd = (n + m + 1) // 2
+    # v[k] con índices negativos de Python: el arreglo crece con d (no con n + m),
+    # así cada subproblema casi igual reserva O(D) y no O(n + m)
+    cap = min(maxd + 1, 32)
+    vf = [0] * (2 * cap + 1)
+    vb = [0] * (2 * cap + 1)
+    for d in range(maxd + 1):
+        if max_d and 2 * d - 1 > max_d:
+            raise TooManyEdits(f"más de {max_d:,} ediciones")
+        if d + 1 > cap:
+            new = min(maxd + 1, 2 * cap)
+            vf = vf[:cap + 1] + [0] * (2 * (new - cap)) + vf[cap + 1:]
+            vb = vb[:cap + 1] + [0] * (2 * (new - cap)) + vb[cap + 1:]
+            cap = new
+        # Hacia adelante: vf[k] = x más lejano en la diagonal k = x - y
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and vf[k - 1] < vf[k + 1]):
+                x = vf[k + 1]
+            else:
+                x = vf[k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            vf[k] = x
+            # La diagonal k adelante es la delta - k en reversa (calculada en el paso d - 1)
+            if odd and delta - d < k < delta + d and x + vb[delta - k] >= n:
+                return 2 * d - 1, x0, y0, x, y
+        # En reversa: vb[k] = cuántos elementos se consumieron desde el final
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and vb[k - 1] < vb[k + 1]):
+                x = vb[k + 1]
+            else:
+                x = vb[k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            vb[k] = x
+            if not odd and -d <= delta - k <= d and x + vf[delta - k] >= n:
+                return 2 * d, n - x, m - y, n - x0, m - y0
+    raise AssertionError("no se encontró la serpiente del medio")
+
+def _raw_opcodes(a, b, max_d: int = 0):
+    """Rachas (tag, i1, i2, j1, j2) en orden, todavía sin fusionar."""
+    # Pila explícita: ("solve", alo, ahi, blo, bhi) o una racha ya resuelta
+    stack = [("solve", 0, len(a), 0, len(b))]
+    while stack:
+        item = stack.pop()
+        if item[0] != "solve":
+            yield item
+            continue
+        _, alo, ahi, blo, bhi = item
+        p = _common_prefix(a, alo, ahi, b, blo, bhi)
+        if p:
+            yield "equal", alo, alo + p, blo, blo + p
+            alo += p
+            blo += p
+        s = _common_suffix(a, alo, ahi, b, blo, bhi)
+        tail = ("equal", ahi - s, ahi, bhi - s, bhi) if s else None
+        ahi -= s
+        bhi -= s
+        if alo == ahi or blo == bhi:
+            if tail:
+                stack.append(tail)
+            if bhi > blo:
+                stack.append(("insert", alo, alo, blo, bhi))
+            if ahi > alo:
+                stack.append(("delete", alo, ahi, blo, blo))
+            continue
+        # Los subproblemas nunca superan la D del primero: basta con cortar ahí
+        try:
+            _, x, y, u, v = _middle_snake(a, alo, ahi, b, blo, bhi, max_d)
+        except TooManyEdits:
+            if not (isinstance(a, str) and isinstance(b, str)):
+                raise
+            yield from _hirschberg_opcodes(a, alo, ahi, b, blo, bhi)
+            if tail:
+                yield tail
+            continue
+        max_d = 0
+        if tail:
+            stack.append(tail)
+        stack.append(("solve", alo + u, ahi, blo + v, bhi))
+        if u > x:
+            stack.append(("equal", alo + x, alo + u, blo + y, blo + v))
+        stack.append(("solve", alo, alo + x, blo, blo + y))
+
+def _hirschberg_opcodes(a: str, alo: int, ahi: int, b: str, blo: int, bhi: int):
+    """Rachas de una alineación LCS óptima de a[alo:ahi] y b[blo:bhi] por Hirschberg."""
+    stack = [(alo, ahi, blo, bhi)]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+        n, m = ahi - alo, bhi - blo
+        if n <= 1 or m <= 1 or n * m <= HIRSCHBERG_BASE_CELLS:
+            yield from _dp_opcodes(a, alo, ahi, b, blo, bhi)
+            continue
+        mid = (alo + ahi) // 2
+        fwd = lcs_last_row(a[alo:mid], b[blo:bhi])
+        # rev[k] = LCS(a[mid:ahi], los últimos k de b) -> rev[::-1][j] = LCS(a[mid:ahi], b[blo + j:bhi])
+        rev = lcs_last_row(a[mid:ahi][::-1], b[blo:bhi][::-1])
+        j = blo + int(np.argmax(fwd + rev[::-1]))
+        stack.append((mid, ahi, j, bhi))
+        stack.append((alo, mid, blo, j))
+
+def _dp_opcodes(a: str, alo: int, ahi: int, b: str, blo: int, bhi: int) -> list:
+    """Rachas de un subproblema chico con la DP completa (mismo backtrack que lcs_backtrack)."""
+    dp, i, j = lcs_full_dp(a[alo:ahi], b[blo:bhi])
+    ops = []
+    while i > 0 and j > 0:
+        if a[alo + i - 1] == b[blo + j - 1]:
+            ops.append(("equal", alo + i - 1, alo + i, blo + j - 1, blo + j))
+            i -= 1
+            j -= 1
+        elif dp[i - 1][j] >= dp[i][j - 1]:
+            ops.append(("delete", alo + i - 1, alo + i, blo + j, blo + j))
+            i -= 1
+        else:
+            ops.append(("insert", alo + i, alo + i, blo + j - 1, blo + j))
+            j -= 1
+    if i:
+        ops.append(("delete", alo, alo + i, blo, blo))
+    if j:
+        ops.append(("insert", alo, alo, blo, blo + j))
+    ops.reverse()
+    return ops
+
+def diff_opcodes(a, b, max_d: int = 0):
+    """
+    Generador de (tag, i1, i2, j1, j2) que transforma a en b; rachas contiguas fusionadas.
+    max_d > 0: si hacen falta más de max_d ediciones, los str se alinean con Hirschberg
+    (misma LCS, otro alineamiento posible); otras secuencias lanzan TooManyEdits.
+    """
+    pending = None
+    for op in _raw_opcodes(a, b, max_d):
+        if op[1] == op[2] and op[3] == op[4]:
+            continue
+        if pending is not None and pending[0] == op[0]:
+            pending = (op[0], pending[1], op[2], pending[3], op[4])
+            continue
+        if pending is not None:
+            yield pending
+        pending = op
+    if pending is not None:
+        yield pending
+
+def unified_hunks(a, b, context: int = 40, max_d: int = 0):
+    """
+    Generador de hunks ((i1, i2, j1, j2), [opcodes]) estilo diff unificado:
+    cambios separados por menos de 2 * context elementos iguales van juntos.
+    """
+    hunk = []
+    for op in diff_opcodes(a, b, max_d):
+        tag, i1, i2, j1, j2 = op
+        if tag != "equal":
+            hunk.append(op)
+            continue
+        if not hunk:
+            # Contexto inicial del siguiente hunk: sólo la cola de la racha
+            c = min(context, i2 - i1)
+            hunk.append(("equal", i2 - c, i2, j2 - c, j2))
+            continue
+        if i2 - i1 <= 2 * context:
+            hunk.append(op)
+            continue
+        hunk.append(("equal", i1, i1 + context, j1, j1 + context))
+        yield _close_hunk(hunk)
+        hunk = [("equal", i2 - context, i2, j2 - context, j2)]
+    if any(op[0] != "equal" for op in hunk):
+        yield _close_hunk(hunk)
+
+def _close_hunk(ops: list):
+    ops = [op for op in ops if op[1] != op[2] or op[3] != op[4]]
+    return (ops[0][1], ops[-1][2], ops[0][3], ops[-1][4]), ops
+
+def format_hunk(a, b, hunk, width: int = 60) -> list[str]:
+    """Líneas de texto de un hunk: '@@ -i,n +j,m @@' y una línea por racha (' ', '-', '+')."""
+    (i1, i2, j1, j2), ops = hunk
+    lines = [f"@@ -{i1},{i2 - i1} +{j1},{j2 - j1} @@"]
+    for tag, a1, a2, b1, b2 in ops:
+        if tag == "insert":
+            sign, part = "+", b[b1:b2]
+        else:
+            sign, part = (" " if tag == "equal" else "-"), a[a1:a2]
+        if not isinstance(part, str):
+            part = " ".join(map(str, part))
+        lines.append(sign + visualize_one_line(part, width // 2, width // 2))
+    return lines
+
+def check_opcodes(a, b, ops: list) -> int:
+    """Verifica que las rachas reconstruyan a y b; retorna la LCS implícita (suma de 'equal')."""
+    i = j = same = 0
+    for tag, i1, i2, j1, j2 in ops:
+        assert (i1, j1) == (i, j), f"racha no contigua en ({i}, {j})"
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+            same += i2 - i1
+        else:
+            assert (tag == "delete") == (j1 == j2) and (tag == "insert") == (i1 == i2)
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return same
+
+def apply_random_edits(s: str, rate: float, seed: int = 0) -> str:
+    """Copia de s con ~rate * len(s) borrados, inserciones y sustituciones de 1..8 caracteres."""
+    rng = random.Random(seed)
+    cuts = sorted(rng.sample(range(len(s) + 1), min(len(s) + 1, max(1, int(len(s) * rate)))))
+    out, pos = [], 0
+    for cut in cuts:
+        if cut < pos:
+            continue
+        out.append(s[pos:cut])
+        k = rng.randint(1, 8)
+        kind = rng.choice("dis")
+        if kind != "d":
+            out.append("".join(rng.choice("abcdefghij ") for _ in range(k)))
+        pos = cut if kind == "i" else min(len(s), cut + k)
+    out.append(s[pos:])
+    return "".join(out)
+
+def benchmark(path: str) -> None:
+    base = load_text(path, 0)
+    print(f"=== Diff de Myers: {os.path.basename(path)} contra una copia editada "
+          f"(tasa {BENCH_EDIT_RATE}) ===")
+    print(f"{'|A|':>10} {'|B|':>10} {'D':>7} {'hunks':>6} {'tiempo (s)':>11} {'Mchars/s':>9}")
+    print("-" * 60)
+    for size in BENCH_SIZES:
+        a = base[:size]
+        b = apply_random_edits(a, BENCH_EDIT_RATE, seed=size)
+        t0 = time.time()
+        d = sum(max(i2 - i1, j2 - j1) for tag, i1, i2, j1, j2 in diff_opcodes(a, b) if tag != "equal")
+        elapsed = time.time() - t0
+        hunks = sum(1 for _ in unified_hunks(a, b))
+        rate = (len(a) + len(b)) / 1e6 / max(elapsed, 1e-9)
+        print(f"{len(a):>10,} {len(b):>10,} {d:>7,} {hunks:>6} {elapsed:>11.3f} {rate:>9.2f}")
+
+def main():
+    ap = argparse.ArgumentParser(description="Diff (Myers O(ND)) entre los dos primeros .txt de ./books")
+    ap.add_argument("--limit", type=int, default=50_000, help="caracteres por archivo (0 = todo)")
+    ap.add_argument("--context", type=int, default=40, help="caracteres de contexto por hunk")
+    ap.add_argument("--max-hunks", type=int, default=10, help="hunks a imprimir (0 = todos)")
+    ap.add_argument("--max-d", type=int, default=MAX_D,
+                    help="con más ediciones se alinea con Hirschberg (0 = sólo Myers)")
+    ap.add_argument("--check", action="store_true", help="verificar contra lcs_length_bits")
+    ap.add_argument("--bench", action="store_true", help="libro contra una copia con ediciones")
+    args = ap.parse_args()
+
+    books_dir = os.path.join(os.getcwd(), "books")
+    if not os.path.isdir(books_dir):
+        print(f"No existe la carpeta 'books' en {os.getcwd()}")
+        return
+    txt = sorted([os.path.join(books_dir, f) for f in os.listdir(books_dir)
+                  if f.lower().endswith(".txt")])
+    if len(txt) < 2:
+        print("Debes tener al menos dos archivos .txt en 'books/'.")
+        return
+    if args.bench:
+        benchmark(txt[0])
+        return
+
+    b1, b2 = txt[:2]
+    s1, s2 = load_text(b1, args.limit), load_text(b2, args.limit)
+    print("=== Diff de Myers O(ND), espacio lineal ===")
+    print(f"Archivo 1: {b1}\nArchivo 2: {b2}")
+    print(f"|S1| = {len(s1):,}  |S2| = {len(s2):,}\n")
+
+    t0 = time.time()
+    counts = {"equal": 0, "delete": 0, "insert": 0}
+    shown = 0
+    for hunk in unified_hunks(s1, s2, args.context, args.max_d):
+        for tag, i1, i2, j1, j2 in hunk[1]:
+            counts[tag] += (j2 - j1) if tag == "insert" else (i2 - i1)
+        if args.max_hunks == 0 or shown < args.max_hunks:
+            print("\n".join(format_hunk(s1, s2, hunk)))
+            shown += 1
+    elapsed = time.time() - t0
+
+    print("\n>>> RESULTADOS")
+    # Los 'equal' de los hunks sólo son contexto: la LCS sale de las ediciones
+    lcs = len(s1) - counts["delete"]
+    print(f"Borrados: {counts['delete']:,}  |  insertados: {counts['insert']:,}  |  LCS: {lcs:,}")
+    print(f"Hunks impresos: {shown}  |  tiempo: {elapsed:.3f} s")
+    if args.check:
+        same = check_opcodes(s1, s2, list(diff_opcodes(s1, s2, args.max_d)))
+        ref = lcs_length_bits(s1, s2)
+        assert same == lcs == ref, f"LCS distinta ({same}, {lcs}, {ref})"
+        print(f"Check OK: reconstrucción exacta y LCS == bit-paralelo ({ref:,})")
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,45 @@ Longest Common Subsequence (LCS) con DP completa y reconstrucción.
 - Recorta cada archivo a 'limit' chars (default: 50_000).
 - Construye la tabla completa (n+1) x (m+1) con array('H') para ahorrar memoria.
 - Luego hace backtracking para reconstruir UNA subsecuencia óptima.
+
+Modo --mode hirschberg: divide y vencerás de Hirschberg en memoria O(n + m).
+- Cada fila intermedia (adelante y en reversa) se calcula con el algoritmo
+  bit-paralelo de LCS sobre enteros de Python: la fila es un bitvector V y
+  dp[i][j] = j - popcount(V & ((1 << j) - 1)); con NumPy se pasa a int32.
+- Los subproblemas chicos (<= HIRSCHBERG_BASE_CELLS) usan lcs_full_dp + backtrack.
+- Devuelve una LCS óptima (misma longitud que la DP completa; ante empates
+  puede elegir otra subsecuencia). Permite correr los libros completos (--limit 0).
+
+Modo --mode length: sólo la longitud, bit-paralelo (Allison–Dix / Hyyrö),
+~n·m/64 operaciones de palabra, para CADA par de .txt en ./books.
+
+Modo --mode wavefront: longitud de la LCS con la tabla partida en tiles de
+--tile x --tile. Los tiles de una misma antidiagonal son independientes y se
+calculan en un ProcessPoolExecutor; los textos y las filas/columnas frontera
+de los tiles viven en multiprocessing.shared_memory: sólo el frente, 3 filas y 3
+columnas rotativas (memoria O(n + m)); no se copia nada más.
+Dentro del tile cada fila es vectorizada: con t[j] = prev[j-1] + 1 si hay
+match y prev[j] si no, la fila es np.maximum.accumulate(t) (en LCS, el valor
+diagonal + 1 nunca es menor que el de la izquierda). --bench mide el speedup
+con 1, 2, 4 y 8 workers para límites crecientes.
 """
 
+import argparse
+import itertools
 import os
+import sys
 import time
+import tracemalloc
 from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+HIRSCHBERG_BASE_CELLS = 4096
+WAVEFRONT_TILE = 2048
+BENCH_WORKERS = [1, 2, 4, 8]
+BENCH_LIMITS = [5_000, 10_000, 20_000, 50_000]
 
 def load_text(path: str, limit: int | None) -> str:
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
@@ -83,9 +117,209 @@ def lcs_backtrack(dp, s1: str, s2: str) -> str:
     out.reverse()
     return "".join(out)
 
+def match_masks(b: str) -> dict:
+    """Carácter -> entero con el bit j encendido donde b[j] == carácter."""
+    codes = np.frombuffer(b.encode("utf-32-le"), dtype=np.uint32)
+    masks = {}
+    for c in np.unique(codes).tolist():
+        bits = np.packbits(codes == c, bitorder="little")
+        masks[chr(c)] = int.from_bytes(bits.tobytes(), "little")
+    return masks
+
+def lcs_row_bits(a: str, b: str) -> int:
+    """
+    Bitvector V de la última fila de la DP de a contra b (Hyyrö):
+    V' = (V + (V & M)) | (V & ~M). Los ceros de V cuentan la LCS.
+    """
+    m = len(b)
+    mask = (1 << m) - 1
+    get = match_masks(b).get
+    v = mask
+    for ch in a:
+        mm = get(ch)
+        if mm is None:
+            continue  # U = 0 deja V igual
+        u = v & mm
+        # u ⊆ v: v - u == v ^ u sin préstamos. Los acarreos sólo suben, así que
+        # los bits arriba de m no afectan a los de abajo: se enmascara al final.
+        v = (v + u) | (v ^ u)
+    return v & mask
+
+def lcs_length_bits(s1: str, s2: str) -> int:
+    """Longitud de la LCS. Se itera sobre el string más corto (menos pasos de Python)."""
+    a, b = (s1, s2) if len(s1) <= len(s2) else (s2, s1)
+    if not a:
+        return 0
+    return len(b) - lcs_row_bits(a, b).bit_count()
+
+def lcs_last_row(a: str, b: str) -> np.ndarray:
+    """dp[len(a)][0..len(b)] como int32, en memoria O(len(b))."""
+    m = len(b)
+    row = np.zeros(m + 1, dtype=np.int32)
+    if m == 0 or not a:
+        return row
+    v = lcs_row_bits(a, b)
+    bits = np.unpackbits(np.frombuffer(v.to_bytes((m + 7) // 8, "little"), dtype=np.uint8),
+                         count=m, bitorder="little")
+    np.cumsum(1 - bits.astype(np.int32), out=row[1:])
+    return row
+
+def lcs_hirschberg(s1: str, s2: str) -> str:
+    """Una LCS óptima de s1 y s2 en memoria O(n + m)."""
+    out = []
+    _hirschberg(s1, s2, out)
+    return "".join(out)
+
+def _hirschberg(a: str, b: str, out: list) -> None:
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return
+    if n == 1:
+        if a in b:
+            out.append(a)
+        return
+    if n * m <= HIRSCHBERG_BASE_CELLS:
+        dp, _, _ = lcs_full_dp(a, b)
+        out.append(lcs_backtrack(dp, a, b))
+        return
+    mid = n // 2
+    fwd = lcs_last_row(a[:mid], b)
+    # rev[k] = LCS(a[mid:], b[m-k:]) -> rev[::-1][j] = LCS(a[mid:], b[j:])
+    rev = lcs_last_row(a[mid:][::-1], b[::-1])
+    j = int(np.argmax(fwd + rev[::-1]))
+    _hirschberg(a[:mid], b[:j], out)
+    _hirschberg(a[mid:], b[j:], out)
+
+def lcs_tile(a: np.ndarray, b: np.ndarray, top: np.ndarray, left: np.ndarray):
+    """
+    Un tile de la DP. top = dp[r0][c0..c1] (top[0] es la esquina),
+    left = dp[r0..r1][c0]. Retorna (fila inferior, columna derecha), int32.
+    """
+    h, w = len(a), len(b)
+    prev = top.astype(np.int32)
+    right = np.empty(h + 1, dtype=np.int32)
+    right[0] = prev[-1]
+    t = np.empty(w + 1, dtype=np.int32)
+    for i in range(h):
+        t[0] = left[i + 1]
+        t[1:] = prev[1:]
+        np.add(prev[:-1], 1, out=t[1:], where=(b == a[i]))
+        np.maximum.accumulate(t, out=prev)
+        right[i + 1] = prev[-1]
+    return prev, right
+
+class _WaveShared:
+    """Buffers compartidos: códigos de s1/s2, fronteras horizontales H y verticales V."""
+    # H[ti % 3, c] = dp[ti * tile][c]   V[tj % 3, r] = dp[r][tj * tile]
+    # Sólo el frente está vivo: basta con 3 filas/columnas rotativas (memoria O(n + m)).
+    # Con 2 no alcanza: el tile (ti+1, tj-1) de la misma antidiagonal escribe la
+    # esquina H[., c0] que lee (ti, tj).
+    def __init__(self, n: int, m: int, tile: int, names=None):
+        self.n, self.m, self.tile = n, m, tile
+        self.tr, self.tc = -(-n // tile), -(-m // tile)
+        shapes = {"a": (n,), "b": (m,), "H": (3, m + 1), "V": (3, n + 1)}
+        self.shm = {}
+        self.arr = {}
+        for key, shape in shapes.items():
+            size = max(4, int(np.prod(shape)) * 4)
+            if names is None:
+                shm = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                shm = shared_memory.SharedMemory(name=names[key])
+            self.shm[key] = shm
+            self.arr[key] = np.ndarray(shape, dtype=np.int32, buffer=shm.buf)
+        if names is None:
+            self.arr["H"][:] = 0
+            self.arr["V"][:] = 0
+
+    def names(self) -> dict:
+        return {k: shm.name for k, shm in self.shm.items()}
+
+    def run_tile(self, ti: int, tj: int) -> None:
+        T = self.tile
+        r0, r1 = ti * T, min(self.n, (ti + 1) * T)
+        c0, c1 = tj * T, min(self.m, (tj + 1) * T)
+        H, V = self.arr["H"], self.arr["V"]
+        bottom, right = lcs_tile(self.arr["a"][r0:r1], self.arr["b"][c0:c1],
+                                 H[ti % 3, c0:c1 + 1], V[tj % 3, r0:r1 + 1])
+        # Se escribe sin la esquina inicial: cada celda frontera tiene un solo dueño
+        H[(ti + 1) % 3, c0 + 1:c1 + 1] = bottom[1:]
+        V[(tj + 1) % 3, r0 + 1:r1 + 1] = right[1:]
+
+    def close(self, unlink: bool = False) -> None:
+        self.arr = {}
+        for shm in self.shm.values():
+            shm.close()
+            if unlink:
+                shm.unlink()
+
+_wave_worker = None
+
+def _wave_init(n: int, m: int, tile: int, names: dict) -> None:
+    global _wave_worker
+    _wave_worker = _WaveShared(n, m, tile, names)
+
+def _wave_task(ij) -> None:
+    _wave_worker.run_tile(*ij)
+
+def lcs_length_wavefront(s1: str, s2: str, workers: int = 1, tile: int = WAVEFRONT_TILE) -> int:
+    """Longitud de la LCS por frente de onda de tiles (antidiagonales) en paralelo."""
+    n, m = len(s1), len(s2)
+    if n == 0 or m == 0:
+        return 0
+    ws = _WaveShared(n, m, tile)
+    try:
+        a = np.frombuffer(s1.encode("utf-32-le"), dtype=np.uint32)
+        b = np.frombuffer(s2.encode("utf-32-le"), dtype=np.uint32)
+        ws.arr["a"][:] = a.view(np.int32)
+        ws.arr["b"][:] = b.view(np.int32)
+        diagonals = [[(ti, d - ti) for ti in range(max(0, d - ws.tc + 1), min(ws.tr, d + 1))]
+                     for d in range(ws.tr + ws.tc - 1)]
+        if workers <= 1:
+            for diag in diagonals:
+                for ti, tj in diag:
+                    ws.run_tile(ti, tj)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_wave_init,
+                                     initargs=(n, m, tile, ws.names())) as ex:
+                for diag in diagonals:
+                    list(ex.map(_wave_task, diag))   # barrera entre antidiagonales
+        return int(ws.arr["H"][ws.tr % 3, m])
+    finally:
+        ws.close(unlink=True)
+
+def bench_wavefront(b1: str, b2: str, tile: int, max_limit: int) -> None:
+    limits = [L for L in BENCH_LIMITS if max_limit <= 0 or L <= max_limit] or [max_limit]
+    print(f"=== LCS por frente de onda: speedup vs workers (tile {tile}, {os.cpu_count()} CPUs) ===")
+    print(f"{'límite':>8} {'workers':>8} {'tiles':>7} {'LCS':>8} {'tiempo (s)':>11} {'speedup':>8}")
+    print("-" * 56)
+    for limit in limits:
+        s1, s2 = load_text(b1, limit), load_text(b2, limit)
+        ref = lcs_length_bits(s1, s2)
+        tiles = -(-len(s1) // tile) * -(-len(s2) // tile)
+        base = None
+        for w in BENCH_WORKERS:
+            t0 = time.time()
+            length = lcs_length_wavefront(s1, s2, w, tile)
+            elapsed = time.time() - t0
+            assert length == ref, f"Diferencia con el bit-paralelo ({length} != {ref})"
+            base = base or elapsed
+            print(f"{limit:>8,} {w:>8} {tiles:>7} {length:>8,} {elapsed:>11.3f} {base / elapsed:>7.2f}x")
+        print("-" * 56)
+
 def main():
+    ap = argparse.ArgumentParser(description="LCS entre los dos primeros .txt de ./books")
+    ap.add_argument("--mode", choices=["full", "hirschberg", "length", "wavefront"], default="full",
+                    help="full: tabla completa + backtrack; hirschberg: memoria O(n + m); "
+                         "length: sólo longitud, todos los pares; wavefront: longitud por tiles en paralelo")
+    ap.add_argument("--limit", type=int, default=50_000, help="caracteres por archivo (0 = todo)")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="procesos para wavefront")
+    ap.add_argument("--tile", type=int, default=WAVEFRONT_TILE, help="lado del tile para wavefront")
+    ap.add_argument("--bench", action="store_true", help="wavefront: speedup con 1-8 workers")
+    args = ap.parse_args()
+
     books_dir = os.path.join(os.getcwd(), "books")
-    limit = 50_000
+    limit = args.limit
 
     if not os.path.isdir(books_dir):
         print(f"No existe la carpeta 'books' en {os.getcwd()}")
@@ -97,11 +331,38 @@ def main():
         print("Debes tener al menos dos archivos .txt en 'books/'.")
         return
 
+    if args.mode == "length":
+        print("=== Longitud de la LCS, bit-paralelo (todos los pares) ===")
+        print(f"Límite por archivo: {limit if limit > 0 else 'sin límite'} caracteres\n")
+        texts = {os.path.basename(p): load_text(p, limit) for p in txt}
+        print(f"{'Archivo 1':<24} {'Archivo 2':<24} {'|S1|':>10} {'|S2|':>10} {'LCS':>10} {'tiempo (s)':>11}")
+        print("-" * 94)
+        for (n1, s1), (n2, s2) in itertools.combinations(texts.items(), 2):
+            t0 = time.time()
+            length = lcs_length_bits(s1, s2)
+            print(f"{n1:<24} {n2:<24} {len(s1):>10,} {len(s2):>10,} {length:>10,} {time.time() - t0:>11.3f}")
+        return
+
     b1, b2 = txt[:2]
-    print("=== Longest Common Subsequence (DP completa) ===")
+    if args.mode == "wavefront":
+        if args.bench:
+            bench_wavefront(b1, b2, args.tile, limit)
+            return
+        s1, s2 = load_text(b1, limit), load_text(b2, limit)
+        print("=== Longitud de la LCS, frente de onda por tiles ===")
+        print(f"Archivo 1: {b1}\nArchivo 2: {b2}")
+        print(f"|S1| = {len(s1):,}  |S2| = {len(s2):,}  |  tile {args.tile}  |  workers {args.workers}\n")
+        t0 = time.time()
+        length = lcs_length_wavefront(s1, s2, args.workers, args.tile)
+        print(f"Longitud de la LCS: {length:,}")
+        print(f"Tiempo: {time.time() - t0:.3f} s")
+        return
+
+    title = "DP completa" if args.mode == "full" else "Hirschberg, memoria lineal"
+    print(f"=== Longest Common Subsequence ({title}) ===")
     print(f"Archivo 1: {b1}")
     print(f"Archivo 2: {b2}")
-    print(f"Límite por archivo: {limit} caracteres\n")
+    print(f"Límite por archivo: {limit if limit > 0 else 'sin límite'} caracteres\n")
 
     t0 = time.time()
     s1 = load_text(b1, limit)
@@ -113,22 +374,46 @@ def main():
     print(f"Tamaño procesado: |S1| = {n:,}  |S2| = {m:,}")
     print(f"Memoria aprox. para DP: {human_bytes(approx_mem)}\n")
 
-    t1 = time.time()
-    dp, _, _ = lcs_full_dp(s1, s2)
-    dp_build_t = time.time() - t1
+    if args.mode == "full" and min(n, m) > 65_535:
+        # Las celdas valen a lo más min(n, m): array('H') se desborda si pasa de 65,535
+        print("Error: la DP completa usa celdas de 16 bits; usa --mode hirschberg", file=sys.stderr)
+        sys.exit(1)
 
-    t2 = time.time()
-    lcs_str = lcs_backtrack(dp, s1, s2)
-    back_t = time.time() - t2
+    if args.mode == "full":
+        t1 = time.time()
+        dp, _, _ = lcs_full_dp(s1, s2)
+        dp_build_t = time.time() - t1
+
+        t2 = time.time()
+        lcs_str = lcs_backtrack(dp, s1, s2)
+        back_t = time.time() - t2
+        del dp
+    else:
+        # tracemalloc sólo aquí: en la DP completa cada celda crea un int y lo distorsiona
+        tracemalloc.start()
+        t1 = time.time()
+        lcs_str = lcs_hirschberg(s1, s2)
+        hb_t = time.time() - t1
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
 
     print(">>> RESULTADOS")
     print(f"Longitud de la LCS: {len(lcs_str):,}")
     print(f"LCS (vista abreviada): {visualize_one_line(lcs_str)}\n")
 
+    print(">>> Memoria")
+    print(f"Estimada DP completa: {human_bytes(approx_mem)}")
+    if args.mode == "hirschberg":
+        print(f"Pico medido (Hirschberg, tracemalloc): {human_bytes(peak)}")
+    print()
+
     print(">>> Tiempos")
     print(f"Carga:      {load_t:.3f} s")
-    print(f"DP (tabla): {dp_build_t:.3f} s")
-    print(f"Backtrack:  {back_t:.3f} s")
+    if args.mode == "full":
+        print(f"DP (tabla): {dp_build_t:.3f} s")
+        print(f"Backtrack:  {back_t:.3f} s")
+    else:
+        print(f"Hirschberg: {hb_t:.3f} s")
 
 if __name__ == "__main__":
     main()
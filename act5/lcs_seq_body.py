@@ -8,12 +8,23 @@ LCS con DP completa y reconstrucción, eliminando el boilerplate de Gutenberg.
 - Aplica strip de encabezado/pie con marcadores comunes
 - Construye tabla (n+1)x(m+1) con array('H')
 - Backtracking para recuperar UNA subsecuencia óptima
+- --mode length: sólo la longitud (bit-paralelo de lcs_seq.py) para cada par
+  de .txt; con --limit 0 compara los cuerpos completos
 """
 
+import argparse
+import itertools
 import os
+import sys
 import time
 from array import array
 
+from lcs_seq import lcs_length_bits
+
+# text_cache.py vive en act4: una sola caché para las dos actividades
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "act4"))
+from text_cache import cached_text
+
 def load_text(path: str, limit: int | None) -> str:
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
         t = f.read()
@@ -84,6 +95,19 @@ def strip_gutenberg_boilerplate(text: str) -> tuple[str, dict]:
     }
     return body, info
 
+BODY_VERSION = 1   # subir al cambiar strip_gutenberg_boilerplate: invalida la caché
+
+def load_body(path: str, limit: int | None) -> tuple[str, dict]:
+    """
+    Cuerpo sin boilerplate vía caché (act4/text_cache.py): sólo se recalcula si el
+    archivo o BODY_VERSION cambiaron. También lo usan lcsubstr_body.py y corpus_substrings.py.
+    """
+    def build():
+        body, info = strip_gutenberg_boilerplate(load_text(path, limit))
+        return body, None, info
+    entry = cached_text(path, f"body_{limit or 0}", build, version=BODY_VERSION)
+    return entry.text, entry.meta
+
 def human_bytes(n: int) -> str:
     units = ["B", "KB", "MB", "GB", "TB"]
     i = 0
@@ -132,8 +156,14 @@ def lcs_backtrack(dp, s1: str, s2: str) -> str:
     return "".join(out)
 
 def main():
+    ap = argparse.ArgumentParser(description="LCS sobre el cuerpo de los libros en ./books")
+    ap.add_argument("--mode", choices=["full", "length"], default="full",
+                    help="full: tabla completa + backtrack; length: sólo longitud, todos los pares")
+    ap.add_argument("--limit", type=int, default=50_000, help="caracteres por archivo (0 = todo)")
+    args = ap.parse_args()
+
     books_dir = os.path.join(os.getcwd(), "books")
-    limit = 50_000
+    limit = args.limit
 
     if not os.path.isdir(books_dir):
         print(f"No existe la carpeta 'books' en {os.getcwd()}")
@@ -145,6 +175,18 @@ def main():
         print("Debes tener al menos dos archivos .txt en 'books/'.")
         return
 
+    if args.mode == "length":
+        print("=== Longitud de la LCS sobre el CUERPO, bit-paralelo (todos los pares) ===")
+        print(f"Límite por archivo: {limit if limit > 0 else 'sin límite'} caracteres\n")
+        bodies = {os.path.basename(p): load_body(p, limit)[0] for p in txt}
+        print(f"{'Archivo 1':<24} {'Archivo 2':<24} {'|S1|':>10} {'|S2|':>10} {'LCS':>10} {'tiempo (s)':>11}")
+        print("-" * 94)
+        for (n1, s1), (n2, s2) in itertools.combinations(bodies.items(), 2):
+            t0 = time.time()
+            length = lcs_length_bits(s1, s2)
+            print(f"{n1:<24} {n2:<24} {len(s1):>10,} {len(s2):>10,} {length:>10,} {time.time() - t0:>11.3f}")
+        return
+
     b1, b2 = txt[:2]
     print("=== LCS sobre el CUERPO del libro (boilerplate removido) ===")
     print(f"Archivo 1: {b1}")
@@ -152,10 +194,8 @@ def main():
     print(f"Límite por archivo: {limit} caracteres\n")
 
     t0 = time.time()
-    raw1 = load_text(b1, limit)
-    raw2 = load_text(b2, limit)
-    body1, info1 = strip_gutenberg_boilerplate(raw1)
-    body2, info2 = strip_gutenberg_boilerplate(raw2)
+    body1, info1 = load_body(b1, limit)
+    body2, info2 = load_body(b2, limit)
     load_t = time.time() - t0
 
     print(">>> Resumen de limpieza")
@@ -168,6 +208,11 @@ def main():
     approx_mem = (n + 1) * (m + 1) * 2
     print(f"Tamaño procesado tras strip: |S1| = {n:,}  |S2| = {m:,}")
     print(f"Memoria aprox. para DP: {human_bytes(approx_mem)}\n")
+    if min(n, m) > 65_535:
+        # Las celdas valen a lo más min(n, m): array('H') se desborda si pasa de 65,535
+        print("Error: la DP completa usa celdas de 16 bits; usa --limit <= 65535 o --mode length",
+              file=sys.stderr)
+        sys.exit(1)
 
     t1 = time.time()
     dp, _, _ = lcs_full_dp(body1, body2)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+LCS y LCSubstr por tokens (palabras o líneas) en lugar de caracteres.
+- Cuerpos sin boilerplate (load_body de lcs_seq_body.py, vía caché).
+- --unit word: palabras (\\w+ con apóstrofos internos), opcionalmente en minúsculas.
+  --unit line: líneas no vacías, sin espacios a los lados.
+- Los tokens de ambos libros se internan en un solo vocabulario -> ids int32.
+  Así n y m bajan ~5x (palabras) a ~60x (líneas) y los libros completos caben.
+- Los motores de lcs_seq.py / lcsubstr.py trabajan sobre str: cada id se pasa a
+  un code point (saltando los surrogates) y el arreglo int32 se decodifica como
+  UTF-32 en un solo paso. Cada "carácter" es entonces un token completo.
+- Resultados: longitud de la LCS (bit-paralelo), la LCS en tokens (Hirschberg)
+  y el substring común más largo en tokens (autómata de sufijos), mostrado con
+  el texto original gracias a los offsets de cada token.
+
+Uso: python lcs_tokens.py [--unit word|line] [--lower] [--limit 0] [--no-hirschberg]
+"""
+
+import argparse
+import os
+import re
+import time
+
+import numpy as np
+
+from lcs_seq import lcs_length_bits, lcs_hirschberg, visualize_one_line
+from lcs_seq_body import load_body
+from lcsubstr import longest_common_substring_sam
+
+WORD_RE = re.compile(r"\w+(?:['’]\w+)*")
+LINE_RE = re.compile(r"\S(?:[^\r\n]*\S)?")
+_SURROGATES = 0xD800
+_MAX_ID = 0x10FFFF - 0x800
+
+def tokenize(text: str, unit: str, lower: bool = False):
+    """Retorna (tokens, starts, ends): cada token con su rango en el texto."""
+    rx = WORD_RE if unit == "word" else LINE_RE
+    tokens, starts, ends = [], [], []
+    for mt in rx.finditer(text):
+        tok = mt.group()
+        tokens.append(tok.lower() if lower else tok)
+        starts.append(mt.start())
+        ends.append(mt.end())
+    return tokens, np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64)
+
+class Vocab:
+    """Token -> id int32, compartido entre los textos que se comparan."""
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.words: list[str] = []
+
+    def encode(self, tokens: list[str]) -> np.ndarray:
+        ids, words = self.ids, self.words
+        out = np.empty(len(tokens), dtype=np.int32)
+        for i, tok in enumerate(tokens):
+            t = ids.get(tok)
+            if t is None:
+                t = ids[tok] = len(words)
+                words.append(tok)
+            out[i] = t
+        return out
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+def ids_to_symbols(ids: np.ndarray) -> str:
+    """Arreglo de ids -> str con un code point por id (sin surrogates), para los motores de str."""
+    if ids.size and int(ids.max()) > _MAX_ID:
+        raise ValueError(f"vocabulario demasiado grande ({int(ids.max()) + 1:,} tokens)")
+    codes = ids.astype(np.uint32)
+    codes += (codes >= _SURROGATES) * np.uint32(0x800)
+    return codes.astype("<u4").tobytes().decode("utf-32-le")
+
+def symbols_to_ids(s: str) -> np.ndarray:
+    codes = np.frombuffer(s.encode("utf-32-le"), dtype="<u4").astype(np.int64)
+    codes -= (codes >= _SURROGATES + 0x800) * 0x800
+    return codes.astype(np.int32)
+
+def main():
+    ap = argparse.ArgumentParser(description="LCS / LCSubstr por palabras o líneas entre los dos primeros .txt de ./books")
+    ap.add_argument("--unit", choices=["word", "line"], default="word")
+    ap.add_argument("--lower", action="store_true", help="comparar palabras en minúsculas")
+    ap.add_argument("--limit", type=int, default=0, help="caracteres por archivo antes del strip (0 = todo)")
+    ap.add_argument("--no-hirschberg", action="store_true", help="sólo la longitud de la LCS")
+    args = ap.parse_args()
+
+    books_dir = os.path.join(os.getcwd(), "books")
+    if not os.path.isdir(books_dir):
+        print(f"No existe la carpeta 'books' en {os.getcwd()}")
+        return
+    txt = sorted([os.path.join(books_dir, f) for f in os.listdir(books_dir)
+                  if f.lower().endswith(".txt")])
+    if len(txt) < 2:
+        print("Debes tener al menos dos archivos .txt en 'books/'.")
+        return
+
+    b1, b2 = txt[:2]
+    unit_name = {"word": "palabras", "line": "líneas"}[args.unit]
+    print(f"=== LCS / LCSubstr por {unit_name} (ids int32 internados) ===")
+    print(f"Archivo 1: {b1}\nArchivo 2: {b2}")
+    print(f"Límite por archivo: {args.limit if args.limit > 0 else 'sin límite'} caracteres\n")
+
+    t0 = time.time()
+    body1, _ = load_body(b1, args.limit)
+    body2, _ = load_body(b2, args.limit)
+    load_t = time.time() - t0
+
+    t1 = time.time()
+    tok1, st1, en1 = tokenize(body1, args.unit, args.lower)
+    tok2, st2, en2 = tokenize(body2, args.unit, args.lower)
+    vocab = Vocab()
+    ids1, ids2 = vocab.encode(tok1), vocab.encode(tok2)
+    s1, s2 = ids_to_symbols(ids1), ids_to_symbols(ids2)
+    tok_t = time.time() - t1
+
+    n, m = len(ids1), len(ids2)
+    print(f"Cuerpos: {len(body1):,} y {len(body2):,} caracteres")
+    print(f"Tokens:  {n:,} y {m:,}  (vocabulario {len(vocab):,})  |  "
+          f"reducción {len(body1) / max(n, 1):.1f}x y {len(body2) / max(m, 1):.1f}x")
+    print(f"Celdas DP: {n * m:,} (por caracteres: {len(body1) * len(body2):,})\n")
+
+    t2 = time.time()
+    length = lcs_length_bits(s1, s2)
+    len_t = time.time() - t2
+
+    lcs_ids = None
+    if not args.no_hirschberg:
+        t3 = time.time()
+        lcs_ids = symbols_to_ids(lcs_hirschberg(s1, s2))
+        hb_t = time.time() - t3
+        assert len(lcs_ids) == length
+
+    t4 = time.time()
+    sub_len, _, end_i, end_j = longest_common_substring_sam(s1, s2)
+    sub_t = time.time() - t4
+
+    print(">>> RESULTADOS")
+    print(f"Longitud de la LCS: {length:,} {unit_name} "
+          f"({length / max(min(n, m), 1):.1%} del texto más corto)")
+    if lcs_ids is not None:
+        sep = " " if args.unit == "word" else " ⏎ "
+        lcs_text = sep.join(vocab.words[t] for t in lcs_ids.tolist())
+        print(f"LCS (vista abreviada): {visualize_one_line(lcs_text)}")
+    print(f"Substring común más largo: {sub_len:,} {unit_name}")
+    if sub_len > 0:
+        i0, j0 = end_i - sub_len + 1, end_j - sub_len + 1
+        span1 = body1[st1[i0]:en1[end_i]]
+        print(f"  S1 tokens {i0:,}..{end_i:,} (chars {st1[i0]:,}..{en1[end_i]:,})  |  "
+              f"S2 tokens {j0:,}..{end_j:,} (chars {st2[j0]:,}..{en2[end_j]:,})")
+        print(f"  Texto en S1: {visualize_one_line(span1)}")
+    print()
+
+    print(">>> Tiempos")
+    print(f"Carga/strip:          {load_t:.3f} s")
+    print(f"Tokens + internado:   {tok_t:.3f} s")
+    print(f"LCS (bit-paralelo):   {len_t:.3f} s")
+    if lcs_ids is not None:
+        print(f"LCS (Hirschberg):     {hb_t:.3f} s")
+    print(f"LCSubstr (autómata):  {sub_t:.3f} s")
+
+if __name__ == "__main__":
+    main()
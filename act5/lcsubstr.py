@@ -5,12 +5,28 @@
 Longest Common Substring (LCSubstr)
 Detecta los dos primeros archivos .txt en la carpeta ./books/
 y aplica la DP completa (n x m) sin optimización de memoria.
+
+--engine sam: autómata de sufijos del string más corto + recorrido lineal del
+otro. Tiempo O(n + m), memoria O(min(n, m)). Devuelve la misma tupla que la
+DP, con el mismo desempate (primer máximo en orden fila por fila: menor
+end_i y luego menor end_j), así que permite correr los libros completos.
+
+--engine np: la misma DP, pero con NumPy y sólo dos filas (memoria O(m)).
+Los textos se codifican a uint8 (uint16 si hay más de 256 símbolos). En la
+fila i sólo cambian las columnas j con s2[j] == s1[i]; se visitan con el
+arreglo de posiciones de ese símbolo (precalculado) y se limpian al rotar
+las filas. --selftest compara np y sam contra la DP.
 """
 
+import argparse
 import os
+import random
 import time
+import tracemalloc
 from array import array
 
+import numpy as np
+
 def load_text(path: str, limit: int | None) -> str:
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
         text = f.read()
@@ -58,9 +74,178 @@ def longest_common_substring(s1: str, s2: str) -> tuple[int, str, int, int]:
     substr = s1[end_i - maxlen + 1 : end_i + 1] if maxlen > 0 else ""
     return maxlen, substr, end_i, end_j
 
+def encode_pair(s1: str, s2: str) -> tuple[np.ndarray, np.ndarray]:
+    """Códigos densos compartidos: uint8 si caben, si no uint16/uint32."""
+    a = np.frombuffer(s1.encode("utf-32-le"), dtype=np.uint32)
+    b = np.frombuffer(s2.encode("utf-32-le"), dtype=np.uint32)
+    uniq, inv = np.unique(np.concatenate((a, b)), return_inverse=True)
+    dtype = np.uint8 if len(uniq) <= 256 else (np.uint16 if len(uniq) <= 65536 else np.uint32)
+    inv = inv.ravel().astype(dtype)
+    return inv[:len(a)], inv[len(a):]
+
+def longest_common_substring_np(s1: str, s2: str) -> tuple[int, str, int, int]:
+    """Igual que longest_common_substring, con dos filas de NumPy (memoria O(m))."""
+    n, m = len(s1), len(s2)
+    if n == 0 or m == 0:
+        return 0, "", -1, -1
+    c1, c2 = encode_pair(s1, s2)
+
+    # Posiciones de cada símbolo en s2, en orden creciente
+    ncodes = int(max(c1.max(), c2.max())) + 1
+    order = np.argsort(c2, kind="stable")
+    bounds = np.searchsorted(c2[order], np.arange(ncodes + 1))
+    positions = [order[bounds[c]:bounds[c + 1]] for c in range(ncodes)]
+
+    # prev[j + 1] = largo del sufijo común que termina en (i - 1, j); prev[0] = 0
+    prev = np.zeros(m + 1, dtype=np.int32)
+    cur = np.zeros(m + 1, dtype=np.int32)
+    prev_touched = order[:0]
+    maxlen = 0
+    end_i = end_j = -1
+    for i, c in enumerate(c1.tolist()):
+        pos = positions[c]
+        if pos.size:
+            vals = prev[pos] + 1
+            cur[pos + 1] = vals
+            k = int(vals.argmax())  # primer máximo -> menor j
+            if vals[k] > maxlen:
+                maxlen, end_i, end_j = int(vals[k]), i, int(pos[k])
+        # La fila vieja se limpia sólo donde se escribió y pasa a ser la nueva
+        prev[prev_touched + 1] = 0
+        prev, cur = cur, prev
+        prev_touched = pos
+
+    substr = s1[end_i - maxlen + 1 : end_i + 1] if maxlen > 0 else ""
+    return maxlen, substr, end_i, end_j
+
+def build_suffix_automaton(s: str):
+    """
+    Autómata de sufijos de s. Listas paralelas por estado:
+    nxt (dict de transiciones), link, length y firstpos (menor índice donde
+    termina algún string del estado; es el mismo para todos sus strings).
+    """
+    nxt = [{}]
+    link = array("i", [-1])
+    length = array("i", [0])
+    first = array("i", [-1])
+    last = 0
+    for i, c in enumerate(s):
+        cur = len(length)
+        nxt.append({})
+        link.append(0)
+        length.append(length[last] + 1)
+        first.append(i)
+        p = last
+        while p != -1 and c not in nxt[p]:
+            nxt[p][c] = cur
+            p = link[p]
+        if p != -1:
+            q = nxt[p][c]
+            if length[p] + 1 == length[q]:
+                link[cur] = q
+            else:
+                clone = len(length)
+                nxt.append(nxt[q].copy())
+                link.append(link[q])
+                length.append(length[p] + 1)
+                first.append(first[q])
+                while p != -1 and nxt[p].get(c) == q:
+                    nxt[p][c] = clone
+                    p = link[p]
+                link[q] = clone
+                link[cur] = clone
+        last = cur
+    return nxt, link, length, first
+
+def _scan_automaton(sam, t: str, prefer_first_state: bool) -> tuple[int, int, int]:
+    """
+    Recorre t sobre el autómata: en cada posición k, l = sufijo más largo de
+    t[:k+1] que aparece en el string del autómata (estado v).
+    Retorna (maxlen, firstpos del estado, k) con el desempate pedido:
+    prefer_first_state=True  -> a igual largo, menor firstpos y luego menor k
+    prefer_first_state=False -> a igual largo, menor k
+    """
+    nxt, link, length, first = sam
+    v = l = 0
+    best, best_pos, best_k = 0, -1, -1
+    for k, c in enumerate(t):
+        while v and c not in nxt[v]:
+            v = link[v]
+            l = length[v]
+        w = nxt[v].get(c)
+        if w is None:
+            continue  # v es la raíz y l == 0
+        v = w
+        l += 1
+        if l > best or (prefer_first_state and l == best and first[v] < best_pos):
+            best, best_pos, best_k = l, first[v], k
+    return best, best_pos, best_k
+
+def longest_common_substring_sam(s1: str, s2: str) -> tuple[int, str, int, int]:
+    """Igual que longest_common_substring (misma tupla y desempate) en tiempo lineal."""
+    n, m = len(s1), len(s2)
+    if n == 0 or m == 0:
+        return 0, "", -1, -1
+    if n <= m:
+        maxlen, end_i, end_j = _scan_automaton(build_suffix_automaton(s1), s2, True)
+    else:
+        maxlen, end_j, end_i = _scan_automaton(build_suffix_automaton(s2), s1, False)
+    if maxlen == 0:
+        return 0, "", -1, -1
+    return maxlen, s1[end_i - maxlen + 1 : end_i + 1], end_i, end_j
+
+ENGINES = {"dp": longest_common_substring, "sam": longest_common_substring_sam,
+           "np": longest_common_substring_np}
+
+def selftest(books: list[str], trials: int = 2000, book_chars: int = 2000) -> None:
+    """np y sam contra la DP: entradas aleatorias y prefijos de los libros."""
+    rng = random.Random(0)
+    for _ in range(trials):
+        alphabet = rng.choice(["a", "ab", "abc", "abcd", "ab\u00e9\u201c"])
+        s1 = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        s2 = "".join(rng.choice(alphabet + "x") for _ in range(rng.randint(0, 40)))
+        ref = longest_common_substring(s1, s2)
+        assert longest_common_substring_np(s1, s2) == ref, (s1, s2)
+        assert longest_common_substring_sam(s1, s2) == ref, (s1, s2)
+    print(f"Self-test OK: {trials} pares aleatorios (np y sam == DP)")
+
+    for a, b in zip(books, books[1:]):
+        s1, s2 = load_text(a, book_chars), load_text(b, book_chars)
+        ref = longest_common_substring(s1, s2)
+        assert longest_common_substring_np(s1, s2) == ref
+        assert longest_common_substring_sam(s1, s2) == ref
+        # Con más texto la DP es lenta: np contra sam
+        s1, s2 = load_text(a, 50000), load_text(b, 50000)
+        assert longest_common_substring_np(s1, s2) == longest_common_substring_sam(s1, s2)
+        print(f"Self-test OK: {os.path.basename(a)} vs {os.path.basename(b)} "
+              f"(DP a {book_chars:,} chars, np == sam a 50,000)")
+
+def run_engine(fn, s1: str, s2: str, trace_mem: bool):
+    """Ejecuta el motor y retorna (resultado, segundos, pico de memoria en bytes | None).
+    La memoria se mide en una segunda corrida con tracemalloc, para no distorsionar
+    el tiempo (en la DP completa no se mide: ya tiene su estimación)."""
+    t0 = time.time()
+    res = fn(s1, s2)
+    elapsed = time.time() - t0
+    peak = None
+    if trace_mem:
+        tracemalloc.start()
+        fn(s1, s2)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return res, elapsed, peak
+
 def main():
+    ap = argparse.ArgumentParser(description="Longest Common Substring entre los dos primeros .txt de ./books")
+    ap.add_argument("--engine", choices=sorted(ENGINES), default="dp",
+                    help="dp: tabla completa n x m; np: DP de dos filas con NumPy; "
+                         "sam: autómata de sufijos, lineal")
+    ap.add_argument("--limit", type=int, default=50000, help="caracteres por archivo (0 = todo)")
+    ap.add_argument("--selftest", action="store_true", help="verificar np y sam contra la DP")
+    args = ap.parse_args()
+
     books_dir = os.path.join(os.getcwd(), "books")
-    limit = 50000
+    limit = args.limit
 
     if not os.path.isdir(books_dir):
         print(f"No existe la carpeta 'books' en {os.getcwd()}")
@@ -74,12 +259,17 @@ def main():
         print("Debes tener al menos dos archivos .txt en la carpeta 'books/'.")
         return
 
+    if args.selftest:
+        selftest(txt_files)
+        return
+
     book1, book2 = txt_files[:2]
 
-    print("=== Longest Common Substring (DP completa) ===")
+    title = {"dp": "DP completa", "np": "DP de dos filas, NumPy", "sam": "autómata de sufijos"}[args.engine]
+    print(f"=== Longest Common Substring ({title}) ===")
     print(f"Archivo 1: {book1}")
     print(f"Archivo 2: {book2}")
-    print(f"Límite por archivo: {limit} caracteres\n")
+    print(f"Límite por archivo: {limit if limit > 0 else 'sin límite'} caracteres\n")
 
     t0 = time.time()
     s1 = load_text(book1, limit)
@@ -91,9 +281,8 @@ def main():
     print(f"Tamaño procesado: |S1| = {n:,}  |S2| = {m:,}")
     print(f"Memoria aprox. para DP: {human_bytes(approx_mem)}\n")
 
-    t1 = time.time()
-    maxlen, substr, end_i, end_j = longest_common_substring(s1, s2)
-    dp_time = time.time() - t1
+    (maxlen, substr, end_i, end_j), dp_time, peak = run_engine(ENGINES[args.engine], s1, s2,
+                                                           args.engine != "dp")
 
     if maxlen > 0:
         start_i = end_i - maxlen + 1
@@ -107,9 +296,14 @@ def main():
     print(f"Posición en S1: inicio {start_i}, fin {end_i}")
     print(f"Posición en S2: inicio {start_j}, fin {end_j}\n")
 
+    if peak is not None:
+        print(">>> Memoria")
+        print(f"Estimada DP completa: {human_bytes(approx_mem)}")
+        print(f"Pico medido ({args.engine}, tracemalloc): {human_bytes(peak)}\n")
+
     print(">>> Tiempos")
     print(f"Carga/recorte: {load_time:.3f} s")
-    print(f"DP (LCSubstr): {dp_time:.3f} s")
+    print(f"{args.engine.upper()} (LCSubstr): {dp_time:.3f} s")
 
 if __name__ == "__main__":
     main()
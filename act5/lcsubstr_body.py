@@ -4,104 +4,18 @@
 """
 LCSubstr (DP completa) entre dos .txt detectados automáticamente en ./books,
 eliminando el boilerplate de Project Gutenberg
+--engine sam usa el autómata de sufijos de lcsubstr.py (lineal, misma tupla y
+desempate que la DP) y permite comparar los cuerpos completos (--limit 0).
+--engine np usa la DP de dos filas con NumPy de lcsubstr.py (memoria O(m)).
 """
 
+import argparse
 import os
 import time
 from array import array
 
-def load_text(path: str, limit: int | None) -> str:
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        text = f.read()
-    if limit is not None and limit > 0:
-        text = text[:limit]
-    return text
-
-def strip_gutenberg_boilerplate(text: str) -> tuple[str, dict]:
-    """
-    Intenta remover encabezado y pie típicos de Project Gutenberg.
-    Devuelve (body, info) donde 'info' resume lo detectado para imprimir un reporte.
-
-    Estrategia:
-      - Buscar marcadores "*** START OF ..." y "*** END OF ..." (variantes comunes).
-      - Si no aparecen, intenta heurísticas suaves: cortar bloques de licencia largos con "Project Gutenberg".
-      - Si nada aplica, devuelve el texto original.
-    """
-    upper = text.upper()
-
-    start_markers = [
-        "*** START OF THIS PROJECT GUTENBERG EBOOK",
-        "***START OF THE PROJECT GUTENBERG EBOOK",
-        "*** START OF THE PROJECT GUTENBERG EBOOK",
-        "*** START OF THE PROJECT GUTENBERG EBOOK:",
-        "*** START OF THE PROJECT GUTENBERG",
-    ]
-    end_markers = [
-        "*** END OF THIS PROJECT GUTENBERG EBOOK",
-        "***END OF THE PROJECT GUTENBERG EBOOK",
-        "*** END OF THE PROJECT GUTENBERG EBOOK",
-        "*** END OF THE PROJECT GUTENBERG",
-    ]
-
-    lo = None
-    for s in start_markers:
-        k = upper.find(s)
-        if k != -1:
-            # Salta al final de línea donde está el marcador
-            nl = text.find("\n", k)
-            lo = (nl + 1) if nl != -1 else (k + len(s))
-            break
-
-    hi = None
-    for e in end_markers:
-        k = upper.find(e)
-        if k != -1:
-            # Corta desde el inicio de línea donde empieza el marcador
-            prev_nl = text.rfind("\n", 0, k)
-            hi = prev_nl if prev_nl != -1 else k
-            break
-
-    used_markers = (lo is not None) or (hi is not None)
-    n = len(text)
-
-    if lo is None:
-        lo = 0
-    if hi is None:
-        hi = n
-
-    # Heurística adicional: si no hubo marcadores pero hay un bloque de licencia largo al inicio
-    # con "Project Gutenberg", intenta recortar hasta la primera línea en blanco tras ese bloque.
-    used_heuristic = False
-    if not used_markers:
-        first_pg = upper.find("PROJECT GUTENBERG")
-        if 0 <= first_pg <= 5000:  # típico: aparece muy al inicio
-            # Busca un doble salto de línea (fin de bloque) después de esa mención
-            blk_end = text.find("\n\n", first_pg)
-            if blk_end != -1 and blk_end < n * 0.2:  # que no se coma demasiado
-                lo = blk_end + 2
-                used_heuristic = True
-
-        # Pie: a veces hay notas de licencia largas al final
-        last_pg = upper.rfind("PROJECT GUTENBERG")
-        if last_pg != -1 and last_pg >= n - 5000:
-            # Corta desde una línea antes de esa aparición
-            prev_nl = text.rfind("\n", 0, last_pg)
-            if prev_nl != -1 and prev_nl > lo:
-                hi = prev_nl
-
-    body = text[lo:hi].strip()
-    if not body:
-        body = text  # fallback seguro
-
-    info = {
-        "original_len": n,
-        "body_len": len(body),
-        "used_markers": used_markers,
-        "used_heuristic": used_heuristic,
-        "lo": lo,
-        "hi": hi,
-    }
-    return body, info
+from lcsubstr import longest_common_substring_np, longest_common_substring_sam, run_engine
+from lcs_seq_body import load_body
 
 def human_bytes(n: int) -> str:
     units = ["B", "KB", "MB", "GB", "TB"]
@@ -157,9 +71,20 @@ def visualize_one_line(sample: str, max_chars: int = 200) -> str:
         s = s[:max_chars] + "…"
     return s
 
+ENGINES = {"dp": longest_common_substring, "sam": longest_common_substring_sam,
+           "np": longest_common_substring_np}
+
 def main():
+    ap = argparse.ArgumentParser(description="LCSubstr sobre el cuerpo de los dos primeros .txt de ./books")
+    ap.add_argument("--engine", choices=sorted(ENGINES), default="dp",
+                    help="dp: tabla completa n x m; np: DP de dos filas con NumPy; "
+                         "sam: autómata de sufijos, lineal")
+    ap.add_argument("--limit", type=int, default=50000,
+                    help="caracteres por archivo (0 = todo); 50000 igual que el script original")
+    args = ap.parse_args()
+
     books_dir = os.path.join(os.getcwd(), "books")
-    limit = 50000  # igual que el script original, para comparar
+    limit = args.limit
 
     if not os.path.isdir(books_dir):
         print(f"No existe la carpeta 'books' en {os.getcwd()}")
@@ -174,17 +99,14 @@ def main():
 
     book1, book2 = txt_files[:2]
 
-    print("=== LCSubstr sobre el CUERPO del libro (boilerplate removido) ===")
+    print(f"=== LCSubstr sobre el CUERPO del libro (boilerplate removido, motor {args.engine}) ===")
     print(f"Archivo 1: {book1}")
     print(f"Archivo 2: {book2}")
-    print(f"Límite por archivo: {limit} caracteres\n")
+    print(f"Límite por archivo: {limit if limit > 0 else 'sin límite'} caracteres\n")
 
     t0 = time.time()
-    raw1 = load_text(book1, limit)
-    raw2 = load_text(book2, limit)
-
-    body1, info1 = strip_gutenberg_boilerplate(raw1)
-    body2, info2 = strip_gutenberg_boilerplate(raw2)
+    body1, info1 = load_body(book1, limit)
+    body2, info2 = load_body(book2, limit)
     load_time = time.time() - t0
 
     print(">>> Resumen de limpieza")
@@ -198,9 +120,8 @@ def main():
     print(f"Tamaño procesado tras strip: |S1| = {n:,}  |S2| = {m:,}")
     print(f"Memoria aprox. para DP: {human_bytes(approx_mem)}\n")
 
-    t1 = time.time()
-    maxlen, substr, end_i, end_j = longest_common_substring(body1, body2)
-    dp_time = time.time() - t1
+    (maxlen, substr, end_i, end_j), dp_time, peak = run_engine(ENGINES[args.engine], body1, body2,
+                                                               args.engine != "dp")
 
     if maxlen > 0:
         start_i = end_i - maxlen + 1
@@ -214,9 +135,14 @@ def main():
     print(f"Posición en S1 (post-strip): inicio {start_i}, fin {end_i}")
     print(f"Posición en S2 (post-strip): inicio {start_j}, fin {end_j}\n")
 
+    if peak is not None:
+        print(">>> Memoria")
+        print(f"Estimada DP completa: {human_bytes(approx_mem)}")
+        print(f"Pico medido ({args.engine}, tracemalloc): {human_bytes(peak)}\n")
+
     print(">>> Tiempos")
     print(f"Carga/strip: {load_time:.3f} s")
-    print(f"DP (LCSubstr): {dp_time:.3f} s")
+    print(f"{args.engine.upper()} (LCSubstr): {dp_time:.3f} s")
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,6 @@
 from queue import Queue
 from buildGraph import WeightedGraph
+from csrGraph import CSRGraph
 
 class TreeNode:
     def __init__(self,parent, v, c):
@@ -32,6 +33,15 @@ def bfs(graph: WeightedGraph, v0, vg):
     if vg not in graph.vertices():
         print("Warning: Vertex", vg, "is not in Graph")
 
+    if isinstance(graph, CSRGraph) and v0 in graph.index:
+        # CSR snapshot: search on int ids, labels only for the returned path
+        res = _bfs(graph.adjacent_ids, graph.index[v0], graph.index.get(vg))
+        if res is not None:
+            res["Path"] = [graph.labels[i] for i in res["Path"]]
+        return res
+    return _bfs(graph.adjacent_vertices, v0, vg)
+
+def _bfs(adjacent, v0, vg):
     frontier = Queue()
     frontier.put(TreeNode(None, v0, 0))
 
@@ -47,7 +57,7 @@ def bfs(graph: WeightedGraph, v0, vg):
             return {"Path": node.path(), "Cost": node.c}
         
         if node.v not in explored_set:
-            adjacent_vertices = graph.adjacent_vertices(node.v)
+            adjacent_vertices = adjacent(node.v)
             for vertex in adjacent_vertices:
                 neighbor = vertex[0]
                 weight = vertex[1]
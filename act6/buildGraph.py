@@ -29,10 +29,13 @@ class WeightedGraph:
                 for edge in self._adjacency_list[v]:
                     e.append((v, edge[0], edge[1]))
         else:
+                # Set of the edges already listed: O(1) instead of a scan of e
+                seen = set()
                 for v in self._adjacency_list:
                     for edge in self._adjacency_list[v]:
-                        if (edge[0], v, edge[1]) not in e:
+                        if (edge[0], v, edge[1]) not in seen:
                             e.append((v, edge[0], edge[1]))
+                            seen.add((v, edge[0], edge[1]))
         return e
     
     def add_vertex(self, v):        # Add vertex to the graph
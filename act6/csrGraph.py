@@ -0,0 +1,102 @@
+import numpy as np
+
+from buildGraph import WeightedGraph
+
+class CSRGraph:
+    """
+    Frozen snapshot of a WeightedGraph in CSR (compressed sparse row) form.
+    - labels[i] is the vertex with id i; index maps vertex -> id.
+    - The neighbors of id i are indices[indptr[i]:indptr[i+1]], with the
+      matching weights[indptr[i]:indptr[i+1]], in the same order as in the
+      original adjacency list (undirected edges are stored in both rows).
+    It has the same read-only interface used by bfs, dfs, uniform_cost and
+    dijkstra (vertices, adjacent_vertices, ...), so it can be passed to them
+    instead of the WeightedGraph. The searches detect a CSRGraph and walk it
+    on int ids through adjacent_ids(i), so nothing per vertex is kept besides
+    the arrays.
+    """
+
+    def __init__(self, labels, indptr, indices, weights, directed: bool = False):
+        self._directed = directed
+        self.labels = list(labels)
+        self.index = {v: i for i, v in enumerate(self.labels)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights)
+        for a in (self.indptr, self.indices, self.weights):
+            a.flags.writeable = False
+
+    @classmethod
+    def from_graph(cls, graph: WeightedGraph):
+        """Builds the snapshot in O(V + E)."""
+        labels = graph.vertices()
+        index = {v: i for i, v in enumerate(labels)}
+        adj = [graph.adjacent_vertices(v) for v in labels]
+        indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+        np.cumsum([len(a) for a in adj], out=indptr[1:])
+        total = int(indptr[-1])
+        indices = np.fromiter((index[u] for a in adj for u, _ in a), dtype=np.int32, count=total)
+        weights = np.array([w for a in adj for _, w in a])
+        return cls(labels, indptr, indices, weights, graph._directed)
+
+    def number_of_vertices(self):
+        return len(self.labels)
+
+    def number_of_edges(self):
+        # Undirected edges are stored twice
+        n = len(self.indices)
+        return n if self._directed else n // 2
+
+    def vertices(self):
+        """View of the vertices: iterable, with O(1) membership tests."""
+        return self.index.keys()
+
+    def edges(self):
+        """Same list as WeightedGraph.edges(): each undirected edge once, from its earlier vertex."""
+        src = np.repeat(np.arange(len(self.labels), dtype=np.int64), np.diff(self.indptr))
+        keep = slice(None) if self._directed else src <= self.indices
+        labels = self.labels
+        return [(labels[i], labels[j], w) for i, j, w in
+                zip(src[keep].tolist(), self.indices[keep].tolist(), self.weights[keep].tolist())]
+
+    def adjacent_vertices(self, v):
+        """
+        Adjacent vertices of a vertex.
+        param v: The vertex whose adjacent vertices are to be returned.
+        return: The list of (adjacent vertex, weight) of v.
+        """
+        i = self.index.get(v)
+        if i is None:
+            print("Warning: Vertex ", v, " does not exist.")
+            return []
+        labels = self.labels
+        return [(labels[j], w) for j, w in self.adjacent_ids(i)]
+
+    def adjacent_ids(self, i: int):
+        """(neighbor id, weight) pairs of the vertex with id i, as Python ints (built per call)."""
+        a, b = self.indptr[i:i + 2].tolist()
+        return zip(self.indices[a:b].tolist(), self.weights[a:b].tolist())
+
+    def neighbors(self, i: int):
+        """Neighbor ids and weights (array views) of the vertex with id i."""
+        a, b = self.indptr[i], self.indptr[i + 1]
+        return self.indices[a:b], self.weights[a:b]
+
+    def is_adjacent(self, v1, v2) -> bool:
+        if v1 not in self.index:
+            print("Warning: Vertex ", v1, " does not exist.")
+            return False
+        if v2 not in self.index:
+            print("Warning: Vertex ", v2, " does not exist.")
+            return False
+        ids, _ = self.neighbors(self.index[v1])
+        return bool((ids == self.index[v2]).any())
+
+    def nbytes(self) -> int:
+        """Bytes of the CSR arrays (without the label list and the index dict)."""
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+    def print_graph(self):
+        for v in self.labels:
+            for u, w in self.adjacent_vertices(v):
+                print(v, " -> ", u, " edge weight: ", w)
@@ -1,4 +1,5 @@
 from buildGraph import WeightedGraph
+from csrGraph import CSRGraph
 from queue import LifoQueue
 
 class TreeNode:
@@ -27,7 +28,15 @@ def dfs(graph: WeightedGraph, v0, vg):
     if vg not in graph.vertices():
         print("Warning: Vertex", vg, "is not in Graph")
 
-    
+    if isinstance(graph, CSRGraph) and v0 in graph.index:
+        # CSR snapshot: search on int ids, labels only for the returned path
+        res = _dfs(graph.adjacent_ids, graph.index[v0], graph.index.get(vg))
+        if res is not None:
+            res["Path"] = [graph.labels[i] for i in res["Path"]]
+        return res
+    return _dfs(graph.adjacent_vertices, v0, vg)
+
+def _dfs(adjacent, v0, vg):
     frontier = LifoQueue()
     frontier.put(TreeNode(None, v0, 0))
 
@@ -43,7 +52,7 @@ def dfs(graph: WeightedGraph, v0, vg):
             return {"Path": node.path(), "Cost": node.c}
         
         if node.v not in explored_set:
-            for neighbor, w in graph.adjacent_vertices(node.v):
+            for neighbor, w in adjacent(node.v):
                 frontier.put(TreeNode(node, neighbor, node.c + w))
 
             explored_set[node.v] = 1
\ No newline at end of file
@@ -1,5 +1,6 @@
 from queue import PriorityQueue
 from buildGraph import WeightedGraph
+from csrGraph import CSRGraph
 
 def dijkstra(graph: WeightedGraph, source):
     """
@@ -14,9 +15,19 @@ def dijkstra(graph: WeightedGraph, source):
     if source not in graph.vertices():
         print("Warning: Vertex", source, "is not in Graph")
 
+    if isinstance(graph, CSRGraph) and source in graph.index:
+        # CSR snapshot: search on int ids, labels only for the returned dicts
+        res = _dijkstra(graph.adjacent_ids, range(graph.number_of_vertices()), graph.index[source])
+        labels = graph.labels
+        return {"Distances": {labels[i]: d for i, d in res["Distances"].items()},
+                "Parents": {labels[i]: None if p is None else labels[p]
+                            for i, p in res["Parents"].items()}}
+    return _dijkstra(graph.adjacent_vertices, graph.vertices(), source)
+
+def _dijkstra(adjacent, vertices, source):
     dist = {}
     parent = {}
-    for v in graph.vertices():
+    for v in vertices:
         dist[v] = float("inf")
         parent[v] = None
     dist[source] = 0.0
@@ -34,7 +45,7 @@ def dijkstra(graph: WeightedGraph, source):
         if cur_cost > dist[u]:
             continue
 
-        for v, w in graph.adjacent_vertices(u):
+        for v, w in adjacent(u):
             new_cost = dist[u] + w
             if new_cost < dist[v]:
                 dist[v] = new_cost
@@ -1,6 +1,85 @@
 import numpy as np
 
-INF = 10**12 
+INF = 10**12
+
+def _initial_matrices(adj_matrix):
+    """
+    Distance matrix (0 off the diagonal -> INF) and next-hop matrix:
+    nxt[i][j] = first vertex after i on the best known i->j path, -1 if none.
+    """
+    A = np.array(adj_matrix, dtype=float)
+    n = A.shape[0]
+    no_edge = A == 0
+    np.fill_diagonal(no_edge, False)
+    A[no_edge] = INF
+    np.fill_diagonal(A, 0.0)
+
+    nxt = np.broadcast_to(np.arange(n, dtype=np.int32), (n, n)).copy()
+    nxt[no_edge] = -1
+    return A, nxt
+
+def _relax(A, nxt, rows, ks, buf, mask):
+    """
+    Floyd–Warshall steps k in ks applied to the rows A[rows] only:
+    A[i, :] = min(A[i, :], A[i, k] + A[k, :]), one whole block of rows per k.
+    Row k and column k do not change during step k, so the update is done in place.
+    """
+    T = A[rows]
+    N = nxt[rows] if nxt is not None else None
+    h = T.shape[0]
+    b, m = buf[:h], mask[:h]
+    for k in ks:
+        np.add(T[:, k, None], A[k], out=b)
+        if N is not None:
+            np.less(b, T, out=m)
+            np.copyto(N, N[:, k, None], where=m)
+        np.minimum(T, b, out=T)
+
+def floyd_warshall(adj_matrix, block: int = 0, with_next: bool = True):
+    """
+    Vectorized Floyd–Warshall. Same input convention as floyd_warshall_distance.
+    block = 0: one NumPy update of the whole n x n matrix per k.
+    block > 0: blocked (cache-friendly) variant. For each panel K of `block`
+      consecutive k values, the rows of K are relaxed first; then every strip of
+      `block` rows is relaxed over all k in K while it is still in cache, so the
+      matrix is streamed from memory once per panel instead of once per k.
+    Returns:
+      (dist, nxt): dist as in floyd_warshall_distance, and nxt (int32) with the
+      next hop of every shortest path (None if with_next is False).
+    """
+    A, nxt = _initial_matrices(adj_matrix)
+    if not with_next:
+        nxt = None
+    n = A.shape[0]
+    if n == 0:
+        return A, nxt
+
+    if block <= 0 or block >= n:
+        buf = np.empty_like(A)
+        mask = np.empty(A.shape, dtype=bool)
+        _relax(A, nxt, slice(0, n), range(n), buf, mask)
+        return A, nxt
+
+    buf = np.empty((block, n), dtype=A.dtype)
+    mask = np.empty((block, n), dtype=bool)
+    for k0 in range(0, n, block):
+        ks = range(k0, min(n, k0 + block))
+        # Panel rows first: every other strip reads A[k, :] for k in ks
+        _relax(A, nxt, slice(ks.start, ks.stop), ks, buf, mask)
+        for r0 in range(0, n, block):
+            if r0 != k0:
+                _relax(A, nxt, slice(r0, min(n, r0 + block)), ks, buf, mask)
+    return A, nxt
+
+def reconstruct_path(nxt, i: int, j: int):
+    """Vertex indices of the shortest i->j path from the next-hop matrix ([] if unreachable)."""
+    if nxt[i, j] < 0:
+        return []
+    path = [i]
+    while i != j:
+        i = int(nxt[i, j])
+        path.append(i)
+    return path
 
 def floyd_warshall_distance(adj_matrix):
     """
@@ -13,6 +92,10 @@ def floyd_warshall_distance(adj_matrix):
     Returns:
       dist: np.array with all-pairs shortest distances
     """
+    return floyd_warshall(adj_matrix, with_next=False)[0]
+
+def floyd_warshall_distance_loops(adj_matrix):
+    """Reference triple-loop version (the original implementation), for checks and benchmarks."""
     A = np.array(adj_matrix, dtype=float)
     n = A.shape[0]
 
@@ -34,4 +117,4 @@ def floyd_warshall_distance(adj_matrix):
                 if alt < A[i, j]:
                     A[i, j] = alt
 
-    return A
\ No newline at end of file
+    return A
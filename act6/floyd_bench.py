@@ -0,0 +1,73 @@
+import argparse
+import time
+
+import numpy as np
+
+from floyd import INF, floyd_warshall, floyd_warshall_distance_loops, reconstruct_path
+
+SIZES = [100, 250, 500, 1000, 2000, 4000]
+LOOPS_MAX_N = 100          # the triple loop already takes ~0.3 s at n = 100
+BLOCK = 64
+
+def random_adjacency(n: int, degree: int = 8, seed: int = 0):
+    """Random directed graph with ~degree out-edges per vertex, weights 1..100 (0 = no edge)."""
+    rng = np.random.default_rng(seed)
+    A = np.zeros((n, n), dtype=float)
+    rows = np.repeat(np.arange(n), degree)
+    cols = rng.integers(0, n, size=n * degree)
+    A[rows, cols] = rng.integers(1, 101, size=n * degree)
+    np.fill_diagonal(A, 0)
+    return A
+
+def check_paths(adj, dist, nxt, samples: int = 200, seed: int = 1):
+    """Every reconstructed path must use existing edges and add up to dist[i, j]."""
+    rng = np.random.default_rng(seed)
+    n = dist.shape[0]
+    for i, j in rng.integers(0, n, size=(samples, 2)).tolist():
+        path = reconstruct_path(nxt, i, j)
+        if dist[i, j] >= INF:
+            assert path == [], (i, j)
+            continue
+        cost = sum(adj[u, v] for u, v in zip(path, path[1:]))
+        assert path[0] == i and path[-1] == j and cost == dist[i, j], (i, j, path)
+
+def main():
+    ap = argparse.ArgumentParser(description="Floyd-Warshall benchmark: loops vs vectorized vs blocked")
+    ap.add_argument("--sizes", type=int, nargs="*", default=SIZES)
+    ap.add_argument("--block", type=int, default=BLOCK)
+    args = ap.parse_args()
+
+    print(f"{'n':>6} {'loops (s)':>10} {'vector (s)':>11} {'blocked (s)':>12} "
+          f"{'Gcell/s vec':>12} {'Gcell/s blk':>12} {'MB (dist+next)':>15}")
+    print("-" * 84)
+    for n in args.sizes:
+        adj = random_adjacency(n, seed=n)
+
+        loops_t = None
+        if n <= LOOPS_MAX_N:
+            t0 = time.perf_counter()
+            ref = floyd_warshall_distance_loops(adj)
+            loops_t = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        dist, nxt = floyd_warshall(adj)
+        vec_t = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        dist_b, nxt_b = floyd_warshall(adj, block=args.block)
+        blk_t = time.perf_counter() - t0
+
+        if loops_t is not None:
+            assert np.array_equal(dist, ref), "vectorized != loops"
+        assert np.array_equal(dist, dist_b), "blocked != vectorized"
+        check_paths(adj, dist, nxt)
+        check_paths(adj, dist_b, nxt_b)
+
+        cells = float(n) ** 3 / 1e9
+        loops_s = f"{loops_t:>10.3f}" if loops_t is not None else f"{'-':>10}"
+        print(f"{n:>6} {loops_s} {vec_t:>11.3f} {blk_t:>12.3f} "
+              f"{cells / vec_t:>12.2f} {cells / blk_t:>12.2f} {(dist.nbytes + nxt.nbytes) / 1e6:>15.1f}")
+        del dist, nxt, dist_b, nxt_b
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from buildGraph import WeightedGraph
+from csrGraph import CSRGraph
+from bfs import bfs
+from dfs import dfs
+from ucs import uniform_cost
+from dijkstra import dijkstra
+
+ISOLATED = "isolated"       # unreachable goal: every search traverses the whole component
+
+def random_graph(n: int, m: int, seed: int = 0) -> WeightedGraph:
+    """Undirected graph with n vertices + ISOLATED and m distinct edges, weights 1..100."""
+    rng = np.random.default_rng(seed)
+    keys = np.zeros(0, dtype=np.int64)
+    while len(keys) < m:
+        u = rng.integers(0, n, size=m)
+        v = rng.integers(0, n, size=m)
+        lo, hi = np.minimum(u, v), np.maximum(u, v)
+        keys = np.unique(np.concatenate((keys, (lo * n + hi)[lo != hi])))
+    keys = rng.permutation(keys)[:m]
+    weights = rng.integers(1, 101, size=m)
+
+    g = WeightedGraph(directed=False)
+    for v in range(n):
+        g.add_vertex(v)
+    g.add_vertex(ISOLATED)
+    for k, w in zip(keys.tolist(), weights.tolist()):
+        g.add_edge(k // n, k % n, w)
+    return g
+
+def measure(fn):
+    """(result, seconds, retained bytes, peak bytes); the memory is measured in a separate run."""
+    t0 = time.perf_counter()
+    res = fn()
+    elapsed = time.perf_counter() - t0
+    del res
+    tracemalloc.start()
+    res = fn()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return res, elapsed, size, peak
+
+def main():
+    ap = argparse.ArgumentParser(description="WeightedGraph vs CSRGraph: memory and traversal throughput")
+    ap.add_argument("--vertices", type=int, default=100_000)
+    ap.add_argument("--edges", type=int, default=1_000_000)
+    args = ap.parse_args()
+
+    print(f"Graph: {args.vertices:,} vertices, {args.edges:,} undirected edges\n")
+    g, build_t, g_size, g_peak = measure(lambda: random_graph(args.vertices, args.edges))
+    csr, csr_t, csr_size, csr_peak = measure(lambda: CSRGraph.from_graph(g))
+    assert csr.number_of_edges() == args.edges
+
+    t0 = time.perf_counter()
+    g_edges = g.edges()
+    edges_t = time.perf_counter() - t0
+    assert g_edges == csr.edges()
+
+    print(f"{'representation':<16} {'build (s)':>10} {'memory (MB)':>12} {'build peak (MB)':>16}")
+    print("-" * 57)
+    print(f"{'WeightedGraph':<16} {build_t:>10.3f} {g_size / 1e6:>12.1f} {g_peak / 1e6:>16.1f}")
+    print(f"{'CSRGraph':<16} {csr_t:>10.3f} {csr_size / 1e6:>12.1f} {csr_peak / 1e6:>16.1f}   "
+          f"(arrays {csr.nbytes() / 1e6:.1f} MB)")
+    print(f"WeightedGraph.edges(): {edges_t:.3f} s\n")
+
+    searches = [
+        ("bfs", lambda gr: bfs(gr, 0, ISOLATED)),
+        ("dfs", lambda gr: dfs(gr, 0, ISOLATED)),
+        ("ucs", lambda gr: uniform_cost(gr, 0, ISOLATED)),
+        ("dijkstra", lambda gr: dijkstra(gr, 0)["Distances"]),
+    ]
+    scanned = 2 * args.edges
+    print(f"{'search':<10} {'graph':<14} {'time (s)':>9} {'M edges/s':>10}")
+    print("-" * 46)
+    for name, run in searches:
+        results = []
+        for label, gr in (("WeightedGraph", g), ("CSRGraph", csr)):
+            t0 = time.perf_counter()
+            results.append(run(gr))
+            elapsed = time.perf_counter() - t0
+            print(f"{name:<10} {label:<14} {elapsed:>9.3f} {scanned / 1e6 / elapsed:>10.2f}")
+        assert results[0] == results[1], f"{name}: different results"
+
+    # Memory held by each representation after a traversal (bfs reads every row),
+    # so per-vertex caches built on demand would show up here
+    print(f"\n{'graph':<14} {'retained after bfs (MB)':>24} {'bfs peak (MB)':>14}")
+    print("-" * 54)
+    for label, gr in (("WeightedGraph", g), ("CSRGraph", csr)):
+        tracemalloc.start()
+        res = bfs(gr, 0, ISOLATED)
+        del res
+        size, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<14} {size / 1e6:>24.1f} {peak / 1e6:>14.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from bfs import bfs
 from dfs import dfs
 from ucs import uniform_cost
 from dijkstra import dijkstra
-from floyd import floyd_warshall_distance
+from floyd import floyd_warshall, reconstruct_path
 import numpy as np
 
 # --------------------------------------------------------------------
@@ -150,6 +150,16 @@ for (u, v, w) in graph.edges():  # devuelve cada arista una sola vez en no dirig
     adj_matrix[i][j] = w
     adj_matrix[j][i] = w  # simétrico
 
-dist_matrix = floyd_warshall_distance(adj_matrix)
+dist_matrix, next_hop = floyd_warshall(adj_matrix)
 print("\n----- Floyd–Warshall (Minimum Distances Matrix) -----")
 print(np.round(dist_matrix, 1))
+
+# Caminos desde Goding reconstruidos con la matriz de siguiente salto
+print(f"\nCaminos óptimos (Floyd–Warshall) desde {source}:")
+for target in sorted(nodes):
+    path = reconstruct_path(next_hop, idx[source], idx[target])
+    if not path:
+        print(f"  {source:10s} -> {target:10s} : INALCANZABLE")
+    else:
+        route = ' -> '.join(nodes[i] for i in path)
+        print(f"  {source:10s} -> {target:10s} : {route}  |  Costo = {dist_matrix[idx[source], idx[target]]}")
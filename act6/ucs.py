@@ -1,5 +1,6 @@
 from queue import PriorityQueue
 from buildGraph import WeightedGraph
+from csrGraph import CSRGraph
 
 class TreeNode:
     """
@@ -35,6 +36,15 @@ def uniform_cost(graph: WeightedGraph, v0, vg):
     if vg not in graph.vertices():
         print("Warning: Vertex", vg, "is not in Graph")
 
+    if isinstance(graph, CSRGraph) and v0 in graph.index:
+        # CSR snapshot: search on int ids, labels only for the returned path
+        res = _uniform_cost(graph.adjacent_ids, graph.index[v0], graph.index.get(vg))
+        if res is not None:
+            res["Path"] = [graph.labels[i] for i in res["Path"]]
+        return res
+    return _uniform_cost(graph.adjacent_vertices, v0, vg)
+
+def _uniform_cost(adjacent, v0, vg):
     frontier = PriorityQueue()
     tie = 0
     frontier.put((0, tie, TreeNode(None, v0, 0)))
@@ -53,7 +63,7 @@ def uniform_cost(graph: WeightedGraph, v0, vg):
         if node.v == vg:
             return {"Path": node.path(), "Cost": node.c}
         
-        for neighbor, w in graph.adjacent_vertices(node.v):
+        for neighbor, w in adjacent(node.v):
             new_cost = node.c + w
 
             if new_cost < best_cost.get(neighbor, float("inf")):